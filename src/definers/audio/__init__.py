@@ -18,7 +18,12 @@ from .dsp import (
 from .editing import change_audio_speed
 from .effects.exciter import apply_exciter
 from .effects.mixing import dj_mix, mix_audio, pad_audio, stereo
-from .features import extract_audio_features, features_to_audio, predict_audio
+from .features import (
+    extract_audio_features,
+    extract_audio_features_batch,
+    features_to_audio,
+    predict_audio,
+)
 from .feedback import get_audio_feedback, get_color_palette
 from .file_processing import normalize_audio_to_peak, stretch_audio
 from .filters import freq_cut
@@ -66,6 +71,8 @@ from .mastering.finalization import (
     resolve_final_true_peak_target,
 )
 from .mastering.loudness import (
+    LoudnessMeter,
+    LoudnessMeterReading,
     MasteringLoudnessMetrics,
     measure_low_end_mono_ratio,
     measure_mastering_loudness,
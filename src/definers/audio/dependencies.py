@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import importlib
+from functools import lru_cache
 
 
 def librosa_module():
@@ -20,3 +21,12 @@ def njit(*args, **kwargs):
             return function
 
         return decorator
+
+
+@lru_cache(maxsize=1)
+def numba_available() -> bool:
+    try:
+        importlib.import_module("numba")
+    except Exception:
+        return False
+    return True
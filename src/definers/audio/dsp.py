@@ -487,7 +487,15 @@ def limiter_smooth_env(
     return out
 
 
-def process_audio_chunks(fn, data, chunk_size, overlap=0):
+def process_audio_chunks(
+    fn,
+    data,
+    chunk_size,
+    overlap=0,
+    *,
+    loudness_meter=None,
+    on_loudness=None,
+):
 
     if overlap >= chunk_size:
         raise ValueError("Overlap must be smaller than chunk size")
@@ -500,10 +508,16 @@ def process_audio_chunks(fn, data, chunk_size, overlap=0):
     step = chunk_size - overlap
     final_result = np.zeros_like(data, dtype=np.float32)
     window_sum = np.zeros_like(data, dtype=np.float32)
-    window = np.hanning(chunk_size)
+    window = np.ones(chunk_size, dtype=np.float32)
+    if overlap > 0:
+        window[:overlap] = (
+            np.sin(0.5 * np.pi * (np.arange(overlap) + 0.5) / overlap) ** 2
+        )
+        window = np.minimum(window, window[::-1])
     window = window[np.newaxis, :]
 
     start = 0
+    metered_until = 0
     while start < audio_length:
         end = min(start + chunk_size, audio_length)
         current_chunk_size = end - start
@@ -512,6 +526,7 @@ def process_audio_chunks(fn, data, chunk_size, overlap=0):
             padding_size = chunk_size - current_chunk_size
             chunk = np.pad(chunk, ((0, 0), (0, padding_size)), "constant")
 
+        next_start = min(start + step, max(audio_length - chunk_size, 0))
         processed_chunk = fn(chunk)
         if processed_chunk.ndim == 1:
             processed_chunk = processed_chunk[np.newaxis, :]
@@ -520,11 +535,24 @@ def process_audio_chunks(fn, data, chunk_size, overlap=0):
             processed_chunk[:, :current_chunk_size]
             * window[:, :current_chunk_size]
         )
-        window_sum[:, start:end] += window[:, :current_chunk_size] ** 2
+        window_sum[:, start:end] += window[:, :current_chunk_size]
+
+        if loudness_meter is not None:
+            finalized_until = (
+                audio_length if end == audio_length else next_start
+            )
+            finalized_weights = window_sum[:, metered_until:finalized_until]
+            loudness_meter.push(
+                final_result[:, metered_until:finalized_until]
+                / np.where(finalized_weights == 0, 1.0, finalized_weights)
+            )
+            metered_until = finalized_until
+            if on_loudness is not None:
+                on_loudness(loudness_meter.reading())
 
         if end == audio_length:
             break
-        start += step
+        start = next_start
 
     window_sum[window_sum == 0] = 1.0
     final_result /= window_sum
@@ -10,6 +10,7 @@ from scipy.signal import butter, sosfiltfilt
 
 from ...file_ops import catch, log
 from ..dsp import remove_spectral_spikes, resample
+from ..envelopes import boxcar_mean
 from ..normalization import get_rms
 from .mixing import pad_audio
 
@@ -99,19 +100,7 @@ def _moving_average_last_axis(
     if bounded_window <= 1:
         return working
 
-    pad_left = bounded_window // 2
-    pad_right = bounded_window - 1 - pad_left
-    pad_width = [(0, 0)] * working.ndim
-    pad_width[-1] = (pad_left, pad_right)
-    padded = np.pad(working, pad_width, mode="edge")
-    cumulative = np.cumsum(padded, axis=-1, dtype=np.float64)
-    cumulative = np.concatenate(
-        [np.zeros_like(cumulative[..., :1]), cumulative], axis=-1
-    )
-    averaged = (
-        cumulative[..., bounded_window:] - cumulative[..., :-bounded_window]
-    ) / bounded_window
-    return np.asarray(averaged, dtype=working.dtype)
+    return boxcar_mean(working, bounded_window, padding="edge")
 
 
 def _spectral_summary(
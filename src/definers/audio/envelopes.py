@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from definers.runtime_numpy import get_numpy_module
+
+np = get_numpy_module()
+
+BOXCAR_PADDING_MODES = ("zero", "edge")
+
+
+def _prefix_sums(values: np.ndarray) -> np.ndarray:
+    cumulative = np.zeros(
+        values.shape[:-1] + (values.shape[-1] + 1,), dtype=np.float64
+    )
+    np.cumsum(values, axis=-1, dtype=np.float64, out=cumulative[..., 1:])
+    return cumulative
+
+
+def _zero_padded_boxcar(values: np.ndarray, window_size: int) -> np.ndarray:
+    sample_count = int(values.shape[-1])
+    positions = (min(sample_count, window_size) - 1) // 2 + np.arange(
+        max(sample_count, window_size)
+    )
+    upper = np.minimum(positions + 1, sample_count)
+    lower = np.clip(positions + 1 - window_size, 0, sample_count)
+    cumulative = _prefix_sums(values)
+    return (cumulative[..., upper] - cumulative[..., lower]) / window_size
+
+
+def _edge_padded_boxcar(values: np.ndarray, window_size: int) -> np.ndarray:
+    pad_left = window_size // 2
+    pad_width = [(0, 0)] * values.ndim
+    pad_width[-1] = (pad_left, window_size - 1 - pad_left)
+    cumulative = _prefix_sums(np.pad(values, pad_width, mode="edge"))
+    return (
+        cumulative[..., window_size:] - cumulative[..., :-window_size]
+    ) / window_size
+
+
+def boxcar_mean(
+    values: np.ndarray,
+    window_size: int,
+    *,
+    padding: str = "zero",
+) -> np.ndarray:
+    normalized_padding = str(padding).strip().lower()
+    if normalized_padding not in BOXCAR_PADDING_MODES:
+        raise ValueError(
+            f"Unsupported boxcar padding: {padding!r}; "
+            f"expected one of {', '.join(BOXCAR_PADDING_MODES)}"
+        )
+    array = np.asarray(values)
+    if not np.issubdtype(array.dtype, np.floating):
+        array = array.astype(np.float32)
+    resolved_window = max(int(window_size), 1)
+    if array.ndim == 0 or array.shape[-1] == 0 or resolved_window == 1:
+        return np.array(array, copy=True)
+    if normalized_padding == "edge":
+        averaged = _edge_padded_boxcar(array, resolved_window)
+    else:
+        averaged = _zero_padded_boxcar(array, resolved_window)
+    return averaged.astype(array.dtype, copy=False)
+
+
+__all__ = [
+    "BOXCAR_PADDING_MODES",
+    "boxcar_mean",
+]
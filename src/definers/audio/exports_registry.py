@@ -42,6 +42,7 @@ AUDIO_EXPORTS = {
     **_module_exports(
         "features",
         "extract_audio_features",
+        "extract_audio_features_batch",
         "features_to_audio",
         "predict_audio",
     ),
@@ -96,6 +97,8 @@ AUDIO_EXPORTS = {
     ),
     **_module_exports(
         "mastering.loudness",
+        "LoudnessMeter",
+        "LoudnessMeterReading",
         "MasteringLoudnessMetrics",
         "measure_low_end_mono_ratio",
         "measure_mastering_loudness",
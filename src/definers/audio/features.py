@@ -28,45 +28,116 @@ def _load_model_introspection_backend():
     return importlib.import_module("definers.ml.introspection")
 
 
-def extract_audio_features(
-    file_path: str, n_mfcc: int = 20
-) -> np.ndarray | None:
+_FEATURE_N_FFT = 2048
+_FEATURE_HOP_LENGTH = 512
+_FEATURE_N_MELS = 80
+
+
+def _spectral_feature_vector(
+    librosa_backend, y, sr: int, magnitude, n_mfcc: int
+) -> np.ndarray:
+    power = magnitude**2
+    mel_spectrogram = librosa_backend.feature.melspectrogram(
+        S=power, sr=sr, n_mels=_FEATURE_N_MELS
+    )
+    mfccs = librosa_backend.feature.mfcc(
+        S=librosa_backend.power_to_db(mel_spectrogram), n_mfcc=n_mfcc
+    ).flatten()
+    spectral_centroid = librosa_backend.feature.spectral_centroid(
+        S=magnitude, sr=sr
+    ).flatten()
+    spectral_bandwidth = librosa_backend.feature.spectral_bandwidth(
+        S=magnitude, sr=sr
+    ).flatten()
+    spectral_rolloff = librosa_backend.feature.spectral_rolloff(
+        S=magnitude, sr=sr
+    ).flatten()
+    spectral_features = np.concatenate(
+        (spectral_centroid, spectral_bandwidth, spectral_rolloff)
+    )
+    zero_crossing_rate = librosa_backend.feature.zero_crossing_rate(
+        y=y
+    ).flatten()
+    chroma = librosa_backend.feature.chroma_stft(S=power, sr=sr).flatten()
+    return np.concatenate(
+        (mfccs, spectral_features, zero_crossing_rate, chroma)
+    ).astype(np.float32)
+
+
+def extract_signal_features(
+    signals, sr: int, n_mfcc: int = 20
+) -> list[np.ndarray | None]:
     librosa_backend = _load_librosa_backend()
+    samples = [np.asarray(signal) for signal in signals]
+    features: list[np.ndarray | None] = [None] * len(samples)
+    groups: dict[int, list[int]] = {}
+    for index, signal in enumerate(samples):
+        groups.setdefault(int(signal.shape[-1]), []).append(index)
+    for indices in groups.values():
+        try:
+            magnitudes = np.abs(
+                librosa_backend.stft(
+                    np.stack([samples[index] for index in indices]),
+                    n_fft=_FEATURE_N_FFT,
+                    hop_length=_FEATURE_HOP_LENGTH,
+                )
+            )
+        except Exception:
+            _logger.exception("Failed to compute feature spectrogram")
+            continue
+        for position, index in enumerate(indices):
+            try:
+                features[index] = _spectral_feature_vector(
+                    librosa_backend,
+                    samples[index],
+                    sr,
+                    magnitudes[position],
+                    n_mfcc,
+                )
+            except Exception:
+                _logger.exception("Failed to extract audio features")
+    return features
+
+
+def _load_feature_audio(librosa_backend, file_path: str):
     try:
-        (y, sr) = librosa_backend.load(file_path, sr=None)
+        return librosa_backend.load(file_path, sr=None)
     except Exception:
         _logger.exception(
             "Failed to load audio for feature extraction: %s", file_path
         )
         return None
 
-    try:
-        mfccs = librosa_backend.feature.mfcc(
-            y=y, sr=sr, n_mfcc=n_mfcc, n_fft=2048, n_mels=80
-        ).flatten()
-        spectral_centroid = librosa_backend.feature.spectral_centroid(
-            y=y, sr=sr
-        ).flatten()
-        spectral_bandwidth = librosa_backend.feature.spectral_bandwidth(
-            y=y, sr=sr
-        ).flatten()
-        spectral_rolloff = librosa_backend.feature.spectral_rolloff(
-            y=y, sr=sr
-        ).flatten()
-        spectral_features = np.concatenate(
-            (spectral_centroid, spectral_bandwidth, spectral_rolloff)
+
+def extract_audio_features_batch(
+    file_paths, n_mfcc: int = 20
+) -> list[np.ndarray | None]:
+    librosa_backend = _load_librosa_backend()
+    paths = list(file_paths)
+    features: list[np.ndarray | None] = [None] * len(paths)
+    signals_by_rate: dict[int, list[tuple[int, np.ndarray]]] = {}
+    for index, file_path in enumerate(paths):
+        loaded = _load_feature_audio(librosa_backend, file_path)
+        if loaded is not None:
+            (y, sr) = loaded
+            signals_by_rate.setdefault(int(sr), []).append((index, y))
+    for sr, entries in signals_by_rate.items():
+        extracted = extract_signal_features(
+            [y for _index, y in entries], sr, n_mfcc
         )
-        zero_crossing_rate = librosa_backend.feature.zero_crossing_rate(
-            y=y
-        ).flatten()
-        chroma = librosa_backend.feature.chroma_stft(y=y, sr=sr).flatten()
-        all_features = np.concatenate(
-            (mfccs, spectral_features, zero_crossing_rate, chroma)
-        ).astype(np.float32)
-        return all_features
-    except Exception:
-        _logger.exception("Failed to extract audio features")
+        for (index, _y), vector in zip(entries, extracted):
+            features[index] = vector
+    return features
+
+
+def extract_audio_features(
+    file_path: str, n_mfcc: int = 20
+) -> np.ndarray | None:
+    loaded = _load_feature_audio(_load_librosa_backend(), file_path)
+    if loaded is None:
         return None
+    (y, sr) = loaded
+    return extract_signal_features([y], sr, n_mfcc)[0]
 
 
 def features_to_audio(
@@ -212,12 +283,34 @@ def predict_audio(model, audio_file):
         predicted_audio = np.zeros_like(audio_data)
         if not timeline:
             _logger.info("Silent timeline: no active audio segments found.")
-        for i, (start_time, end_time) in enumerate(timeline):
-            start_sample = int(start_time * sr)
-            end_sample = int(end_time * sr)
-            start_sample = max(0, start_sample)
-            end_sample = min(len(audio_data), end_sample)
-            active_audio_part_np = audio_data[start_sample:end_sample]
+        segments = []
+        for start_time, end_time in timeline:
+            start_sample = max(0, int(start_time * sr))
+            end_sample = min(len(audio_data), int(end_time * sr))
+            segments.append(
+                (
+                    start_time,
+                    end_time,
+                    start_sample,
+                    end_sample,
+                    audio_data[start_sample:end_sample],
+                )
+            )
+        active_segments = [
+            segment[-1] for segment in segments if segment[-1].size > 0
+        ]
+        segment_features = iter(
+            extract_signal_features(active_segments, sr)
+            if active_segments
+            else []
+        )
+        for i, (
+            start_time,
+            end_time,
+            start_sample,
+            end_sample,
+            active_audio_part_np,
+        ) in enumerate(segments):
             if active_audio_part_np.size == 0:
                 _logger.info(
                     "Segment skipped: empty audio segment from %.2fs to %.2fs",
@@ -225,8 +318,15 @@ def predict_audio(model, audio_file):
                     end_time,
                 )
                 continue
+            active_audio_features = next(segment_features)
+            if active_audio_features is None:
+                _logger.warning(
+                    "Failed to extract features for segment %d. Skipping.",
+                    i + 1,
+                )
+                continue
             active_audio_part_model_input = array_backend.numpy_to_cupy(
-                active_audio_part_np
+                active_audio_features
             )
             _logger.info(
                 "Predicting segment %d/%d with shape %s",
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from collections.abc import Callable
 from typing import Any
 
@@ -9,7 +10,10 @@ np = get_numpy_module()
 
 
 def _moving_average_last_axis(
-    values: np.ndarray, window_size: int
+    values: np.ndarray,
+    window_size: int,
+    *,
+    boxcar_fn: Callable[[np.ndarray, int], np.ndarray] | None = None,
 ) -> np.ndarray:
     array = np.asarray(values, dtype=np.float32)
     if array.size == 0:
@@ -18,6 +22,8 @@ def _moving_average_last_axis(
     safe_window = min(max(int(window_size), 1), int(array.shape[-1]))
     if safe_window <= 1:
         return np.array(array, copy=True)
+    if boxcar_fn is not None:
+        return np.asarray(boxcar_fn(array, safe_window), dtype=np.float32)
 
     kernel = np.ones(safe_window, dtype=np.float32) / float(safe_window)
     return np.apply_along_axis(
@@ -40,11 +46,19 @@ def _band_correlation(
     left_band: np.ndarray,
     right_band: np.ndarray,
     window_size: int,
+    *,
+    boxcar_fn: Callable[[np.ndarray, int], np.ndarray] | None = None,
 ) -> np.ndarray:
-    left_energy = _moving_average_last_axis(np.square(left_band), window_size)
-    right_energy = _moving_average_last_axis(np.square(right_band), window_size)
-    cross_energy = _moving_average_last_axis(
-        left_band * right_band, window_size
+    left_energy, right_energy, cross_energy = _moving_average_last_axis(
+        np.stack(
+            [
+                np.square(left_band),
+                np.square(right_band),
+                left_band * right_band,
+            ]
+        ),
+        window_size,
+        boxcar_fn=boxcar_fn,
     )
     denominator = np.maximum(np.sqrt(left_energy * right_energy), 1e-6)
     return np.clip(cross_energy / denominator, -1.0, 1.0)
@@ -165,6 +179,7 @@ def _apply_stereo_tonal_variation(
     y: np.ndarray,
     *,
     signal_module: Any,
+    boxcar_fn: Callable[[np.ndarray, int], np.ndarray] | None = None,
 ) -> np.ndarray:
     setattr(self, "last_stereo_motion_activity", 0.0)
     setattr(self, "last_stereo_motion_correlation_guard", 1.0)
@@ -207,9 +222,10 @@ def _apply_stereo_tonal_variation(
 
     left = signal[0]
     right = signal[1]
-    energy_left = _moving_average_last_axis(np.square(left), smoothing_samples)
-    energy_right = _moving_average_last_axis(
-        np.square(right), smoothing_samples
+    energy_left, energy_right = _moving_average_last_axis(
+        np.square(signal[:2]),
+        smoothing_samples,
+        boxcar_fn=boxcar_fn,
     )
     balance = (energy_left - energy_right) / np.maximum(
         energy_left + energy_right, 1e-6
@@ -222,6 +238,7 @@ def _apply_stereo_tonal_variation(
     balance_velocity = _moving_average_last_axis(
         balance_velocity,
         max(smoothing_samples // 5, 3),
+        boxcar_fn=boxcar_fn,
     )
     motion = np.clip(balance * 0.72 + balance_velocity * 10.0, -1.0, 1.0)
 
@@ -266,10 +283,16 @@ def _apply_stereo_tonal_variation(
     )
 
     mid_corr = _band_correlation(
-        left_mid, right_mid, max(smoothing_samples // 3, 3)
+        left_mid,
+        right_mid,
+        max(smoothing_samples // 3, 3),
+        boxcar_fn=boxcar_fn,
     )
     high_corr = _band_correlation(
-        left_high, right_high, max(smoothing_samples // 4, 3)
+        left_high,
+        right_high,
+        max(smoothing_samples // 4, 3),
+        boxcar_fn=boxcar_fn,
     )
     mid_guard = np.clip(
         1.0 - np.maximum(-mid_corr, 0.0) * 0.55 * correlation_guard_strength,
@@ -504,6 +527,7 @@ def apply_true_peak_limiter(
     maximum_filter1d_fn: Callable[..., np.ndarray],
     uniform_filter1d_fn: Callable[..., np.ndarray],
     limiter_smooth_env_fn: Callable[..., np.ndarray],
+    oversampling_plan_fn: Callable[..., Any] | None = None,
 ) -> np.ndarray:
     input_dtype = y.dtype if np.issubdtype(y.dtype, np.floating) else np.float32
     y_in = np.asarray(y, dtype=np.float32)
@@ -513,7 +537,15 @@ def apply_true_peak_limiter(
     limit_lin = 10.0 ** (ceil_db / 20.0)
 
     sr_os = self.resampling_target * os_factor
-    y_os = signal_module.resample_poly(y_in, os_factor, 1, axis=-1)
+    if oversampling_plan_fn is None:
+        y_os = signal_module.resample_poly(y_in, os_factor, 1, axis=-1)
+    else:
+        oversampling_plan = oversampling_plan_fn(
+            self.resampling_target,
+            os_factor,
+            signal_module=signal_module,
+        )
+        y_os = oversampling_plan.upsample(y_in)
     y_driven = y_os * drive_lin
 
     lookahead_samp = max(0, int(round(lookahead_ms * sr_os / 1000.0)))
@@ -554,7 +586,10 @@ def apply_true_peak_limiter(
     gain[mask] = limit_lin / control_smooth[mask]
 
     y_limited = np.clip(y_driven * gain, -limit_lin, limit_lin)
-    y_down = signal_module.resample_poly(y_limited, 1, os_factor, axis=-1)
+    if oversampling_plan_fn is None:
+        y_down = signal_module.resample_poly(y_limited, 1, os_factor, axis=-1)
+    else:
+        y_down = oversampling_plan.downsample(y_limited)
     output = y_down[..., :orig_len]
     output = np.nan_to_num(output, nan=0.0, posinf=0.0, neginf=0.0)
 
@@ -578,6 +613,7 @@ def apply_limiter(
     maximum_filter1d_fn: Callable[..., np.ndarray],
     uniform_filter1d_fn: Callable[..., np.ndarray],
     limiter_smooth_env_fn: Callable[..., np.ndarray],
+    oversampling_plan_fn: Callable[..., Any] | None = None,
 ) -> np.ndarray:
     limited = apply_true_peak_limiter(
         self,
@@ -594,6 +630,7 @@ def apply_limiter(
         maximum_filter1d_fn=maximum_filter1d_fn,
         uniform_filter1d_fn=uniform_filter1d_fn,
         limiter_smooth_env_fn=limiter_smooth_env_fn,
+        oversampling_plan_fn=oversampling_plan_fn,
     )
     clipped = apply_soft_clip_stage(
         limited,
@@ -608,6 +645,7 @@ def apply_spatial_enhancement(
     y: np.ndarray,
     *,
     signal_module: Any,
+    boxcar_fn: Callable[[np.ndarray, int], np.ndarray] | None = None,
 ) -> np.ndarray:
     if y.ndim < 2 or y.shape[0] != 2:
         return y
@@ -644,11 +682,89 @@ def apply_spatial_enhancement(
         self,
         widened,
         signal_module=signal_module,
+        boxcar_fn=boxcar_fn,
     )
 
     return np.nan_to_num(widened, nan=0.0, posinf=0.0, neginf=0.0)
 
 
+class CrossoverBank:
+    __slots__ = ("sample_rate", "crossover_hz", "signal_module", "sections")
+
+    def __init__(
+        self,
+        sample_rate: float,
+        crossover_hz: tuple[float, ...],
+        *,
+        signal_module: Any,
+    ) -> None:
+        self.sample_rate = float(sample_rate)
+        self.crossover_hz = tuple(float(fc) for fc in crossover_hz)
+        self.signal_module = signal_module
+        nyquist_hz = self.sample_rate / 2.0
+        self.sections = tuple(
+            (
+                signal_module.butter(
+                    2, fc / nyquist_hz, btype="low", output="sos"
+                ),
+                signal_module.butter(
+                    2, fc / nyquist_hz, btype="high", output="sos"
+                ),
+            )
+            for fc in self.crossover_hz
+        )
+
+    def split(self, x: np.ndarray) -> list[tuple[np.ndarray, bool]]:
+        bands: list[tuple[np.ndarray, bool]] = []
+        current = x
+        current_owned = False
+        for sos_low, sos_high in self.sections:
+            if current.shape[-1] <= 9:
+                bands.append((current, False))
+                continue
+            bands.append(
+                (
+                    self.signal_module.sosfiltfilt(sos_low, current, axis=-1),
+                    True,
+                )
+            )
+            current = self.signal_module.sosfiltfilt(sos_high, current, axis=-1)
+            current_owned = True
+        bands.append((current, current_owned))
+        return bands
+
+
+_CROSSOVER_BANK_CACHE_LIMIT = 16
+_CROSSOVER_BANKS: dict[tuple[object, ...], CrossoverBank] = {}
+_CROSSOVER_BANKS_LOCK = threading.Lock()
+
+
+def get_crossover_bank(
+    sample_rate: float,
+    crossover_hz: tuple[float, ...],
+    *,
+    signal_module: Any,
+) -> CrossoverBank:
+    key = (
+        float(sample_rate),
+        tuple(float(fc) for fc in crossover_hz),
+        id(signal_module),
+        signal_module.butter,
+    )
+    with _CROSSOVER_BANKS_LOCK:
+        bank = _CROSSOVER_BANKS.pop(key, None)
+        if bank is None or bank.signal_module is not signal_module:
+            bank = CrossoverBank(
+                sample_rate,
+                crossover_hz,
+                signal_module=signal_module,
+            )
+        _CROSSOVER_BANKS[key] = bank
+        while len(_CROSSOVER_BANKS) > _CROSSOVER_BANK_CACHE_LIMIT:
+            _CROSSOVER_BANKS.pop(next(iter(_CROSSOVER_BANKS)))
+        return bank
+
+
 def multiband_compress(
     self,
     y: np.ndarray,
@@ -656,22 +772,9 @@ def multiband_compress(
     signal_module: Any,
     decoupled_envelope_fn: Callable[..., np.ndarray],
 ) -> np.ndarray:
-    def lr4(x: np.ndarray, fc: float) -> tuple[np.ndarray, np.ndarray]:
-        if x.shape[-1] <= 9:
-            return x, x
-
-        sr2 = self.resampling_target / 2.0
-        sos_l = signal_module.butter(2, fc / sr2, btype="low", output="sos")
-        sos_h = signal_module.butter(2, fc / sr2, btype="high", output="sos")
-
-        lp = signal_module.sosfiltfilt(sos_l, x, axis=-1)
-        hp = signal_module.sosfiltfilt(sos_h, x, axis=-1)
-
-        return lp, hp
-
     def compress(
         x: np.ndarray,
-        control: np.ndarray | None,
+        owned: bool,
         threshold_db: float,
         ratio: float,
         attack_ms: float,
@@ -686,9 +789,12 @@ def multiband_compress(
             -1.0 / (self.resampling_target * release_ms / 1000.0 + 1e-9)
         )
         mk = 10.0 ** (makeup_db / 20.0)
-        env_source = np.abs(control) if control is not None else np.abs(x)
+        env_source = np.abs(x)
+        if x.ndim > 1:
+            env_source = np.max(env_source, axis=0)
+        env_source += 1e-12
         env = decoupled_envelope_fn(
-            20.0 * np.log10(env_source + 1e-12),
+            20.0 * np.log10(env_source),
             ac,
             rc,
         )
@@ -702,19 +808,11 @@ def multiband_compress(
 
         gain_lin = 10.0 ** (gain / 20.0) * mk
         if x.ndim > 1:
-            return x * gain_lin[np.newaxis, :]
-
+            gain_lin = gain_lin[np.newaxis, :]
+        if owned and np.result_type(x, gain_lin) == x.dtype:
+            return np.multiply(x, gain_lin, out=x)
         return x * gain_lin
 
-    def split_bands(ch: np.ndarray, fcs: list[float]) -> list[np.ndarray]:
-        bands: list[np.ndarray] = []
-        current = ch
-        for fc in fcs[:-1]:
-            lo, current = lr4(current, fc)
-            bands.append(lo)
-        bands.append(current)
-        return bands
-
     sorted_bands = [
         band
         for band in sorted(self.bands, key=lambda band: band["fc"])
@@ -723,54 +821,33 @@ def multiband_compress(
     if not sorted_bands:
         return y
 
-    fcs_sorted = [band["fc"] for band in sorted_bands]
-
-    if y.ndim > 1:
-        channel_parts = [split_bands(channel, fcs_sorted) for channel in y]
-        if any(len(parts) != len(sorted_bands) for parts in channel_parts):
-            raise ValueError("Band split mismatch")
-
-        comps: list[np.ndarray] = []
-        for band_index, band_cfg in enumerate(sorted_bands):
-            band_stack = np.stack(
-                [parts[band_index] for parts in channel_parts],
-                axis=0,
-            )
-            thr = band_cfg["base_threshold"] + band_cfg["makeup_db"]
-            control = np.max(np.abs(band_stack), axis=0)
-            comps.append(
-                compress(
-                    band_stack,
-                    control,
-                    thr,
-                    band_cfg["ratio"],
-                    band_cfg["attack_ms"],
-                    band_cfg["release_ms"],
-                    band_cfg["makeup_db"],
-                    knee_db=band_cfg["knee_db"],
-                )
-            )
-
-        return np.sum(comps, axis=0)
-
-    signal_parts = split_bands(y, fcs_sorted)
-    if len(signal_parts) != len(sorted_bands):
+    crossover_bank = get_crossover_bank(
+        self.resampling_target,
+        tuple(band["fc"] for band in sorted_bands[:-1]),
+        signal_module=signal_module,
+    )
+    band_signals = crossover_bank.split(y)
+    if len(band_signals) != len(sorted_bands):
         raise ValueError("Band split mismatch")
 
-    comps: list[np.ndarray] = []
-    for band_cfg, sig in zip(sorted_bands, signal_parts, strict=True):
-        thr = band_cfg["base_threshold"] + band_cfg["makeup_db"]
-        comps.append(
-            compress(
-                sig,
-                None,
-                thr,
-                band_cfg["ratio"],
-                band_cfg["attack_ms"],
-                band_cfg["release_ms"],
-                band_cfg["makeup_db"],
-                knee_db=band_cfg["knee_db"],
-            )
+    mixed: np.ndarray | None = None
+    for band_cfg, (band_signal, owned) in zip(
+        sorted_bands, band_signals, strict=True
+    ):
+        compressed = compress(
+            band_signal,
+            owned,
+            band_cfg["base_threshold"] + band_cfg["makeup_db"],
+            band_cfg["ratio"],
+            band_cfg["attack_ms"],
+            band_cfg["release_ms"],
+            band_cfg["makeup_db"],
+            knee_db=band_cfg["knee_db"],
         )
-
-    return np.sum(comps, axis=0)
+        if mixed is None:
+            mixed = compressed
+        elif np.result_type(mixed, compressed) == mixed.dtype:
+            mixed += compressed
+        else:
+            mixed = mixed + compressed
+    return mixed
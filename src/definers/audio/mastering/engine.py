@@ -16,6 +16,7 @@ from ..config import SmartMasteringConfig
 from ..dsp import decoupled_envelope, limiter_smooth_env, resample
 from ..effects.exciter import apply_exciter
 from ..effects.mixing import stereo
+from ..envelopes import boxcar_mean
 from ..filters import freq_cut
 from ..normalization import get_lufs
 from .analysis import measure_spectrum as _measure_spectrum
@@ -67,7 +68,15 @@ from .metrics import (
     MasteringReport,
     write_mastering_report as _write_mastering_report,
 )
-from .pipeline import process as _process, process_stem as _process_stem
+from .oversampling import get_oversampling_plan, oversampling_memo
+from .pipeline import (
+    DEFAULT_CHUNK_OVERLAP_SECONDS,
+    DEFAULT_CHUNK_SECONDS,
+    process as _process,
+    process_chunked as _process_chunked,
+    process_stem as _process_stem,
+    render_in_windows as _render_in_windows,
+)
 from .profile import (
     build_spectral_balance_profile as _build_spectral_balance_profile,
     build_target_curve as _build_target_curve,
@@ -82,6 +91,10 @@ from .reference import (
     analyze_reference as _analyze_reference,
     reference_match_assist as _reference_match_assist,
 )
+from .snapshots import (
+    DEFAULT_STAGE_SNAPSHOT_MEMORY_BUDGET_MB,
+    resolve_stage_snapshot_mode,
+)
 from .state import configure_runtime_state
 
 
@@ -153,6 +166,16 @@ class SmartMastering:
             )
         )
         stem_cleanup_provenance = config.pop("stem_cleanup_provenance", None)
+        stage_snapshots = config.pop("stage_snapshots", "auto")
+        stage_snapshot_memory_budget_mb = config.pop(
+            "stage_snapshot_memory_budget_mb",
+            DEFAULT_STAGE_SNAPSHOT_MEMORY_BUDGET_MB,
+        )
+        chunk_seconds = config.pop("chunk_seconds", None)
+        chunk_overlap_seconds = config.pop(
+            "chunk_overlap_seconds",
+            DEFAULT_CHUNK_OVERLAP_SECONDS,
+        )
         preset_name = config.pop("preset", None)
         if preset_name is None:
             preset_name = config.get("preset_name")
@@ -178,6 +201,14 @@ class SmartMastering:
             else {}
         )
         self.stem_mastered_input = False
+        self.stage_snapshots = resolve_stage_snapshot_mode(stage_snapshots)
+        self.stage_snapshot_memory_budget_mb = float(
+            stage_snapshot_memory_budget_mb
+        )
+        self.chunk_seconds = (
+            None if chunk_seconds is None else float(chunk_seconds)
+        )
+        self.chunk_overlap_seconds = float(max(chunk_overlap_seconds, 0.0))
 
     def measure_spectrum(
         self,
@@ -205,27 +236,50 @@ class SmartMastering:
             release_ms_max=release_ms_max,
             window_ms=window_ms,
         )
-        return _apply_limiter(
+        return self.render_in_windows(
+            lambda window: _apply_limiter(
+                self,
+                window,
+                drive_db=drive_db,
+                ceil_db=ceil_db,
+                os_factor=os_factor,
+                lookahead_ms=lookahead_ms,
+                attack_ms=recovery_settings.attack_ms,
+                release_ms_min=recovery_settings.release_ms_min,
+                release_ms_max=recovery_settings.release_ms_max,
+                soft_clip_ratio=soft_clip_ratio,
+                window_ms=recovery_settings.window_ms,
+                signal_module=signal,
+                maximum_filter1d_fn=maximum_filter1d,
+                uniform_filter1d_fn=uniform_filter1d,
+                limiter_smooth_env_fn=limiter_smooth_env,
+                oversampling_plan_fn=get_oversampling_plan,
+            ),
+            y,
+        )
+
+    def render_in_windows(self, render_fn, y: np.ndarray) -> np.ndarray:
+        if getattr(self, "render_window", None) is None:
+            return render_fn(y)
+        from ..dsp import process_audio_chunks
+
+        return _render_in_windows(
             self,
+            render_fn,
             y,
-            drive_db=drive_db,
-            ceil_db=ceil_db,
-            os_factor=os_factor,
-            lookahead_ms=lookahead_ms,
-            attack_ms=recovery_settings.attack_ms,
-            release_ms_min=recovery_settings.release_ms_min,
-            release_ms_max=recovery_settings.release_ms_max,
-            soft_clip_ratio=soft_clip_ratio,
-            window_ms=recovery_settings.window_ms,
-            signal_module=signal,
-            maximum_filter1d_fn=maximum_filter1d,
-            uniform_filter1d_fn=uniform_filter1d,
-            limiter_smooth_env_fn=limiter_smooth_env,
+            process_audio_chunks_fn=process_audio_chunks,
         )
 
     def apply_eq(self, y: np.ndarray) -> np.ndarray:
         audio_eq_fn = _resolve_package_symbol("audio_eq", audio_eq)
-        return _apply_eq(self, y, audio_eq_fn=audio_eq_fn)
+
+        def windowed_audio_eq(audio_data: np.ndarray, **kwargs) -> np.ndarray:
+            return self.render_in_windows(
+                lambda window: audio_eq_fn(audio_data=window, **kwargs),
+                audio_data,
+            )
+
+        return _apply_eq(self, y, audio_eq_fn=windowed_audio_eq)
 
     def apply_stem_cleanup(
         self,
@@ -242,7 +296,12 @@ class SmartMastering:
         )
 
     def apply_spatial_enhancement(self, y: np.ndarray) -> np.ndarray:
-        return _apply_spatial_enhancement(self, y, signal_module=signal)
+        return _apply_spatial_enhancement(
+            self,
+            y,
+            signal_module=signal,
+            boxcar_fn=boxcar_mean,
+        )
 
     def apply_safety_clamp(
         self, y: np.ndarray, *, ceil_db: float = -0.1
@@ -373,14 +432,18 @@ class SmartMastering:
         )
 
     def multiband_compress(self, y: np.ndarray) -> np.ndarray:
-        return _multiband_compress(
-            self,
-            y,
-            signal_module=signal,
-            decoupled_envelope_fn=_resolve_package_symbol(
-                "decoupled_envelope",
-                decoupled_envelope,
+        decoupled_envelope_fn = _resolve_package_symbol(
+            "decoupled_envelope",
+            decoupled_envelope,
+        )
+        return self.render_in_windows(
+            lambda window: _multiband_compress(
+                self,
+                window,
+                signal_module=signal,
+                decoupled_envelope_fn=decoupled_envelope_fn,
             ),
+            y,
         )
 
     def process(
@@ -388,23 +451,52 @@ class SmartMastering:
         y: np.ndarray,
         sr: int | None = None,
     ) -> tuple[int, np.ndarray]:
-        return _process(
+        render_window = getattr(self, "render_window", None)
+        with oversampling_memo(
+            block_samples=None if render_window is None else render_window[0]
+        ):
+            return _process(
+                self,
+                y,
+                sr=sr,
+                resample_fn=resample,
+                stereo_fn=stereo,
+                freq_cut_fn=_resolve_package_symbol("freq_cut", freq_cut),
+                apply_exciter_fn=_resolve_package_symbol(
+                    "apply_exciter",
+                    apply_exciter,
+                ),
+                get_lufs_fn=_resolve_package_symbol("get_lufs", get_lufs),
+                measure_mastering_loudness_fn=_resolve_package_symbol(
+                    "_measure_mastering_loudness",
+                    _measure_mastering_loudness,
+                ),
+                log_fn=_log_with_activity,
+            )
+
+    def process_chunked(
+        self,
+        y: np.ndarray,
+        sr: int | None = None,
+        *,
+        chunk_seconds: float | None = None,
+        overlap_seconds: float | None = None,
+    ) -> tuple[int, np.ndarray]:
+        return _process_chunked(
             self,
             y,
             sr=sr,
-            resample_fn=resample,
-            stereo_fn=stereo,
-            freq_cut_fn=_resolve_package_symbol("freq_cut", freq_cut),
-            apply_exciter_fn=_resolve_package_symbol(
-                "apply_exciter",
-                apply_exciter,
+            chunk_seconds=(
+                self.chunk_seconds or DEFAULT_CHUNK_SECONDS
+                if chunk_seconds is None
+                else chunk_seconds
             ),
-            get_lufs_fn=_resolve_package_symbol("get_lufs", get_lufs),
-            measure_mastering_loudness_fn=_resolve_package_symbol(
-                "_measure_mastering_loudness",
-                _measure_mastering_loudness,
+            overlap_seconds=(
+                self.chunk_overlap_seconds
+                if overlap_seconds is None
+                else overlap_seconds
             ),
-            log_fn=_log_with_activity,
+            process_fn=self.process,
         )
 
     def process_stem(
@@ -497,6 +589,7 @@ def _master_internal(
         stem_model_name = str(kwargs.pop("stem_model_name", "mastering"))
         stem_shifts = int(kwargs.pop("stem_shifts", 1))
         stem_mix_headroom_db = float(kwargs.pop("stem_mix_headroom_db", 6.0))
+        stem_execution = str(kwargs.pop("stem_execution", "thread"))
         save_mastered_stems = bool(
             kwargs.pop("save_mastered_stems", stem_mastering)
         )
@@ -584,6 +677,7 @@ def _master_internal(
                 mastered_stems_bit_depth=bit_depth,
                 mastered_stems_bitrate=bitrate,
                 mastered_stems_compression_level=compression_level,
+                stem_execution=stem_execution,
             )
             resolved_mastering_kwargs["stem_mastered_input"] = True
 
@@ -658,7 +752,12 @@ def _render_master_output(
     stem_mastered_input = bool(kwargs.pop("stem_mastered_input", False))
     mastering = mastering_cls(processing_sample_rate, **kwargs)
     mastering.stem_mastered_input = stem_mastered_input
-    sr_mastered, y_mastered = mastering.process(
+    process = (
+        mastering.process_chunked
+        if getattr(mastering, "chunk_seconds", None)
+        else mastering.process
+    )
+    sr_mastered, y_mastered = process(
         processing_signal,
         processing_sample_rate,
     )
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from collections import deque
 from collections.abc import Callable
 
 from definers.runtime_numpy import get_numpy_module
@@ -8,6 +7,15 @@ from definers.runtime_numpy import get_numpy_module
 np = get_numpy_module()
 from scipy import signal
 
+from .gate_kernels import (
+    gate_hysteresis,
+    gate_open_curve,
+    nearest_zero_crossings,
+    one_pole_cascade,
+    rolling_max,
+    trailing_mean,
+)
+
 
 def audio_eq(
     audio_data: np.ndarray,
@@ -79,18 +87,37 @@ def smooth_curve(
         return curve
 
     smoothed = np.copy(curve)
+    freqs = np.asarray(f_axis, dtype=np.float64).reshape(-1)
+    if freqs.size == 0:
+        return smoothed
+
+    order = np.argsort(freqs, kind="stable")
+    sorted_freqs = freqs[order]
+    bandwidths = freqs * (2**smoothing_fraction - 2 ** (-smoothing_fraction))
+    low_f = freqs - bandwidths / 2
+    high_f = freqs + bandwidths / 2
+    starts = np.searchsorted(sorted_freqs, low_f, side="left")
+    stops = np.searchsorted(sorted_freqs, high_f, side="right")
+    counts = stops - starts
+    valid = (counts > 0) & np.isfinite(low_f) & np.isfinite(high_f)
+    if not np.any(valid):
+        return smoothed
+
+    sorted_values = np.asarray(curve, dtype=np.float64).reshape(-1)[order]
+    finite_values = np.isfinite(sorted_values)
+    value_sums = np.concatenate(
+        ([0.0], np.cumsum(np.where(finite_values, sorted_values, 0.0)))
+    )
+    non_finite_counts = np.concatenate(
+        ([0], np.cumsum(~finite_values, dtype=np.int64))
+    )
+    means = (value_sums[stops] - value_sums[starts]) / np.maximum(counts, 1)
+    for index in np.flatnonzero(
+        valid & (non_finite_counts[stops] > non_finite_counts[starts])
+    ):
+        means[index] = np.mean(sorted_values[starts[index] : stops[index]])
 
-    for index, frequency_hz in enumerate(f_axis):
-        bandwidth = frequency_hz * (
-            2**smoothing_fraction - 2 ** (-smoothing_fraction)
-        )
-        low_f = frequency_hz - bandwidth / 2
-        high_f = frequency_hz + bandwidth / 2
-        mask = (f_axis >= low_f) & (f_axis <= high_f)
-
-        if np.any(mask):
-            smoothed[index] = np.mean(curve[mask])
-
+    smoothed[valid] = means[valid]
     return smoothed
 
 
@@ -103,45 +130,11 @@ def _normalize_stem_role(stem_role: str | None) -> str:
 
 def _moving_average(values: np.ndarray, window_size: int) -> np.ndarray:
     samples = np.asarray(values, dtype=np.float32).reshape(-1)
-    if samples.size == 0 or window_size <= 1:
-        return samples.astype(np.float32, copy=True)
-
-    window_size = max(1, min(int(window_size), samples.size))
-    if window_size <= 1:
-        return samples.astype(np.float32, copy=True)
-
-    cumulative = np.cumsum(samples, dtype=np.float64)
-    smoothed = np.empty_like(samples)
-    for index in range(samples.size):
-        start = max(0, index - window_size + 1)
-        total = cumulative[index]
-        if start > 0:
-            total -= cumulative[start - 1]
-        smoothed[index] = total / float(index - start + 1)
-    return smoothed.astype(np.float32, copy=False)
+    return trailing_mean(samples, window_size)
 
 
 def _rolling_max(values: np.ndarray, window_size: int) -> np.ndarray:
-    samples = np.asarray(values, dtype=np.float32).reshape(-1)
-    if samples.size == 0 or window_size <= 1:
-        return samples.astype(np.float32, copy=True)
-
-    window_size = max(1, min(int(window_size), samples.size))
-    if window_size <= 1:
-        return samples.astype(np.float32, copy=True)
-
-    rolling_max: deque[int] = deque()
-    output = np.empty_like(samples)
-
-    for index, value in enumerate(samples):
-        while rolling_max and rolling_max[0] <= index - window_size:
-            rolling_max.popleft()
-        while rolling_max and samples[rolling_max[-1]] <= value:
-            rolling_max.pop()
-        rolling_max.append(index)
-        output[index] = samples[rolling_max[0]]
-
-    return output
+    return rolling_max(values, window_size)
 
 
 def _restore_audio_dtype(values: np.ndarray, dtype: np.dtype) -> np.ndarray:
@@ -736,48 +729,6 @@ def _resample_audio_channels(
     return _as_audio_channels(np.asarray(resampled, dtype=np.float32))
 
 
-def _apply_first_order_lowpass(
-    signal_values: np.ndarray,
-    sample_rate: int,
-    cutoff_hz: float,
-) -> np.ndarray:
-    if cutoff_hz <= 0.0 or cutoff_hz >= sample_rate * 0.5:
-        return np.asarray(signal_values, dtype=np.float32)
-
-    dt = 1.0 / float(max(sample_rate, 1))
-    rc = 1.0 / max(2.0 * np.pi * cutoff_hz, 1e-6)
-    alpha = float(np.clip(dt / (rc + dt), 0.0, 1.0))
-    source = np.asarray(signal_values, dtype=np.float32)
-    filtered = np.empty_like(source)
-    filtered[0] = source[0]
-    for index in range(1, source.size):
-        filtered[index] = filtered[index - 1] + alpha * (
-            source[index] - filtered[index - 1]
-        )
-    return filtered.astype(np.float32, copy=False)
-
-
-def _apply_first_order_highpass(
-    signal_values: np.ndarray,
-    sample_rate: int,
-    cutoff_hz: float,
-) -> np.ndarray:
-    if cutoff_hz <= 0.0:
-        return np.asarray(signal_values, dtype=np.float32)
-
-    dt = 1.0 / float(max(sample_rate, 1))
-    rc = 1.0 / max(2.0 * np.pi * cutoff_hz, 1e-6)
-    alpha = float(np.clip(rc / (rc + dt), 0.0, 1.0))
-    source = np.asarray(signal_values, dtype=np.float32)
-    filtered = np.empty_like(source)
-    filtered[0] = source[0]
-    for index in range(1, source.size):
-        filtered[index] = alpha * (
-            filtered[index - 1] + source[index] - source[index - 1]
-        )
-    return filtered.astype(np.float32, copy=False)
-
-
 def _apply_gate_sidechain_filters(
     channels: np.ndarray,
     sample_rate: int,
@@ -796,26 +747,14 @@ def _apply_gate_sidechain_filters(
     if int(source_channels.shape[-1]) == 0:
         return source_channels.astype(np.float32, copy=False)
 
-    filtered_channels = []
-    for channel in source_channels:
-        filtered_channel = channel.astype(np.float32, copy=True)
-        if high_cut_hz > 0.0:
-            for _ in range(2):
-                filtered_channel = _apply_first_order_lowpass(
-                    filtered_channel,
-                    sample_rate,
-                    high_cut_hz,
-                )
-        if low_cut_hz > 0.0:
-            for _ in range(4):
-                filtered_channel = _apply_first_order_highpass(
-                    filtered_channel,
-                    sample_rate,
-                    low_cut_hz,
-                )
-        filtered_channels.append(filtered_channel)
-
-    return np.vstack(filtered_channels).astype(np.float32, copy=False)
+    return one_pole_cascade(
+        source_channels,
+        sample_rate,
+        lowpass_hz=high_cut_hz,
+        lowpass_passes=2,
+        highpass_hz=low_cut_hz,
+        highpass_passes=4,
+    )
 
 
 def _compute_gate_rms_envelope(
@@ -823,14 +762,11 @@ def _compute_gate_rms_envelope(
     window_samples: int,
 ) -> np.ndarray:
     source_channels = _as_audio_channels(channels)
-    envelopes = []
-    for channel in source_channels:
-        channel_power = np.square(channel, dtype=np.float32)
-        smoothed_power = _moving_average(channel_power, window_samples)
-        envelopes.append(
-            np.sqrt(np.maximum(smoothed_power, 1e-12)).astype(np.float32)
-        )
-    return np.vstack(envelopes).astype(np.float32)
+    smoothed_power = trailing_mean(
+        np.square(source_channels, dtype=np.float32),
+        window_samples,
+    )
+    return np.sqrt(np.maximum(smoothed_power, 1e-12)).astype(np.float32)
 
 
 def _link_gate_detector_envelope(
@@ -883,27 +819,26 @@ def _resolve_noise_gate_threshold_db(
 
 
 def _soft_gate_curve(
-    level_db: float,
+    level_db: np.ndarray,
     close_threshold_db: float,
     full_open_db: float,
     knee_db: float,
-) -> float:
+) -> np.ndarray:
+    levels = np.asarray(level_db, dtype=np.float64)
     if full_open_db <= close_threshold_db:
-        return 1.0 if level_db >= full_open_db else 0.0
+        return np.where(levels >= full_open_db, 1.0, 0.0)
 
     lower_bound = close_threshold_db - max(knee_db, 0.0) * 0.5
     upper_bound = full_open_db + max(knee_db, 0.0) * 0.5
     if upper_bound <= lower_bound:
-        return 1.0 if level_db >= full_open_db else 0.0
+        return np.where(levels >= full_open_db, 1.0, 0.0)
 
-    position = float(
-        np.clip(
-            (level_db - lower_bound) / (upper_bound - lower_bound),
-            0.0,
-            1.0,
-        )
+    position = np.clip(
+        (levels - lower_bound) / (upper_bound - lower_bound),
+        0.0,
+        1.0,
     )
-    return float(position * position * (3.0 - 2.0 * position))
+    return position * position * (3.0 - 2.0 * position)
 
 
 def _build_gate_gain_curve(
@@ -968,90 +903,50 @@ def _build_gate_gain_curve(
         1.0,
     ).astype(np.float32)
 
-    gain_curve = np.empty(sample_count, dtype=np.float32)
-    state_curve = np.zeros(sample_count, dtype=np.float32)
-    current_open = 0.0
-    hold_remaining = 0
-    gate_open = False
-
-    for index, level_db in enumerate(detector_db):
-        detector_level_db = (
-            float(level_db) if np.isfinite(level_db) else noise_floor_db
-        )
-        if gate_open:
-            if detector_level_db < close_threshold_db:
-                if hold_remaining > 0:
-                    hold_remaining -= 1
-                else:
-                    gate_open = False
-            else:
-                hold_remaining = hold_samples
-        elif detector_level_db >= threshold_db:
-            gate_open = True
-            hold_remaining = hold_samples
-
-        state_curve[index] = 1.0 if gate_open else 0.0
-        target_open = _soft_gate_curve(
-            detector_level_db,
+    detector_levels = np.asarray(detector_db, dtype=np.float64)
+    detector_levels = np.where(
+        np.isfinite(detector_levels),
+        detector_levels,
+        noise_floor_db,
+    )
+    gate_state, gate_held = gate_hysteresis(
+        detector_levels,
+        threshold_db,
+        close_threshold_db,
+        hold_samples,
+    )
+    target_open = np.where(
+        gate_held,
+        1.0,
+        _soft_gate_curve(
+            detector_levels,
             close_threshold_db,
             full_open_db,
             knee_db,
+        ),
+    )
+    release_multiplier = np.ones(sample_count, dtype=np.float64)
+    if adaptive_release_enabled:
+        release_multiplier = 1.0 + adaptive_release_strength * np.nan_to_num(
+            detector_activity.astype(np.float64)
         )
-        if gate_open and hold_remaining > 0:
-            target_open = 1.0
-
-        if target_open > current_open:
-            smoothing_span = max(attack_samples, 1)
-        else:
-            release_multiplier = 1.0
-            if adaptive_release_enabled:
-                release_multiplier += adaptive_release_strength * float(
-                    detector_activity[index]
-                )
-            smoothing_span = max(
-                int(round(release_samples * release_multiplier)),
-                1,
-            )
-
-        current_open += (target_open - current_open) / float(smoothing_span)
-        current_open = float(np.clip(current_open, 0.0, 1.0))
-        gain_curve[index] = closed_gain + (1.0 - closed_gain) * current_open
+    release_spans = np.maximum(
+        np.rint(release_samples * release_multiplier),
+        1.0,
+    )
+    open_curve = gate_open_curve(
+        target_open,
+        release_spans,
+        float(max(attack_samples, 1)),
+    )
+    gain_curve = (closed_gain + (1.0 - closed_gain) * open_curve).astype(
+        np.float32
+    )
+    state_curve = gate_state.astype(np.float32)
 
     return gain_curve, state_curve, threshold_db
 
 
-def _find_nearest_zero_crossing(
-    signal_values: np.ndarray,
-    center_index: int,
-    radius_samples: int,
-) -> int:
-    sample_count = int(signal_values.size)
-    if sample_count <= 1 or radius_samples <= 0:
-        return int(np.clip(center_index, 0, max(sample_count - 1, 0)))
-
-    start_index = max(1, center_index - radius_samples)
-    end_index = min(sample_count - 1, center_index + radius_samples)
-    if end_index <= start_index:
-        return int(np.clip(center_index, 0, sample_count - 1))
-
-    segment = signal_values[start_index - 1 : end_index + 1]
-    if segment.size <= 1:
-        return int(np.clip(center_index, 0, sample_count - 1))
-
-    sign_changes = np.where(
-        np.signbit(segment[:-1]) != np.signbit(segment[1:])
-    )[0]
-    if sign_changes.size == 0:
-        return int(np.clip(center_index, 0, sample_count - 1))
-
-    crossing_positions = start_index + sign_changes
-    return int(
-        crossing_positions[
-            int(np.argmin(np.abs(crossing_positions - center_index)))
-        ]
-    )
-
-
 def _apply_zero_crossing_smoothing(
     program_channels: np.ndarray,
     gate_mask: np.ndarray,
@@ -1085,12 +980,12 @@ def _apply_zero_crossing_smoothing(
         program_channel = source_channels[
             min(channel_index, source_channels.shape[0] - 1)
         ]
-        for transition_index in transition_indices:
-            zero_index = _find_nearest_zero_crossing(
-                program_channel,
-                int(transition_index),
-                window_samples,
-            )
+        zero_indices = nearest_zero_crossings(
+            program_channel,
+            transition_indices,
+            window_samples,
+        )
+        for zero_index in zero_indices.tolist():
             fade_start = max(0, zero_index - fade_samples)
             fade_end = min(
                 mask_channels.shape[-1], zero_index + fade_samples + 1
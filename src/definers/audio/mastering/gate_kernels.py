@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+from definers.runtime_numpy import get_numpy_module
+
+np = get_numpy_module()
+from scipy import signal
+
+from ..dependencies import njit, numba_available
+
+
+@njit(cache=True)
+def _rolling_max_kernel(samples, window_size):
+    sample_count = samples.size
+    output = np.empty_like(samples)
+    window_indices = np.empty(sample_count, dtype=np.int64)
+    head = 0
+    tail = 0
+    for index in range(sample_count):
+        value = samples[index]
+        while tail > head and window_indices[head] <= index - window_size:
+            head += 1
+        while tail > head and samples[window_indices[tail - 1]] <= value:
+            tail -= 1
+        window_indices[tail] = index
+        tail += 1
+        output[index] = samples[window_indices[head]]
+    return output
+
+
+@njit(cache=True)
+def _one_pole_cascade_kernel(
+    channel,
+    lowpass_alpha,
+    lowpass_passes,
+    highpass_alpha,
+    highpass_passes,
+):
+    filtered = channel.copy()
+    for _ in range(lowpass_passes):
+        previous_output = filtered[0]
+        for index in range(1, filtered.size):
+            previous_output = previous_output + lowpass_alpha * (
+                filtered[index] - previous_output
+            )
+            filtered[index] = previous_output
+    for _ in range(highpass_passes):
+        previous_input = filtered[0]
+        previous_output = filtered[0]
+        for index in range(1, filtered.size):
+            current_input = filtered[index]
+            previous_output = highpass_alpha * (
+                previous_output + current_input - previous_input
+            )
+            previous_input = current_input
+            filtered[index] = previous_output
+    return filtered
+
+
+@njit(cache=True)
+def _gate_hysteresis_kernel(
+    levels,
+    open_threshold_db,
+    close_threshold_db,
+    hold_samples,
+    state,
+    held,
+):
+    gate_open = False
+    hold_remaining = 0
+    for index in range(levels.size):
+        level_db = levels[index]
+        if gate_open:
+            if level_db < close_threshold_db:
+                if hold_remaining > 0:
+                    hold_remaining -= 1
+                else:
+                    gate_open = False
+            else:
+                hold_remaining = hold_samples
+        elif level_db >= open_threshold_db:
+            gate_open = True
+            hold_remaining = hold_samples
+        state[index] = gate_open
+        held[index] = gate_open and hold_remaining > 0
+    return state, held
+
+
+@njit(cache=True)
+def _gate_open_kernel(target_open, release_spans, attack_span, open_curve):
+    current_open = 0.0
+    for index in range(len(target_open)):
+        target = target_open[index]
+        if target > current_open:
+            smoothing_span = attack_span
+        else:
+            smoothing_span = release_spans[index]
+        current_open += (target - current_open) / smoothing_span
+        if current_open < 0.0:
+            current_open = 0.0
+        elif current_open > 1.0:
+            current_open = 1.0
+        open_curve[index] = current_open
+    return open_curve
+
+
+def trailing_mean(values: np.ndarray, window_size: int) -> np.ndarray:
+    samples = np.asarray(values, dtype=np.float32)
+    sample_count = int(samples.shape[-1]) if samples.ndim else 0
+    if samples.size == 0 or window_size <= 1:
+        return samples.astype(np.float32, copy=True)
+
+    window_size = max(1, min(int(window_size), sample_count))
+    if window_size <= 1:
+        return samples.astype(np.float32, copy=True)
+
+    cumulative = np.cumsum(samples, axis=-1, dtype=np.float64)
+    totals = cumulative.copy()
+    totals[..., window_size:] -= cumulative[..., :-window_size]
+    counts = np.minimum(
+        np.arange(1, sample_count + 1, dtype=np.float64),
+        float(window_size),
+    )
+    return (totals / counts).astype(np.float32, copy=False)
+
+
+def _rolling_max_blocks(samples: np.ndarray, window_size: int) -> np.ndarray:
+    sample_count = int(samples.size)
+    lead = window_size - 1
+    block_count = -(-(sample_count + lead) // window_size)
+    padded = np.full(block_count * window_size, -np.inf, dtype=samples.dtype)
+    padded[lead : lead + sample_count] = samples
+    blocks = padded.reshape(block_count, window_size)
+    prefix_max = np.maximum.accumulate(blocks, axis=1).reshape(-1)
+    suffix_max = np.maximum.accumulate(blocks[:, ::-1], axis=1)[:, ::-1]
+    suffix_max = suffix_max.reshape(-1)
+    return np.maximum(
+        suffix_max[:sample_count],
+        prefix_max[lead : lead + sample_count],
+    )
+
+
+def rolling_max(values: np.ndarray, window_size: int) -> np.ndarray:
+    samples = np.ascontiguousarray(values, dtype=np.float32).reshape(-1)
+    if samples.size == 0 or window_size <= 1:
+        return samples.astype(np.float32, copy=True)
+
+    window_size = max(1, min(int(window_size), samples.size))
+    if window_size <= 1:
+        return samples.astype(np.float32, copy=True)
+
+    if numba_available():
+        return _rolling_max_kernel(samples, window_size)
+    return _rolling_max_blocks(samples, window_size)
+
+
+def _one_pole_coefficients(
+    sample_rate: int,
+    cutoff_hz: float,
+) -> tuple[float, float]:
+    dt = 1.0 / float(max(sample_rate, 1))
+    rc = 1.0 / max(2.0 * np.pi * cutoff_hz, 1e-6)
+    return (
+        float(np.clip(dt / (rc + dt), 0.0, 1.0)),
+        float(np.clip(rc / (rc + dt), 0.0, 1.0)),
+    )
+
+
+def _one_pole_lfilter(
+    channels: np.ndarray,
+    numerator: list[float],
+    denominator: list[float],
+) -> np.ndarray:
+    initial_state = (1.0 - float(numerator[0])) * channels[:, :1]
+    filtered, _state = signal.lfilter(
+        numerator,
+        denominator,
+        channels,
+        axis=-1,
+        zi=initial_state,
+    )
+    return np.asarray(filtered, dtype=np.float32)
+
+
+def one_pole_cascade(
+    channels: np.ndarray,
+    sample_rate: int,
+    *,
+    lowpass_hz: float = 0.0,
+    lowpass_passes: int = 0,
+    highpass_hz: float = 0.0,
+    highpass_passes: int = 0,
+) -> np.ndarray:
+    source_channels = np.atleast_2d(np.asarray(channels, dtype=np.float32))
+    if source_channels.shape[-1] == 0:
+        return source_channels.astype(np.float32, copy=True)
+
+    lowpass_alpha = 0.0
+    if 0.0 < lowpass_hz < sample_rate * 0.5:
+        lowpass_alpha = _one_pole_coefficients(sample_rate, lowpass_hz)[0]
+    else:
+        lowpass_passes = 0
+    highpass_alpha = 0.0
+    if highpass_hz > 0.0:
+        highpass_alpha = _one_pole_coefficients(sample_rate, highpass_hz)[1]
+    else:
+        highpass_passes = 0
+
+    if numba_available():
+        return np.vstack(
+            [
+                _one_pole_cascade_kernel(
+                    np.ascontiguousarray(channel),
+                    np.float32(lowpass_alpha),
+                    int(lowpass_passes),
+                    np.float32(highpass_alpha),
+                    int(highpass_passes),
+                )
+                for channel in source_channels
+            ]
+        ).astype(np.float32, copy=False)
+
+    filtered = source_channels.astype(np.float32, copy=True)
+    for _ in range(int(lowpass_passes)):
+        filtered = _one_pole_lfilter(
+            filtered,
+            [lowpass_alpha],
+            [1.0, lowpass_alpha - 1.0],
+        )
+    for _ in range(int(highpass_passes)):
+        filtered = _one_pole_lfilter(
+            filtered,
+            [highpass_alpha, -highpass_alpha],
+            [1.0, -highpass_alpha],
+        )
+    return filtered
+
+
+def _gate_hysteresis_vectorized(
+    levels: np.ndarray,
+    open_threshold_db: float,
+    close_threshold_db: float,
+    hold_samples: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    sample_indices = np.arange(levels.size, dtype=np.int64)
+    below_close = levels < close_threshold_db
+    last_above = np.maximum.accumulate(
+        np.where(below_close, -1, sample_indices)
+    )
+    below_run = sample_indices - last_above
+    open_events = levels >= open_threshold_db
+    close_events = below_close & (below_run == hold_samples + 1)
+    last_event = np.maximum.accumulate(
+        np.where(open_events | close_events, sample_indices, -1)
+    )
+    state = (last_event >= 0) & open_events[np.maximum(last_event, 0)]
+    held = state & (below_run < hold_samples)
+    return state, held
+
+
+def gate_hysteresis(
+    levels: np.ndarray,
+    open_threshold_db: float,
+    close_threshold_db: float,
+    hold_samples: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    level_values = np.ascontiguousarray(levels, dtype=np.float64).reshape(-1)
+    if numba_available():
+        return _gate_hysteresis_kernel(
+            level_values,
+            float(open_threshold_db),
+            float(close_threshold_db),
+            int(hold_samples),
+            np.zeros(level_values.size, dtype=np.bool_),
+            np.zeros(level_values.size, dtype=np.bool_),
+        )
+    return _gate_hysteresis_vectorized(
+        level_values,
+        float(open_threshold_db),
+        float(close_threshold_db),
+        int(hold_samples),
+    )
+
+
+def gate_open_curve(
+    target_open: np.ndarray,
+    release_spans: np.ndarray,
+    attack_span: float,
+) -> np.ndarray:
+    targets = np.ascontiguousarray(target_open, dtype=np.float64).reshape(-1)
+    spans = np.ascontiguousarray(release_spans, dtype=np.float64).reshape(-1)
+    if numba_available():
+        return _gate_open_kernel(
+            targets,
+            spans,
+            float(attack_span),
+            np.empty(targets.size, dtype=np.float64),
+        )
+    return np.asarray(
+        _gate_open_kernel(
+            targets.tolist(),
+            spans.tolist(),
+            float(attack_span),
+            [0.0] * targets.size,
+        ),
+        dtype=np.float64,
+    )
+
+
+def nearest_zero_crossings(
+    signal_values: np.ndarray,
+    center_indices: np.ndarray,
+    radius_samples: int,
+) -> np.ndarray:
+    samples = np.asarray(signal_values).reshape(-1)
+    centers = np.asarray(center_indices, dtype=np.int64).reshape(-1)
+    sample_count = int(samples.size)
+    clipped_centers = np.clip(centers, 0, max(sample_count - 1, 0))
+    if sample_count <= 1 or radius_samples <= 0 or centers.size == 0:
+        return clipped_centers
+
+    start_indices = np.maximum(1, centers - radius_samples)
+    end_indices = np.minimum(sample_count - 1, centers + radius_samples)
+    negative = np.signbit(samples)
+    crossings = np.flatnonzero(negative[:-1] != negative[1:]) + 1
+    if crossings.size == 0:
+        return clipped_centers
+
+    right_slots = np.searchsorted(crossings, centers, side="left")
+    left_slots = right_slots - 1
+    left_positions = crossings[np.maximum(left_slots, 0)]
+    right_positions = crossings[np.minimum(right_slots, crossings.size - 1)]
+    left_valid = (left_slots >= 0) & (left_positions >= start_indices)
+    right_valid = (right_slots < crossings.size) & (
+        right_positions <= end_indices
+    )
+    prefer_left = left_valid & (
+        ~right_valid | (centers - left_positions <= right_positions - centers)
+    )
+    nearest = np.where(
+        prefer_left,
+        left_positions,
+        np.where(right_valid, right_positions, clipped_centers),
+    )
+    return np.where(end_indices <= start_indices, clipped_centers, nearest)
@@ -11,6 +11,8 @@ from definers.runtime_numpy import get_numpy_module
 np = get_numpy_module()
 from scipy import signal
 
+from .oversampling import get_oversampling_plan
+
 _ABSOLUTE_GATE_LUFS = -70.0
 _LRA_RELATIVE_GATE_LU = -20.0
 _LRA_SILENCE_PADDING_SECONDS = 1.5
@@ -26,6 +28,9 @@ _DEMAN_HIGH_SHELF_Q = 0.7071752369554193
 _DEMAN_HIGH_SHELF_FC_HZ = 1681.9744509555319
 _DEMAN_HIGH_PASS_Q = 0.5003270373253953
 _DEMAN_HIGH_PASS_FC_HZ = 38.13547087613982
+_LOUDNESS_HISTOGRAM_CEILING_LUFS = 30.0
+_LOUDNESS_HISTOGRAM_STEP_LU = 0.01
+_TRUE_PEAK_KAISER_BETA = 5.0
 _REAL_SCIPY_SIGNAL_ATTRS: dict[str, Any] = {}
 
 
@@ -45,6 +50,22 @@ class MasteringLoudnessMetrics:
         return asdict(self)
 
 
+@dataclass(frozen=True, slots=True)
+class LoudnessMeterReading:
+    integrated_lufs: float
+    momentary_lufs: float
+    short_term_lufs: float
+    max_momentary_lufs: float
+    max_short_term_lufs: float
+    loudness_range_lu: float
+    sample_peak_dbfs: float
+    true_peak_dbfs: float
+    duration_seconds: float
+
+    def to_dict(self) -> dict[str, float]:
+        return asdict(self)
+
+
 def _sanitize_audio(y: np.ndarray) -> np.ndarray:
     y_array = np.asarray(y, dtype=np.float32)
     if y_array.ndim == 0:
@@ -157,17 +178,20 @@ def _fallback_lfilter(
     values: np.ndarray,
     *,
     axis: int = -1,
-) -> np.ndarray:
+    zi: np.ndarray | None = None,
+) -> np.ndarray | tuple[np.ndarray, np.ndarray]:
     x = np.asarray(values, dtype=np.float64)
     if x.size == 0:
-        return np.array(x, copy=True)
+        empty = np.array(x, copy=True)
+        return empty if zi is None else (empty, np.array(zi, copy=True))
     normalized_axis = axis if axis >= 0 else x.ndim + axis
     if normalized_axis != x.ndim - 1:
         x = np.moveaxis(x, normalized_axis, -1)
     b_array = np.asarray(b, dtype=np.float64)
     a_array = np.asarray(a, dtype=np.float64)
     if b_array.size == 0 or a_array.size == 0:
-        return np.array(values, copy=True)
+        unchanged = np.array(values, copy=True)
+        return unchanged if zi is None else (unchanged, np.array(zi, copy=True))
     a0 = float(a_array[0])
     if not np.isfinite(a0) or abs(a0) <= 1e-12:
         raise ValueError("Filter denominator must start with a finite value")
@@ -179,10 +203,15 @@ def _fallback_lfilter(
         filtered = b_array[0] * x
         if normalized_axis != x.ndim - 1:
             filtered = np.moveaxis(filtered, -1, normalized_axis)
-        return filtered
+        return filtered if zi is None else (filtered, np.array(zi, copy=True))
     b_pad = np.pad(b_array, (0, order - len(b_array)))
     a_pad = np.pad(a_array, (0, order - len(a_array)))
     state = np.zeros(x.shape[:-1] + (order - 1,), dtype=np.float64)
+    if zi is not None:
+        initial_state = np.asarray(zi, dtype=np.float64)
+        if normalized_axis != x.ndim - 1:
+            initial_state = np.moveaxis(initial_state, normalized_axis, -1)
+        state[...] = initial_state
     filtered = np.empty_like(x, dtype=np.float64)
     for sample_index in range(x.shape[-1]):
         x_n = x[..., sample_index]
@@ -197,7 +226,8 @@ def _fallback_lfilter(
         state[..., -1] = b_pad[-1] * x_n - a_pad[-1] * y_n
     if normalized_axis != x.ndim - 1:
         filtered = np.moveaxis(filtered, -1, normalized_axis)
-    return filtered
+        state = np.moveaxis(state, -1, normalized_axis)
+    return filtered if zi is None else (filtered, state)
 
 
 def _load_real_scipy_signal_attr(name: str):
@@ -228,47 +258,67 @@ def _load_real_scipy_signal_attr(name: str):
         sys.modules.update(original_modules)
 
 
-def _safe_lfilter(
+def _stateful_lfilter(
     signal_module: Any,
     b: np.ndarray,
     a: np.ndarray,
     values: np.ndarray,
-    *,
-    axis: int = -1,
-) -> np.ndarray:
+    initial_state: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray | None]:
     lfilter = getattr(signal_module, "lfilter", None)
-    if callable(lfilter):
-        return lfilter(b, a, values, axis=axis)
-    real_lfilter = _load_real_scipy_signal_attr("lfilter")
-    if callable(real_lfilter):
-        return real_lfilter(b, a, values, axis=axis)
-    return _fallback_lfilter(b, a, values, axis=axis)
+    if not callable(lfilter):
+        lfilter = _load_real_scipy_signal_attr("lfilter")
+    if not callable(lfilter):
+        return _fallback_lfilter(b, a, values, axis=-1, zi=initial_state)
+    try:
+        filtered, final_state = lfilter(
+            b,
+            a,
+            values,
+            axis=-1,
+            zi=initial_state,
+        )
+    except TypeError:
+        return lfilter(b, a, values, axis=-1), None
+    return filtered, final_state
 
 
-def _weighted_power_series(
+def _k_weighted_channels(
     y: np.ndarray,
     sr: int,
     *,
     signal_module: Any,
-) -> np.ndarray:
-    channels = _flatten_audio_channels(y)
+    tail_samples: int = 0,
+) -> tuple[np.ndarray, np.ndarray]:
+    weighted = _flatten_audio_channels(y)
+    tail = np.zeros((weighted.shape[0], max(int(tail_samples), 0)))
     high_shelf_b, high_shelf_a, high_pass_b, high_pass_a = (
         _k_weighting_coefficients(sr)
     )
-    weighted = _safe_lfilter(
-        signal_module,
-        high_shelf_b,
-        high_shelf_a,
-        channels,
-        axis=-1,
-    )
-    weighted = _safe_lfilter(
-        signal_module,
-        high_pass_b,
-        high_pass_a,
-        weighted,
-        axis=-1,
+    for b, a in ((high_shelf_b, high_shelf_a), (high_pass_b, high_pass_a)):
+        rest_state = np.zeros((weighted.shape[0], max(len(a), len(b)) - 1))
+        weighted, final_state = _stateful_lfilter(
+            signal_module,
+            b,
+            a,
+            weighted,
+            rest_state,
+        )
+        if tail.shape[-1] > 0:
+            tail, _tail_state = _stateful_lfilter(
+                signal_module,
+                b,
+                a,
+                tail,
+                rest_state if final_state is None else final_state,
+            )
+    return (
+        np.asarray(weighted, dtype=np.float64),
+        np.asarray(tail, dtype=np.float64),
     )
+
+
+def _channel_weighted_power(weighted: np.ndarray) -> np.ndarray:
     channel_weights = _loudness_channel_weights(weighted.shape[0])[
         :, np.newaxis
     ]
@@ -279,68 +329,65 @@ def _weighted_power_series(
     )
 
 
-def _append_silence(
-    y: np.ndarray, sr: int, duration_seconds: float
-) -> np.ndarray:
-    silence_samples = max(int(round(sr * duration_seconds)), 0)
-    if silence_samples == 0:
-        return np.array(y, copy=True)
-
-    y_array = np.asarray(y)
-    silence_shape = (*y_array.shape[:-1], silence_samples)
-    silence = np.zeros(silence_shape, dtype=y_array.dtype)
-    return np.concatenate([y_array, silence], axis=-1)
-
-
-def _block_powers(
+def _weighted_power_series(
     y: np.ndarray,
     sr: int,
-    window_seconds: float,
-    hop_seconds: float,
     *,
     signal_module: Any,
-) -> np.ndarray:
-    if y.size == 0 or not np.isfinite(sr) or sr <= 0:
-        return np.zeros(1, dtype=np.float64)
+    tail_seconds: float = 0.0,
+) -> tuple[np.ndarray, np.ndarray]:
+    weighted, weighted_tail = _k_weighted_channels(
+        y,
+        sr,
+        signal_module=signal_module,
+        tail_samples=int(round(sr * max(float(tail_seconds), 0.0))),
+    )
+    return (
+        _channel_weighted_power(weighted),
+        _channel_weighted_power(weighted_tail),
+    )
 
-    y_square = _weighted_power_series(y, sr, signal_module=signal_module)
 
-    return _block_powers_from_series(
-        y_square,
-        sr,
-        window_seconds,
-        hop_seconds,
+def _cumulative_power(power_series: np.ndarray) -> np.ndarray:
+    cumulative = np.empty(power_series.size + 1, dtype=np.float64)
+    cumulative[0] = 0.0
+    np.cumsum(power_series, dtype=np.float64, out=cumulative[1:])
+    return cumulative
+
+
+def _extend_cumulative_power(
+    cumulative: np.ndarray,
+    power_series: np.ndarray,
+) -> np.ndarray:
+    if power_series.size == 0:
+        return cumulative
+    return np.concatenate(
+        (cumulative, cumulative[-1] + np.cumsum(power_series, dtype=np.float64))
     )
 
 
-def _block_powers_from_series(
-    y_square: np.ndarray,
+def _block_powers_from_cumulative(
+    cumulative: np.ndarray,
     sr: int,
     window_seconds: float,
     hop_seconds: float,
 ) -> np.ndarray:
-    if y_square.size == 0 or not np.isfinite(sr) or sr <= 0:
+    sample_count = int(cumulative.size) - 1
+    if sample_count <= 0 or not np.isfinite(sr) or sr <= 0:
         return np.zeros(1, dtype=np.float64)
 
     window_size = max(int(round(sr * window_seconds)), 1)
     hop_size = max(int(round(sr * hop_seconds)), 1)
 
-    if y_square.shape[-1] < window_size:
-        return np.array(
-            [float(np.mean(y_square, dtype=np.float64))],
-            dtype=np.float64,
-        )
-
-    y_windows = np.lib.stride_tricks.sliding_window_view(y_square, window_size)[
-        ::hop_size
-    ]
-    if y_windows.size == 0:
+    if sample_count < window_size:
         return np.array(
-            [float(np.mean(y_square, dtype=np.float64))],
+            [max(float(cumulative[-1]) / sample_count, 0.0)],
             dtype=np.float64,
         )
 
-    return np.mean(y_windows, axis=-1, dtype=np.float64)
+    starts = np.arange(0, sample_count - window_size + 1, hop_size)
+    window_sums = cumulative[starts + window_size] - cumulative[starts]
+    return np.maximum(window_sums / float(window_size), 0.0)
 
 
 def _gated_integrated_lufs(block_powers: np.ndarray) -> float:
@@ -369,12 +416,13 @@ def _gated_integrated_lufs(block_powers: np.ndarray) -> float:
 
 
 def _loudness_series(block_powers: np.ndarray) -> np.ndarray:
-    if block_powers.size == 0:
+    powers = np.asarray(block_powers, dtype=np.float64)
+    if powers.size == 0:
         return np.full(1, _ABSOLUTE_GATE_LUFS, dtype=np.float64)
-    return np.array(
-        [_loudness_from_power(float(value)) for value in block_powers],
-        dtype=np.float64,
-    )
+    valid = np.isfinite(powers) & (powers > 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        loudness = -0.691 + 10.0 * np.log10(np.maximum(powers, 1e-12))
+    return np.where(valid, loudness, _ABSOLUTE_GATE_LUFS)
 
 
 def _loudness_range(short_term_lufs: np.ndarray) -> float:
@@ -416,18 +464,15 @@ def measure_true_peak(
         return -120.0
 
     safe_factor = max(int(oversample_factor), 1)
-    if safe_factor > 1:
-        oversampled = signal_module.resample_poly(
-            y_array,
+    if safe_factor <= 1:
+        return _peak_to_dbfs(float(np.max(np.abs(y_array))))
+    return _peak_to_dbfs(
+        get_oversampling_plan(
+            int(sr),
             safe_factor,
-            1,
-            axis=-1,
-        )
-    else:
-        oversampled = y_array
-
-    peak = float(np.max(np.abs(oversampled))) if oversampled.size else 0.0
-    return _peak_to_dbfs(peak)
+            signal_module=signal_module,
+        ).peak(y_array)
+    )
 
 
 def measure_stereo_width(y: np.ndarray) -> float:
@@ -515,35 +560,32 @@ def measure_mastering_loudness(
             low_end_mono_ratio=1.0,
         )
 
-    weighted_power = _weighted_power_series(
+    weighted_power, tail_power = _weighted_power_series(
         y_array,
         sr,
         signal_module=signal_module,
+        tail_seconds=_LRA_SILENCE_PADDING_SECONDS,
     )
-    momentary_powers = _block_powers_from_series(
-        weighted_power,
+    cumulative_power = _cumulative_power(weighted_power)
+    momentary_powers = _block_powers_from_cumulative(
+        cumulative_power,
         sr,
         _MOMENTARY_WINDOW_SECONDS,
         _HOP_SECONDS,
     )
-    short_term_powers = _block_powers_from_series(
-        weighted_power,
+    short_term_powers = _block_powers_from_cumulative(
+        cumulative_power,
         sr,
         _SHORT_TERM_WINDOW_SECONDS,
         _HOP_SECONDS,
     )
-    padded_weighted_power = _weighted_power_series(
-        _append_silence(y_array, sr, _LRA_SILENCE_PADDING_SECONDS),
-        sr,
-        signal_module=signal_module,
-    )
 
     integrated_lufs = _gated_integrated_lufs(momentary_powers)
     momentary_lufs = _loudness_series(momentary_powers)
     short_term_lufs = _loudness_series(short_term_powers)
     padded_short_term_lufs = _loudness_series(
-        _block_powers_from_series(
-            padded_weighted_power,
+        _block_powers_from_cumulative(
+            _extend_cumulative_power(cumulative_power, tail_power),
             sr,
             _SHORT_TERM_WINDOW_SECONDS,
             _LRA_SHORT_TERM_HOP_SECONDS,
@@ -587,10 +629,447 @@ def measure_mastering_loudness(
 
 
 def get_lufs(y: np.ndarray, sr: int) -> float:
-    return measure_mastering_loudness(y, sr).integrated_lufs
+    y_array = _sanitize_audio(y)
+    if y_array.size == 0 or not np.isfinite(sr) or sr <= 0:
+        return _ABSOLUTE_GATE_LUFS
+
+    weighted_power, _tail_power = _weighted_power_series(
+        y_array,
+        sr,
+        signal_module=signal,
+    )
+    return _gated_integrated_lufs(
+        _block_powers_from_cumulative(
+            _cumulative_power(weighted_power),
+            sr,
+            _MOMENTARY_WINDOW_SECONDS,
+            _HOP_SECONDS,
+        )
+    )
+
+
+def _absolute_gate_power() -> float:
+    return 10.0 ** ((_ABSOLUTE_GATE_LUFS + 0.691) / 10.0)
+
+
+class _LoudnessHistogram:
+    __slots__ = ("counts", "power_sums")
+
+    def __init__(self) -> None:
+        bin_count = int(
+            round(
+                (_LOUDNESS_HISTOGRAM_CEILING_LUFS - _ABSOLUTE_GATE_LUFS)
+                / _LOUDNESS_HISTOGRAM_STEP_LU
+            )
+        )
+        self.counts = np.zeros(bin_count, dtype=np.int64)
+        self.power_sums = np.zeros(bin_count, dtype=np.float64)
+
+    def copy(self) -> _LoudnessHistogram:
+        duplicate = _LoudnessHistogram.__new__(_LoudnessHistogram)
+        duplicate.counts = self.counts.copy()
+        duplicate.power_sums = self.power_sums.copy()
+        return duplicate
+
+    def add(self, block_powers: np.ndarray) -> None:
+        powers = np.asarray(block_powers, dtype=np.float64)
+        powers = powers[np.isfinite(powers)]
+        powers = powers[powers >= _absolute_gate_power()]
+        if powers.size == 0:
+            return
+        loudness = -0.691 + 10.0 * np.log10(powers)
+        bins = np.clip(
+            (
+                (loudness - _ABSOLUTE_GATE_LUFS) / _LOUDNESS_HISTOGRAM_STEP_LU
+            ).astype(np.int64),
+            0,
+            self.counts.size - 1,
+        )
+        np.add.at(self.counts, bins, 1)
+        np.add.at(self.power_sums, bins, powers)
+
+    def _bin_centers(self) -> np.ndarray:
+        return _ABSOLUTE_GATE_LUFS + _LOUDNESS_HISTOGRAM_STEP_LU * (
+            np.arange(self.counts.size, dtype=np.float64) + 0.5
+        )
+
+    def gated_integrated_lufs(self) -> float:
+        total_count = int(self.counts.sum())
+        if total_count == 0:
+            return _ABSOLUTE_GATE_LUFS
+        total_power = float(self.power_sums.sum())
+        relative_gate = max(
+            0.1 * total_power / total_count, _absolute_gate_power()
+        )
+        occupied = self.counts > 0
+        bin_means = np.divide(
+            self.power_sums,
+            self.counts,
+            out=np.zeros_like(self.power_sums),
+            where=occupied,
+        )
+        selected = occupied & (bin_means > relative_gate)
+        if not np.any(selected):
+            return _loudness_from_power(total_power / total_count)
+        return _loudness_from_power(
+            float(self.power_sums[selected].sum())
+            / float(self.counts[selected].sum())
+        )
+
+    def _percentile(
+        self,
+        centers: np.ndarray,
+        counts: np.ndarray,
+        percentile: float,
+    ) -> float:
+        cumulative_counts = np.cumsum(counts)
+        position = percentile / 100.0 * float(cumulative_counts[-1] - 1)
+        lower_rank = int(np.floor(position))
+        upper_rank = min(lower_rank + 1, int(cumulative_counts[-1]) - 1)
+        lower, upper = centers[
+            np.searchsorted(
+                cumulative_counts, [lower_rank, upper_rank], side="right"
+            )
+        ]
+        return float(lower + (position - lower_rank) * (upper - lower))
+
+    def loudness_range(self) -> float:
+        total_count = int(self.counts.sum())
+        if total_count == 0:
+            return 0.0
+        relative_gate = (
+            _loudness_from_power(float(self.power_sums.sum()) / total_count)
+            + _LRA_RELATIVE_GATE_LU
+        )
+        centers = self._bin_centers()
+        selected = (self.counts > 0) & (centers >= relative_gate)
+        if not np.any(selected):
+            return 0.0
+        low = self._percentile(
+            centers[selected], self.counts[selected], _LRA_LOW_PERCENTILE
+        )
+        high = self._percentile(
+            centers[selected], self.counts[selected], _LRA_HIGH_PERCENTILE
+        )
+        return max(0.0, high - low)
+
+
+class _BlockPowerAccumulator:
+    __slots__ = (
+        "momentary_size",
+        "short_term_size",
+        "hop_size",
+        "lra_hop_size",
+        "cumulative",
+        "sample_count",
+        "max_momentary_power",
+        "max_short_term_power",
+        "momentary_histogram",
+        "short_term_histogram",
+    )
+
+    def __init__(self, sample_rate: int) -> None:
+        self.momentary_size = max(
+            int(round(sample_rate * _MOMENTARY_WINDOW_SECONDS)), 1
+        )
+        self.short_term_size = max(
+            int(round(sample_rate * _SHORT_TERM_WINDOW_SECONDS)), 1
+        )
+        self.hop_size = max(int(round(sample_rate * _HOP_SECONDS)), 1)
+        self.lra_hop_size = max(
+            int(round(sample_rate * _LRA_SHORT_TERM_HOP_SECONDS)), 1
+        )
+        self.cumulative = np.zeros(2 * self.short_term_size + 1)
+        self.sample_count = 0
+        self.max_momentary_power = 0.0
+        self.max_short_term_power = 0.0
+        self.momentary_histogram = _LoudnessHistogram()
+        self.short_term_histogram = _LoudnessHistogram()
+
+    def copy(self) -> _BlockPowerAccumulator:
+        duplicate = _BlockPowerAccumulator.__new__(_BlockPowerAccumulator)
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if isinstance(value, (np.ndarray, _LoudnessHistogram)):
+                value = value.copy()
+            setattr(duplicate, name, value)
+        return duplicate
+
+    def _cumulative_at(self, positions: np.ndarray | int) -> np.ndarray:
+        return self.cumulative[np.asarray(positions) % self.cumulative.size]
+
+    def _window_powers(
+        self,
+        previous_count: int,
+        window_size: int,
+        hop_size: int,
+    ) -> np.ndarray:
+        first_start = max(previous_count - window_size + 1, 0)
+        first_start = -(-first_start // hop_size) * hop_size
+        starts = np.arange(
+            first_start, self.sample_count - window_size + 1, hop_size
+        )
+        window_sums = self._cumulative_at(
+            starts + window_size
+        ) - self._cumulative_at(starts)
+        return np.maximum(window_sums / float(window_size), 0.0)
+
+    def _push_slice(self, power: np.ndarray) -> None:
+        previous_count = self.sample_count
+        previous_total = float(self._cumulative_at(previous_count))
+        self.sample_count += int(power.size)
+        self.cumulative[
+            np.arange(previous_count + 1, self.sample_count + 1)
+            % self.cumulative.size
+        ] = previous_total + np.cumsum(power, dtype=np.float64)
+
+        momentary_powers = self._window_powers(
+            previous_count, self.momentary_size, self.hop_size
+        )
+        short_term_powers = self._window_powers(
+            previous_count, self.short_term_size, self.hop_size
+        )
+        self.momentary_histogram.add(momentary_powers)
+        self.short_term_histogram.add(
+            self._window_powers(
+                previous_count, self.short_term_size, self.lra_hop_size
+            )
+        )
+        if momentary_powers.size:
+            self.max_momentary_power = max(
+                self.max_momentary_power, float(np.max(momentary_powers))
+            )
+        if short_term_powers.size:
+            self.max_short_term_power = max(
+                self.max_short_term_power, float(np.max(short_term_powers))
+            )
+
+    def push(self, power: np.ndarray) -> None:
+        for start in range(0, power.size, self.short_term_size):
+            self._push_slice(power[start : start + self.short_term_size])
+
+    def _overall_power(self) -> float:
+        if self.sample_count == 0:
+            return 0.0
+        return max(
+            float(self._cumulative_at(self.sample_count)) / self.sample_count,
+            0.0,
+        )
+
+    def window_power(self, window_size: int) -> float:
+        if self.sample_count < window_size:
+            return self._overall_power()
+        window_sum = float(
+            self._cumulative_at(self.sample_count)
+            - self._cumulative_at(self.sample_count - window_size)
+        )
+        return max(window_sum / float(window_size), 0.0)
+
+    def integrated_lufs(self) -> float:
+        if self.sample_count < self.momentary_size:
+            return _gated_integrated_lufs(np.array([self._overall_power()]))
+        return self.momentary_histogram.gated_integrated_lufs()
+
+    def max_loudness(self, window_size: int, max_power: float) -> float:
+        if self.sample_count < window_size:
+            return _loudness_from_power(self._overall_power())
+        return _loudness_from_power(max_power)
+
+
+class LoudnessMeter:
+    def __init__(
+        self,
+        sample_rate: int,
+        *,
+        true_peak_oversample_factor: int = 4,
+        signal_module: Any = signal,
+    ) -> None:
+        if not np.isfinite(sample_rate) or int(sample_rate) <= 0:
+            raise ValueError("sample_rate must be a positive integer")
+        self.sample_rate = int(sample_rate)
+        self.true_peak_oversample_factor = max(
+            int(true_peak_oversample_factor), 1
+        )
+        self.signal_module = signal_module
+        self._peak_taps = None
+        self._peak_history_length = 0
+        if self.true_peak_oversample_factor > 1:
+            factor = self.true_peak_oversample_factor
+            self._peak_taps = (
+                signal_module.firwin(
+                    2 * 10 * factor + 1,
+                    1.0 / factor,
+                    window=("kaiser", _TRUE_PEAK_KAISER_BETA),
+                )
+                * factor
+            )
+            self._peak_history_length = -(-(self._peak_taps.size - 1) // factor)
+        self.reset()
+
+    def reset(self) -> None:
+        self._channel_count: int | None = None
+        self._filter_states: list[np.ndarray | None] = []
+        self._peak_history: np.ndarray | None = None
+        self._sample_peak = 0.0
+        self._true_peak = 0.0
+        self._blocks = _BlockPowerAccumulator(self.sample_rate)
+
+    @property
+    def channel_count(self) -> int | None:
+        return self._channel_count
+
+    @property
+    def sample_count(self) -> int:
+        return self._blocks.sample_count
+
+    @property
+    def duration_seconds(self) -> float:
+        return self.sample_count / float(self.sample_rate)
+
+    def _coerce_block(self, block: np.ndarray) -> np.ndarray:
+        channels = _flatten_audio_channels(_sanitize_audio(block))
+        if self._channel_count is None:
+            self._channel_count = int(channels.shape[0])
+            self._filter_states = [
+                np.zeros((self._channel_count, max(len(a), len(b)) - 1))
+                for b, a in self._filter_stages()
+            ]
+            self._peak_history = np.zeros(
+                (self._channel_count, self._peak_history_length)
+            )
+        elif channels.shape[0] != self._channel_count:
+            raise ValueError(
+                f"Expected {self._channel_count} channels, "
+                f"got {channels.shape[0]}"
+            )
+        return channels
+
+    def _filter_stages(self) -> tuple[tuple[np.ndarray, np.ndarray], ...]:
+        high_shelf_b, high_shelf_a, high_pass_b, high_pass_a = (
+            _k_weighting_coefficients(self.sample_rate)
+        )
+        return ((high_shelf_b, high_shelf_a), (high_pass_b, high_pass_a))
+
+    def _k_weight(
+        self,
+        channels: np.ndarray,
+        states: list[np.ndarray | None],
+    ) -> tuple[np.ndarray, list[np.ndarray | None]]:
+        weighted = channels
+        final_states = []
+        for (b, a), state in zip(self._filter_stages(), states, strict=True):
+            rest_state = np.zeros((channels.shape[0], max(len(a), len(b)) - 1))
+            weighted, final_state = _stateful_lfilter(
+                self.signal_module,
+                b,
+                a,
+                weighted,
+                rest_state if state is None else state,
+            )
+            final_states.append(final_state)
+        return np.asarray(weighted, dtype=np.float64), final_states
+
+    def _oversampled_peak(
+        self, extended: np.ndarray, new_samples: int
+    ) -> float:
+        factor = self.true_peak_oversample_factor
+        oversampled = self.signal_module.upfirdn(
+            self._peak_taps,
+            extended,
+            factor,
+            axis=-1,
+        )
+        start = factor * self._peak_history_length
+        window = oversampled[:, start : start + factor * new_samples]
+        return float(np.max(np.abs(window))) if window.size else 0.0
+
+    def push(self, block: np.ndarray) -> LoudnessMeter:
+        channels = self._coerce_block(block)
+        if channels.shape[-1] == 0:
+            return self
+        self._sample_peak = max(
+            self._sample_peak, float(np.max(np.abs(channels)))
+        )
+        if self._peak_taps is not None:
+            extended = np.concatenate((self._peak_history, channels), axis=-1)
+            self._true_peak = max(
+                self._true_peak,
+                self._oversampled_peak(extended, channels.shape[-1]),
+            )
+            self._peak_history = extended[
+                :, extended.shape[-1] - self._peak_history_length :
+            ]
+        weighted, self._filter_states = self._k_weight(
+            channels, self._filter_states
+        )
+        self._blocks.push(_channel_weighted_power(weighted))
+        return self
+
+    def _true_peak_dbfs(self) -> float:
+        if self.sample_count == 0:
+            return -120.0
+        if self._peak_taps is None:
+            return _peak_to_dbfs(self._sample_peak)
+        ringing = self._oversampled_peak(
+            np.concatenate(
+                (self._peak_history, np.zeros_like(self._peak_history)),
+                axis=-1,
+            ),
+            self._peak_history_length,
+        )
+        return _peak_to_dbfs(max(self._true_peak, ringing))
+
+    def _padded_loudness_range(self) -> float:
+        padding_samples = int(
+            round(self.sample_rate * _LRA_SILENCE_PADDING_SECONDS)
+        )
+        padded_blocks = self._blocks.copy()
+        tail, _tail_states = self._k_weight(
+            np.zeros((self._channel_count or 1, padding_samples)),
+            self._filter_states,
+        )
+        padded_blocks.push(_channel_weighted_power(tail))
+        return padded_blocks.short_term_histogram.loudness_range()
+
+    def reading(self) -> LoudnessMeterReading:
+        if self.sample_count == 0:
+            return LoudnessMeterReading(
+                integrated_lufs=_ABSOLUTE_GATE_LUFS,
+                momentary_lufs=_ABSOLUTE_GATE_LUFS,
+                short_term_lufs=_ABSOLUTE_GATE_LUFS,
+                max_momentary_lufs=_ABSOLUTE_GATE_LUFS,
+                max_short_term_lufs=_ABSOLUTE_GATE_LUFS,
+                loudness_range_lu=0.0,
+                sample_peak_dbfs=-120.0,
+                true_peak_dbfs=-120.0,
+                duration_seconds=0.0,
+            )
+
+        blocks = self._blocks
+        return LoudnessMeterReading(
+            integrated_lufs=blocks.integrated_lufs(),
+            momentary_lufs=_loudness_from_power(
+                blocks.window_power(blocks.momentary_size)
+            ),
+            short_term_lufs=_loudness_from_power(
+                blocks.window_power(blocks.short_term_size)
+            ),
+            max_momentary_lufs=blocks.max_loudness(
+                blocks.momentary_size, blocks.max_momentary_power
+            ),
+            max_short_term_lufs=blocks.max_loudness(
+                blocks.short_term_size, blocks.max_short_term_power
+            ),
+            loudness_range_lu=self._padded_loudness_range(),
+            sample_peak_dbfs=_peak_to_dbfs(self._sample_peak),
+            true_peak_dbfs=self._true_peak_dbfs(),
+            duration_seconds=self.duration_seconds,
+        )
 
 
 __all__ = [
+    "LoudnessMeter",
+    "LoudnessMeterReading",
     "MasteringLoudnessMetrics",
     "get_lufs",
     "measure_low_end_mono_ratio",
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import threading
+import zlib
+from collections.abc import Iterator
+from typing import Any
+
+from definers.runtime_numpy import get_numpy_module
+
+np = get_numpy_module()
+from scipy import signal
+
+_OVERSAMPLING_KAISER_BETA = 5.0
+_OVERSAMPLING_PLAN_CACHE_LIMIT = 8
+_OVERSAMPLING_PLANS: dict[tuple[int, int, int], OversamplingPlan] = {}
+_OVERSAMPLING_PLANS_LOCK = threading.Lock()
+_OVERSAMPLING_MEMO = contextvars.ContextVar(
+    "definers_oversampling_memo",
+    default=None,
+)
+
+
+_OVERSAMPLING_BLOCK_SAMPLES = contextvars.ContextVar(
+    "definers_oversampling_block_samples",
+    default=None,
+)
+_OVERSAMPLING_BLOCK_MARGIN = 32
+
+
+@contextlib.contextmanager
+def oversampling_memo(
+    *,
+    block_samples: int | None = None,
+) -> Iterator[dict[object, list[object]]]:
+    memo: dict[object, list[object]] = {}
+    token = _OVERSAMPLING_MEMO.set(memo)
+    block_token = _OVERSAMPLING_BLOCK_SAMPLES.set(
+        None if block_samples is None else max(int(block_samples), 1)
+    )
+    try:
+        yield memo
+    finally:
+        _OVERSAMPLING_BLOCK_SAMPLES.reset(block_token)
+        _OVERSAMPLING_MEMO.reset(token)
+        memo.clear()
+
+
+def _exceeds_block(samples: np.ndarray) -> int | None:
+    block_samples = _OVERSAMPLING_BLOCK_SAMPLES.get()
+    if block_samples is None or samples.shape[-1] <= block_samples:
+        return None
+    return block_samples
+
+
+def _signal_fingerprint(values: np.ndarray) -> tuple[object, ...]:
+    contiguous = np.ascontiguousarray(values)
+    return (
+        contiguous.shape,
+        contiguous.dtype.str,
+        zlib.crc32(memoryview(contiguous).cast("B")),
+    )
+
+
+class OversamplingPlan:
+    __slots__ = (
+        "sample_rate",
+        "factor",
+        "signal_module",
+        "_prototype",
+        "_taps_by_dtype",
+    )
+
+    def __init__(
+        self,
+        sample_rate: int,
+        factor: int,
+        *,
+        signal_module: Any = signal,
+    ) -> None:
+        self.sample_rate = int(sample_rate)
+        self.factor = max(int(factor), 1)
+        self.signal_module = signal_module
+        self._prototype = None
+        if self.factor > 1 and callable(getattr(signal_module, "firwin", None)):
+            self._prototype = np.asarray(
+                signal_module.firwin(
+                    2 * 10 * self.factor + 1,
+                    1.0 / self.factor,
+                    window=("kaiser", _OVERSAMPLING_KAISER_BETA),
+                ),
+                dtype=np.float64,
+            )
+        self._taps_by_dtype: dict[str, np.ndarray] = {}
+
+    @property
+    def oversampled_rate(self) -> int:
+        return self.sample_rate * self.factor
+
+    def _taps(self, dtype: np.dtype) -> np.ndarray:
+        key = np.dtype(dtype).str
+        taps = self._taps_by_dtype.get(key)
+        if taps is None:
+            taps = self._prototype.astype(dtype)
+            self._taps_by_dtype[key] = taps
+        return taps
+
+    def _resample(self, values: np.ndarray, up: int, down: int) -> np.ndarray:
+        if self._prototype is None or not np.issubdtype(
+            values.dtype, np.floating
+        ):
+            return self.signal_module.resample_poly(values, up, down, axis=-1)
+        return self.signal_module.resample_poly(
+            values,
+            up,
+            down,
+            axis=-1,
+            window=self._taps(values.dtype),
+        )
+
+    def _memo_entry(self, samples: np.ndarray) -> list[object] | None:
+        memo = _OVERSAMPLING_MEMO.get()
+        if memo is None or _exceeds_block(samples) is not None:
+            return None
+        fingerprint = _signal_fingerprint(samples)
+        entry = memo.get(self)
+        if entry is None or entry[0] != fingerprint:
+            oversampled = np.asarray(self._resample(samples, self.factor, 1))
+            if not np.may_share_memory(oversampled, samples):
+                oversampled.flags.writeable = False
+            entry = [fingerprint, oversampled, None]
+            memo[self] = entry
+        return entry
+
+    def upsample(self, values: np.ndarray) -> np.ndarray:
+        samples = np.asarray(values)
+        if self.factor == 1:
+            return np.array(samples, copy=True)
+        entry = self._memo_entry(samples)
+        if entry is None:
+            return np.asarray(self._resample(samples, self.factor, 1))
+        return entry[1]
+
+    def downsample(self, values: np.ndarray) -> np.ndarray:
+        samples = np.asarray(values)
+        if self.factor == 1:
+            return np.array(samples, copy=True)
+        return self._resample(samples, 1, self.factor)
+
+    def _blockwise_peak(self, samples: np.ndarray, block_samples: int) -> float:
+        peak = 0.0
+        sample_count = samples.shape[-1]
+        margin = _OVERSAMPLING_BLOCK_MARGIN
+        for start in range(0, sample_count, block_samples):
+            end = min(start + block_samples, sample_count)
+            padded_start = max(start - margin, 0)
+            oversampled = self._resample(
+                samples[..., padded_start : min(end + margin, sample_count)],
+                self.factor,
+                1,
+            )
+            offset = (start - padded_start) * self.factor
+            block = oversampled[
+                ..., offset : offset + (end - start) * self.factor
+            ]
+            if block.size:
+                peak = max(peak, float(np.max(np.abs(block))))
+        return peak
+
+    def peak(self, values: np.ndarray) -> float:
+        samples = np.asarray(values)
+        block_samples = _exceeds_block(samples)
+        if self.factor > 1 and block_samples is not None:
+            return self._blockwise_peak(samples, block_samples)
+        entry = None if self.factor == 1 else self._memo_entry(samples)
+        if entry is not None and entry[2] is not None:
+            return entry[2]
+        oversampled = self.upsample(samples) if entry is None else entry[1]
+        peak = float(np.max(np.abs(oversampled))) if oversampled.size else 0.0
+        if entry is not None:
+            entry[2] = peak
+        return peak
+
+
+def get_oversampling_plan(
+    sample_rate: int,
+    factor: int,
+    *,
+    signal_module: Any = signal,
+) -> OversamplingPlan:
+    key = (int(sample_rate), max(int(factor), 1), id(signal_module))
+    with _OVERSAMPLING_PLANS_LOCK:
+        plan = _OVERSAMPLING_PLANS.pop(key, None)
+        if plan is None or plan.signal_module is not signal_module:
+            plan = OversamplingPlan(
+                sample_rate,
+                factor,
+                signal_module=signal_module,
+            )
+        _OVERSAMPLING_PLANS[key] = plan
+        while len(_OVERSAMPLING_PLANS) > _OVERSAMPLING_PLAN_CACHE_LIMIT:
+            _OVERSAMPLING_PLANS.pop(next(iter(_OVERSAMPLING_PLANS)))
+    return plan
+
+
+def clear_oversampling_plans() -> None:
+    with _OVERSAMPLING_PLANS_LOCK:
+        _OVERSAMPLING_PLANS.clear()
+
+
+__all__ = [
+    "OversamplingPlan",
+    "clear_oversampling_plans",
+    "get_oversampling_plan",
+    "oversampling_memo",
+]
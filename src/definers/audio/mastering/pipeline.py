@@ -13,6 +13,25 @@ from .finalization import (
     _measure_signal_crest_factor_db,
 )
 from .reference import measure_transient_density
+from .snapshots import (
+    DEFAULT_STAGE_SNAPSHOT_MEMORY_BUDGET_MB,
+    StageSnapshotStore,
+)
+
+DEFAULT_CHUNK_SECONDS = 60.0
+DEFAULT_CHUNK_OVERLAP_SECONDS = 2.0
+
+
+def _open_stage_snapshot_store(self) -> StageSnapshotStore:
+    self.last_stage_signals = {}
+    return StageSnapshotStore(
+        mode=getattr(self, "stage_snapshots", "auto"),
+        memory_budget_mb=getattr(
+            self,
+            "stage_snapshot_memory_budget_mb",
+            DEFAULT_STAGE_SNAPSHOT_MEMORY_BUDGET_MB,
+        ),
+    )
 
 
 def _prepare_processing_signal(
@@ -263,7 +282,7 @@ def process_stem(
     apply_exciter_fn: Callable[..., np.ndarray],
     log_fn: Callable[..., object],
 ) -> tuple[int, np.ndarray]:
-    stage_signals: dict[str, np.ndarray] = {}
+    stage_signals = _open_stage_snapshot_store(self)
     y = _prepare_processing_signal(
         self,
         y,
@@ -282,7 +301,7 @@ def process_stem(
 
     log_fn("Mastering", "Applying equalizer...")
     y = self.apply_eq(y)
-    stage_signals["post_eq"] = np.array(y, dtype=np.float32, copy=True)
+    stage_signals.capture("post_eq", y)
 
     log_fn("Mastering", "Applying stem cleanup...")
     y = self.apply_stem_cleanup(y, stem_role=stem_role)
@@ -296,7 +315,7 @@ def process_stem(
     )
     y = np.nan_to_num(y, nan=0.0, posinf=0.0, neginf=0.0)
 
-    stage_signals["final_in_memory"] = np.array(y, dtype=np.float32, copy=True)
+    stage_signals.capture("final_in_memory", y)
     self.last_stage_signals = stage_signals
     self.last_finalization_actions = ()
     self.last_mastering_contract = None
@@ -336,7 +355,7 @@ def process(
     measure_mastering_loudness_fn: Callable[..., object],
     log_fn: Callable[..., object],
 ) -> tuple[int, np.ndarray]:
-    stage_signals: dict[str, np.ndarray] = {}
+    stage_signals = _open_stage_snapshot_store(self)
     stem_mastered_input = bool(getattr(self, "stem_mastered_input", False))
     preserve_stem_mix_tone = stem_mastered_input
     y = _prepare_processing_signal(
@@ -360,7 +379,7 @@ def process(
     else:
         log_fn("Mastering", "Applying equalizer...")
         y = self.apply_eq(y)
-    stage_signals["post_eq"] = np.array(y, dtype=np.float32, copy=True)
+    stage_signals.capture("post_eq", y)
 
     if not stem_mastered_input:
         log_fn("Mastering", "Applying multiband compression...")
@@ -385,7 +404,7 @@ def process(
 
     log_fn("Mastering", "Applying stereo enhancement...")
     y = self.apply_spatial_enhancement(y)
-    stage_signals["post_spatial"] = np.array(y, dtype=np.float32, copy=True)
+    stage_signals.capture("post_spatial", y)
 
     log_fn("Mastering", "Applying low-end mono tightening...")
     y = self.apply_low_end_mono_tightening(y)
@@ -513,7 +532,7 @@ def process(
             low_end_mono_cutoff_hz=contract.low_end_mono_cutoff_hz,
         )
 
-    stage_signals["post_limiter"] = np.array(y, dtype=np.float32, copy=True)
+    stage_signals.capture("post_limiter", y)
 
     final_ceiling_db = self.resolve_final_true_peak_target()
     self.last_resolved_final_true_peak_target_dbfs = float(final_ceiling_db)
@@ -633,7 +652,7 @@ def process(
             )
         ),
     )
-    stage_signals["post_character"] = np.array(y, dtype=np.float32, copy=True)
+    stage_signals.capture("post_character", y)
 
     peak_catch_events: list[PeakCatchEvent] = []
     peak_catch_metrics = character_metrics
@@ -722,18 +741,16 @@ def process(
             true_peak_oversample_factor=self.true_peak_oversample_factor,
             low_end_mono_cutoff_hz=contract.low_end_mono_cutoff_hz,
         )
-    stage_signals["post_peak_catch"] = np.array(y, dtype=np.float32, copy=True)
+    stage_signals.capture("post_peak_catch", y)
     self.last_peak_catch_events = tuple(peak_catch_events)
 
     log_fn("Mastering", "Applying delivery trim...")
     y = self.apply_delivery_trim(y)
-    stage_signals["post_delivery_trim"] = np.array(
-        y, dtype=np.float32, copy=True
-    )
+    stage_signals.capture("post_delivery_trim", y)
 
     log_fn("Mastering", "Applying hard clipping...")
     y = self.apply_safety_clamp(y, ceil_db=final_ceiling_db)
-    stage_signals["post_clamp"] = np.array(y, dtype=np.float32, copy=True)
+    stage_signals.capture("post_clamp", y)
     self.last_post_clamp_metrics = measure_mastering_loudness_fn(
         y,
         self.resampling_target,
@@ -766,8 +783,66 @@ def process(
 
     y = np.nan_to_num(y, nan=0.0, posinf=0.0, neginf=0.0)
 
-    stage_signals["final_in_memory"] = np.array(y, dtype=np.float32, copy=True)
+    stage_signals.capture("final_in_memory", y)
     self.last_stage_signals = stage_signals
     self.last_finalization_actions = tuple(finalization_actions)
 
     return self.resampling_target, y
+
+
+def render_in_windows(
+    self,
+    render_fn: Callable[[np.ndarray], np.ndarray],
+    y: np.ndarray,
+    *,
+    process_audio_chunks_fn: Callable[..., np.ndarray],
+) -> np.ndarray:
+    render_window = getattr(self, "render_window", None)
+    if render_window is None or np.shape(y)[-1] <= render_window[0]:
+        return render_fn(y)
+    (chunk_size, overlap) = render_window
+    input_dtype = y.dtype
+    window_count = 0
+
+    def _render_window(window: np.ndarray) -> np.ndarray:
+        nonlocal window_count
+        window_count += 1
+        if y.ndim == 1:
+            return np.atleast_2d(render_fn(window[0]))
+        return render_fn(window)
+
+    rendered = process_audio_chunks_fn(
+        _render_window,
+        y,
+        chunk_size,
+        overlap,
+    )
+    self.last_chunked_render_windows = max(
+        int(getattr(self, "last_chunked_render_windows", 0)),
+        window_count,
+    )
+    if y.ndim == 1:
+        rendered = rendered[0]
+    return rendered.astype(input_dtype, copy=False)
+
+
+def process_chunked(
+    self,
+    y: np.ndarray,
+    sr: int | None = None,
+    *,
+    chunk_seconds: float,
+    overlap_seconds: float,
+    process_fn: Callable[..., tuple[int, np.ndarray]],
+) -> tuple[int, np.ndarray]:
+    sample_rate = int(self.resampling_target)
+    chunk_size = max(int(round(float(chunk_seconds) * sample_rate)), 1)
+    overlap = int(
+        np.clip(round(float(overlap_seconds) * sample_rate), 0, chunk_size - 1)
+    )
+    self.render_window = (chunk_size, overlap)
+    self.last_chunked_render_windows = 0
+    try:
+        return process_fn(y, sr)
+    finally:
+        self.render_window = None
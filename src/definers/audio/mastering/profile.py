@@ -8,6 +8,8 @@ np = get_numpy_module()
 
 from ..music_theory import generate_bands
 
+_PROFILE_CACHE_LIMIT = 16
+
 
 @dataclass(frozen=True, slots=True)
 class SpectralBalanceProfile:
@@ -31,7 +33,40 @@ def fit_frequency(self, frequency_hz: float) -> float:
     return float(np.clip(frequency_hz, self.low_cut, self.high_cut))
 
 
+def _target_curve_cache_key(self, f_axis: np.ndarray) -> tuple[object, ...]:
+    frequencies = np.ascontiguousarray(f_axis, dtype=np.float32)
+    return (
+        getattr(self, "resampling_target", None),
+        getattr(self, "analysis_nperseg", None),
+        getattr(self, "preset_name", None),
+        float(self._slope_db),
+        float(self.low_cut),
+        float(self.high_cut),
+        float(self.bass_transition_hz),
+        float(self.treble_transition_hz),
+        float(self.mid_slope),
+        float(self.treble_boost_db_per_oct),
+        frequencies.shape,
+        frequencies.tobytes(),
+    )
+
+
 def build_target_curve(self, f_axis: np.ndarray) -> np.ndarray:
+    cache = getattr(self, "_target_curve_cache", None)
+    if cache is None:
+        return _compute_target_curve(self, f_axis)
+    key = _target_curve_cache_key(self, f_axis)
+    target = cache.get(key)
+    if target is None:
+        target = _compute_target_curve(self, f_axis)
+        target.flags.writeable = False
+        cache[key] = target
+        while len(cache) > _PROFILE_CACHE_LIMIT:
+            cache.pop(next(iter(cache)))
+    return np.array(target, copy=True)
+
+
+def _compute_target_curve(self, f_axis: np.ndarray) -> np.ndarray:
     freqs = np.clip(
         np.asarray(f_axis, dtype=np.float32),
         self.low_cut,
@@ -120,6 +155,24 @@ def update_profile(self) -> None:
 
 
 def update_bands(self, intensity: float | None = None) -> None:
+    cache = getattr(self, "_band_cache", None)
+    key = None
+    if cache is not None:
+        key = (
+            getattr(self, "resampling_target", None),
+            getattr(self, "preset_name", None),
+            float(self._slope_db),
+            float(self.low_cut),
+            float(self.high_cut),
+            int(self.num_bands),
+            None if intensity is None else float(intensity),
+            repr(self.config),
+        )
+        bands = cache.get(key)
+        if bands is not None:
+            self.bands = [dict(band) for band in bands]
+            return
+
     count = self.num_bands
     fcs = generate_bands(self.low_cut, self.high_cut, count)
     band_config = (
@@ -133,6 +186,10 @@ def update_bands(self, intensity: float | None = None) -> None:
     self.bands = band_config.build_bands_from_fcs(
         fcs, self.low_cut, self.high_cut
     )
+    if cache is not None:
+        cache[key] = tuple(dict(band) for band in self.bands)
+        while len(cache) > _PROFILE_CACHE_LIMIT:
+            cache.pop(next(iter(cache)))
 
 
 def build_spectral_balance_profile(
@@ -8,6 +8,7 @@ from definers.runtime_numpy import get_numpy_module
 np = get_numpy_module()
 
 from ..config import SmartMasteringConfig
+from ..envelopes import boxcar_mean
 from .loudness import (
     MasteringLoudnessMetrics,
     measure_mastering_loudness,
@@ -89,8 +90,7 @@ def measure_transient_density(y: np.ndarray, sample_rate: int) -> float:
 
     delta = np.abs(np.diff(mono, prepend=mono[0]))
     window_size = max(int(round(sample_rate * 0.01)), 1)
-    kernel = np.ones(window_size, dtype=np.float32) / float(window_size)
-    smoothed = np.convolve(delta, kernel, mode="same")
+    smoothed = boxcar_mean(delta, window_size)
     threshold = float(np.mean(smoothed) + np.std(smoothed))
     if not np.isfinite(threshold) or threshold <= 0.0:
         return 0.0
@@ -114,17 +114,12 @@ def measure_stereo_motion(y: np.ndarray, sample_rate: int) -> float:
 
     left = signal[0]
     right = signal[1]
-    emphasized_left = np.diff(left, prepend=left[0])
-    emphasized_right = np.diff(right, prepend=right[0])
+    emphasized = np.diff(signal[:2], axis=-1, prepend=signal[:2, :1])
     window_size = max(int(round(sample_rate * 0.05)), 3)
     if window_size % 2 == 0:
         window_size += 1
-    kernel = np.ones(window_size, dtype=np.float32) / float(window_size)
-    left_energy = np.convolve(
-        emphasized_left * emphasized_left, kernel, mode="same"
-    )
-    right_energy = np.convolve(
-        emphasized_right * emphasized_right, kernel, mode="same"
+    left_energy, right_energy = boxcar_mean(
+        emphasized * emphasized, window_size
     )
     balance = (left_energy - right_energy) / np.maximum(
         left_energy + right_energy, 1e-6
@@ -137,10 +132,8 @@ def measure_stereo_motion(y: np.ndarray, sample_rate: int) -> float:
     )
     balance = np.clip(balance, -1.0, 1.0)
 
-    mid = 0.5 * (left + right)
-    side = 0.5 * (left - right)
-    mid_energy = np.convolve(mid * mid, kernel, mode="same")
-    side_energy = np.convolve(side * side, kernel, mode="same")
+    mid_side = np.stack([0.5 * (left + right), 0.5 * (left - right)])
+    mid_energy, side_energy = boxcar_mean(mid_side * mid_side, window_size)
     width_series = side_energy / np.maximum(mid_energy + side_energy, 1e-6)
     balance_delta = np.abs(np.diff(balance, prepend=balance[0]))
     width_delta = np.abs(np.diff(width_series, prepend=width_series[0]))
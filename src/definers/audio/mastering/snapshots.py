@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import weakref
+from collections.abc import Iterator, Mapping
+
+from definers.runtime_numpy import get_numpy_module
+
+np = get_numpy_module()
+
+STAGE_SNAPSHOT_MODES = ("auto", "memory", "off")
+DEFAULT_STAGE_SNAPSHOT_MEMORY_BUDGET_MB = 1024.0
+
+
+def resolve_stage_snapshot_mode(mode: str) -> str:
+    normalized_mode = str(mode).strip().lower()
+    if normalized_mode not in STAGE_SNAPSHOT_MODES:
+        raise ValueError(
+            f"Unsupported stage snapshot mode: {mode!r}; "
+            f"expected one of {', '.join(STAGE_SNAPSHOT_MODES)}"
+        )
+    return normalized_mode
+
+
+def _remove_spill_directory(directory: str) -> None:
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+class StageSnapshotStore(Mapping):
+    def __init__(
+        self,
+        *,
+        mode: str = "auto",
+        memory_budget_mb: float = DEFAULT_STAGE_SNAPSHOT_MEMORY_BUDGET_MB,
+        spill_dir: str | None = None,
+    ) -> None:
+        self.mode = resolve_stage_snapshot_mode(mode)
+        self.memory_budget_bytes = int(
+            max(float(memory_budget_mb), 0.0) * 1024 * 1024
+        )
+        self.spill_dir = spill_dir
+        self._snapshots: dict[str, np.ndarray] = {}
+        self._spill_paths: dict[str, str] = {}
+        self._directory: str | None = None
+        self._finalizer = None
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self._snapshots[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._snapshots)
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    @property
+    def memory_bytes(self) -> int:
+        return sum(
+            snapshot.nbytes
+            for name, snapshot in self._snapshots.items()
+            if name not in self._spill_paths
+        )
+
+    @property
+    def spilled_bytes(self) -> int:
+        return sum(self._snapshots[name].nbytes for name in self._spill_paths)
+
+    @property
+    def spilled_stages(self) -> tuple[str, ...]:
+        return tuple(self._spill_paths)
+
+    def capture(self, name: str, signal: np.ndarray) -> None:
+        if self.mode == "off":
+            return
+        self.discard(name)
+        values = np.asarray(signal)
+        if (
+            self.mode == "auto"
+            and values.size > 0
+            and self.memory_bytes + values.size * 4 > self.memory_budget_bytes
+        ):
+            self._snapshots[name] = self._spill(name, values)
+            return
+        self._snapshots[name] = np.array(values, dtype=np.float32, copy=True)
+
+    def discard(self, name: str) -> None:
+        self._snapshots.pop(name, None)
+        spill_path = self._spill_paths.pop(name, None)
+        if spill_path is not None:
+            try:
+                os.remove(spill_path)
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        self._snapshots.clear()
+        self._spill_paths.clear()
+        if self._finalizer is not None:
+            self._finalizer()
+        self._directory = None
+        self._finalizer = None
+
+    def _spill(self, name: str, values: np.ndarray) -> np.ndarray:
+        if self._directory is None:
+            self._directory = tempfile.mkdtemp(
+                prefix="definers-stages-",
+                dir=self.spill_dir,
+            )
+            self._finalizer = weakref.finalize(
+                self,
+                _remove_spill_directory,
+                self._directory,
+            )
+        spill_path = os.path.join(self._directory, f"{name}.npy")
+        spilled = np.lib.format.open_memmap(
+            spill_path,
+            mode="w+",
+            dtype=np.float32,
+            shape=values.shape,
+        )
+        spilled[...] = values
+        spilled.flush()
+        del spilled
+        self._spill_paths[name] = spill_path
+        return np.load(spill_path, mmap_mode="c")
+
+
+__all__ = [
+    "DEFAULT_STAGE_SNAPSHOT_MEMORY_BUDGET_MB",
+    "STAGE_SNAPSHOT_MODES",
+    "StageSnapshotStore",
+    "resolve_stage_snapshot_mode",
+]
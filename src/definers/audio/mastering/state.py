@@ -241,6 +241,8 @@ def configure_runtime_state(
         np.clip(cfg.stereo_motion_max_side_boost, 0.0, 0.3)
     )
     self.last_stage_signals = {}
+    self.render_window = None
+    self.last_chunked_render_windows = 0
     self.last_finalization_actions = ()
     self.last_mastering_contract = None
     self.last_reference_analysis = None
@@ -272,6 +274,8 @@ def configure_runtime_state(
     self.stem_cleanup_provenance = {}
     self.last_input_material_profile = None
 
+    self._target_curve_cache = {}
+    self._band_cache = {}
     self.update_profile()
     self.update_bands()
 
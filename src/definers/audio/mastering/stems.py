@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import os
 from collections.abc import Callable, Mapping, Sequence
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
+from multiprocessing import shared_memory
 from pathlib import Path
 
 from definers.runtime_numpy import get_numpy_module
@@ -20,6 +21,15 @@ class StemMasteringPlan:
     overrides: dict[str, float | str | None]
 
 
+@dataclass(frozen=True, slots=True)
+class _SharedStemSignal:
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+
+_STEM_EXECUTION_MODES = ("thread", "process")
+_STEM_PROCESS_CONTEXT: dict[str, object] = {}
 _STEM_SUM_ATTENUATION_LINEAR = float(10.0 ** (-6.0 / 20.0))
 _STEM_SAVED_PEAK_CEILING_LINEAR = 0.98
 _STEM_TONE_ENRICHMENT_PEAK_GROWTH_LIMIT = 1.08
@@ -651,6 +661,128 @@ def _resolve_parallel_stem_workers(stem_count: int) -> int:
     return max(1, min(stem_count, cpu_count, 4))
 
 
+def _resolve_process_stem_workers(stem_count: int) -> int:
+    if stem_count <= 1:
+        return 1
+    cpu_count = os.cpu_count() or 1
+    return max(1, min(stem_count, cpu_count))
+
+
+def _share_stem_signal(
+    signal: np.ndarray,
+) -> tuple[shared_memory.SharedMemory, _SharedStemSignal]:
+    array = np.ascontiguousarray(signal)
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+    return block, _SharedStemSignal(
+        name=block.name,
+        shape=tuple(array.shape),
+        dtype=array.dtype.str,
+    )
+
+
+def _read_shared_stem_signal(
+    handle: _SharedStemSignal,
+    *,
+    unlink: bool = False,
+) -> np.ndarray:
+    block = shared_memory.SharedMemory(name=handle.name)
+    try:
+        return np.array(
+            np.ndarray(handle.shape, dtype=handle.dtype, buffer=block.buf),
+            copy=True,
+        )
+    finally:
+        block.close()
+        if unlink:
+            block.unlink()
+
+
+def _release_shared_stem_signal(handle: _SharedStemSignal) -> None:
+    try:
+        block = shared_memory.SharedMemory(name=handle.name)
+    except FileNotFoundError:
+        return
+    block.close()
+    block.unlink()
+
+
+def _initialize_stem_process_worker(context: dict[str, object]) -> None:
+    _STEM_PROCESS_CONTEXT.clear()
+    _STEM_PROCESS_CONTEXT.update(context)
+    if _STEM_PROCESS_CONTEXT.get("pitch_shift_fn") is None:
+        _STEM_PROCESS_CONTEXT["pitch_shift_fn"] = _load_pitch_shift_fn()
+
+
+def _master_stem_in_process(
+    plan: StemMasteringPlan,
+    stem_sample_rate: int,
+    stem_signal: _SharedStemSignal,
+    stem_kwargs: dict[str, object],
+) -> tuple[int, _SharedStemSignal]:
+    processed_sample_rate, balanced_signal = _master_stem_signal(
+        plan,
+        _read_shared_stem_signal(stem_signal),
+        stem_sample_rate,
+        stem_kwargs=stem_kwargs,
+        **_STEM_PROCESS_CONTEXT,
+    )
+    block, handle = _share_stem_signal(balanced_signal)
+    block.close()
+    return processed_sample_rate, handle
+
+
+def _process_stems_in_worker_processes(
+    stem_jobs: Sequence[
+        tuple[StemMasteringPlan, int, np.ndarray, dict[str, object]]
+    ],
+    *,
+    context: dict[str, object],
+) -> dict[str, tuple[int, np.ndarray]]:
+    shared_blocks: list[shared_memory.SharedMemory] = []
+    mastered_layers: dict[str, tuple[int, np.ndarray]] = {}
+    futures = []
+    collected = set()
+    try:
+        submissions = []
+        for plan, stem_sample_rate, stem_signal, stem_kwargs in stem_jobs:
+            block, handle = _share_stem_signal(stem_signal)
+            shared_blocks.append(block)
+            submissions.append((plan, stem_sample_rate, handle, stem_kwargs))
+        with ProcessPoolExecutor(
+            max_workers=_resolve_process_stem_workers(len(submissions)),
+            initializer=_initialize_stem_process_worker,
+            initargs=(context,),
+        ) as executor:
+            futures = [
+                executor.submit(_master_stem_in_process, *submission)
+                for submission in submissions
+            ]
+            for (plan, *_rest), future in zip(
+                submissions, futures, strict=True
+            ):
+                processed_sample_rate, handle = future.result()
+                collected.add(future)
+                mastered_layers[plan.stem_name] = (
+                    processed_sample_rate,
+                    _read_shared_stem_signal(handle, unlink=True),
+                )
+    finally:
+        for future in futures:
+            if (
+                future in collected
+                or not future.done()
+                or future.cancelled()
+                or future.exception() is not None
+            ):
+                continue
+            _release_shared_stem_signal(future.result()[1])
+        for block in shared_blocks:
+            block.close()
+            block.unlink()
+    return mastered_layers
+
+
 def _fast_pitch_shift_channel(
     channel: np.ndarray,
     semitones: float,
@@ -2032,6 +2164,59 @@ def mix_stem_layers(
     return resolved_sample_rate, mixed
 
 
+def _master_stem_signal(
+    plan: StemMasteringPlan,
+    stem_signal: np.ndarray,
+    stem_sample_rate: int,
+    *,
+    base_config: SmartMasteringConfig,
+    base_mastering_kwargs: Mapping[str, object],
+    process_stem_fn: Callable[
+        [np.ndarray, int, dict[str, object]], tuple[int, np.ndarray]
+    ],
+    pitch_shift_fn: Callable[[np.ndarray, int, float], np.ndarray] | None,
+    input_analysis: object,
+    quality_flags: tuple[str, ...],
+    stem_kwargs: Mapping[str, object],
+) -> tuple[int, np.ndarray]:
+    mastering_kwargs = dict(base_mastering_kwargs)
+    mastering_kwargs.update(plan.overrides)
+    mastering_kwargs["stem_role"] = plan.stem_name
+    mastering_kwargs["input_analysis"] = input_analysis
+    mastering_kwargs["separator_quality_flags"] = quality_flags
+    mastering_kwargs.update(stem_kwargs)
+    processed_sample_rate, processed_signal = process_stem_fn(
+        stem_signal,
+        stem_sample_rate,
+        mastering_kwargs,
+    )
+    processed_signal = _sanitize_stem_signal(
+        processed_signal,
+        peak_ceiling=_STEM_SAVED_PEAK_CEILING_LINEAR,
+    )
+    finished_signal = _apply_stem_role_finish(
+        processed_signal,
+        processed_sample_rate,
+        plan.stem_name,
+        base_config,
+        pitch_shift_fn=pitch_shift_fn,
+        stem_overrides=plan.overrides,
+    )
+    balanced_signal, _applied_mix_gain_db = _apply_stem_mix_balance(
+        finished_signal,
+        plan.stem_name,
+        plan.mix_gain_db,
+        vocal_pullback_db=float(
+            np.clip(
+                getattr(base_config, "stem_vocal_pullback_db", 0.0),
+                0.0,
+                3.0,
+            )
+        ),
+    )
+    return processed_sample_rate, balanced_signal
+
+
 def process_stem_layers(
     audio_path: str,
     *,
@@ -2057,13 +2242,24 @@ def process_stem_layers(
     mastered_stems_bit_depth: int = 32,
     mastered_stems_bitrate: int = 320,
     mastered_stems_compression_level: int = 9,
+    stem_execution: str = "thread",
 ) -> tuple[int, np.ndarray]:
+    resolved_stem_execution = str(stem_execution).strip().lower()
+    if resolved_stem_execution not in _STEM_EXECUTION_MODES:
+        raise ValueError(f"Unsupported stem execution mode: {stem_execution!r}")
     separated_output_dir: str | None = None
-    resolved_pitch_shift_fn = pitch_shift_fn or _load_pitch_shift_fn()
     resolved_quality_flags = tuple(
         str(flag).strip() for flag in quality_flags if str(flag).strip()
     )
     input_analysis = getattr(base_config, "input_analysis", None)
+    stem_context: dict[str, object] = {
+        "base_config": base_config,
+        "base_mastering_kwargs": dict(base_mastering_kwargs),
+        "process_stem_fn": process_stem_fn,
+        "pitch_shift_fn": pitch_shift_fn,
+        "input_analysis": input_analysis,
+        "quality_flags": resolved_quality_flags,
+    }
 
     get_stem_separation_provenance = None
     try:
@@ -2089,10 +2285,10 @@ def process_stem_layers(
         bind_download_activity_scope = None
         activity_scope_id = None
 
-    def _run_single_stem(
+    def _read_stem_job(
         stem_name: str,
         stem_path: str,
-    ) -> tuple[str, tuple[int, np.ndarray]]:
+    ) -> tuple[StemMasteringPlan, int, np.ndarray, dict[str, object]]:
         plan = resolve_stem_mastering_plan(
             stem_name,
             base_config,
@@ -2100,51 +2296,31 @@ def process_stem_layers(
             quality_flags=resolved_quality_flags,
         )
         stem_sample_rate, stem_signal = read_audio_fn(stem_path)
-        mastering_kwargs = dict(base_mastering_kwargs)
-        mastering_kwargs.update(plan.overrides)
-        mastering_kwargs["stem_role"] = plan.stem_name
-        mastering_kwargs["input_analysis"] = input_analysis
-        mastering_kwargs["separator_quality_flags"] = resolved_quality_flags
+        stem_kwargs: dict[str, object] = {}
         if callable(get_stem_separation_provenance):
-            mastering_kwargs["stem_cleanup_provenance"] = (
+            stem_kwargs["stem_cleanup_provenance"] = (
                 get_stem_separation_provenance(
                     stem_path,
                     output_dir=separated_output_dir,
                     stem_name=plan.stem_name,
                 )
             )
-        processed_sample_rate, processed_signal = process_stem_fn(
+        return plan, stem_sample_rate, stem_signal, stem_kwargs
+
+    def _run_single_stem(
+        stem_name: str,
+        stem_path: str,
+    ) -> tuple[str, tuple[int, np.ndarray]]:
+        plan, stem_sample_rate, stem_signal, stem_kwargs = _read_stem_job(
+            stem_name,
+            stem_path,
+        )
+        return plan.stem_name, _master_stem_signal(
+            plan,
             stem_signal,
             stem_sample_rate,
-            mastering_kwargs,
-        )
-        processed_signal = _sanitize_stem_signal(
-            processed_signal,
-            peak_ceiling=_STEM_SAVED_PEAK_CEILING_LINEAR,
-        )
-        finished_signal = _apply_stem_role_finish(
-            processed_signal,
-            processed_sample_rate,
-            plan.stem_name,
-            base_config,
-            pitch_shift_fn=resolved_pitch_shift_fn,
-            stem_overrides=plan.overrides,
-        )
-        balanced_signal, _applied_mix_gain_db = _apply_stem_mix_balance(
-            finished_signal,
-            plan.stem_name,
-            plan.mix_gain_db,
-            vocal_pullback_db=float(
-                np.clip(
-                    getattr(base_config, "stem_vocal_pullback_db", 0.0),
-                    0.0,
-                    3.0,
-                )
-            ),
-        )
-        return plan.stem_name, (
-            processed_sample_rate,
-            balanced_signal,
+            stem_kwargs=stem_kwargs,
+            **stem_context,
         )
 
     def process_single_stem(
@@ -2170,29 +2346,44 @@ def process_stem_layers(
             raise ValueError("No mastering stems were produced")
 
         mastered_layers: dict[str, tuple[int, np.ndarray]] = {}
-        worker_count = _resolve_parallel_stem_workers(len(stem_paths))
-        if worker_count <= 1:
-            for stem_name, stem_path in stem_paths.items():
-                normalized_name, processed_result = process_single_stem(
-                    stem_name,
-                    stem_path,
-                )
-                mastered_layers[normalized_name] = processed_result
+        if (
+            resolved_stem_execution == "process"
+            and _resolve_process_stem_workers(len(stem_paths)) > 1
+        ):
+            mastered_layers = _process_stems_in_worker_processes(
+                [
+                    _read_stem_job(stem_name, stem_path)
+                    for stem_name, stem_path in stem_paths.items()
+                ],
+                context=stem_context,
+            )
         else:
-            with ThreadPoolExecutor(max_workers=worker_count) as executor:
-                future_by_stem = {
-                    stem_name: executor.submit(
-                        process_single_stem,
+            stem_context["pitch_shift_fn"] = (
+                pitch_shift_fn or _load_pitch_shift_fn()
+            )
+            worker_count = _resolve_parallel_stem_workers(len(stem_paths))
+            if worker_count <= 1:
+                for stem_name, stem_path in stem_paths.items():
+                    normalized_name, processed_result = process_single_stem(
                         stem_name,
                         stem_path,
                     )
-                    for stem_name, stem_path in stem_paths.items()
-                }
-                for stem_name in stem_paths:
-                    normalized_name, processed_result = future_by_stem[
-                        stem_name
-                    ].result()
                     mastered_layers[normalized_name] = processed_result
+            else:
+                with ThreadPoolExecutor(max_workers=worker_count) as executor:
+                    future_by_stem = {
+                        stem_name: executor.submit(
+                            process_single_stem,
+                            stem_name,
+                            stem_path,
+                        )
+                        for stem_name, stem_path in stem_paths.items()
+                    }
+                    for stem_name in stem_paths:
+                        normalized_name, processed_result = future_by_stem[
+                            stem_name
+                        ].result()
+                        mastered_layers[normalized_name] = processed_result
 
         adaptive_remix_gains_db = _resolve_adaptive_remix_role_gains(
             tuple(mastered_layers.keys()),
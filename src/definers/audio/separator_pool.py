@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+
+DEFAULT_SEPARATOR_POOL_SIZE = 4
+
+
+def _freeze_separator_option(value: object) -> object:
+    if isinstance(value, Mapping):
+        return tuple(
+            sorted(
+                (str(key), _freeze_separator_option(item))
+                for key, item in value.items()
+            )
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_separator_option(item) for item in value)
+    return value
+
+
+def separator_pool_key(
+    separator_class: type,
+    model_filename: str,
+    separator_kwargs: Mapping[str, object],
+) -> tuple[object, ...]:
+    options = {
+        key: value
+        for key, value in separator_kwargs.items()
+        if key != "output_dir"
+    }
+    return (
+        separator_class,
+        str(model_filename),
+        _freeze_separator_option(options),
+    )
+
+
+def retarget_separator_output(separator: object, output_dir: str) -> None:
+    separator.output_dir = output_dir
+    model_instance = getattr(separator, "model_instance", None)
+    if model_instance is not None and hasattr(model_instance, "output_dir"):
+        model_instance.output_dir = output_dir
+
+
+class SeparatorPool:
+    def __init__(self, max_resident: int = DEFAULT_SEPARATOR_POOL_SIZE):
+        self.max_resident = max(int(max_resident), 0)
+        self._idle: OrderedDict[tuple[object, ...], list[object]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(separators) for separators in self._idle.values())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._idle.clear()
+
+    def _checkout(self, key: tuple[object, ...]) -> object | None:
+        with self._lock:
+            separators = self._idle.get(key)
+            if not separators:
+                return None
+            separator = separators.pop()
+            if not separators:
+                del self._idle[key]
+            return separator
+
+    def _checkin(self, key: tuple[object, ...], separator: object) -> None:
+        with self._lock:
+            self._idle.setdefault(key, []).append(separator)
+            self._idle.move_to_end(key)
+            resident = sum(
+                len(separators) for separators in self._idle.values()
+            )
+            while resident > self.max_resident and self._idle:
+                (oldest_key, separators) = next(iter(self._idle.items()))
+                separators.pop(0)
+                resident -= 1
+                if not separators:
+                    del self._idle[oldest_key]
+
+    @contextmanager
+    def lease(
+        self,
+        separator_class: type,
+        model_filename: str,
+        separator_kwargs: Mapping[str, object],
+    ) -> Iterator[object]:
+        key = separator_pool_key(
+            separator_class, model_filename, separator_kwargs
+        )
+        output_dir = str(separator_kwargs["output_dir"])
+        separator = self._checkout(key)
+        if separator is None:
+            separator = separator_class(**separator_kwargs)
+            separator.load_model(model_filename=model_filename)
+        else:
+            retarget_separator_output(separator, output_dir)
+        yield separator
+        self._checkin(key, separator)
+
+
+DEFAULT_SEPARATOR_POOL = SeparatorPool()
+
+
+def clear_separator_pool() -> None:
+    DEFAULT_SEPARATOR_POOL.clear()
+
+
+__all__ = [
+    "DEFAULT_SEPARATOR_POOL",
+    "DEFAULT_SEPARATOR_POOL_SIZE",
+    "SeparatorPool",
+    "clear_separator_pool",
+    "retarget_separator_output",
+    "separator_pool_key",
+]
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from collections.abc import Mapping
+from pathlib import Path
+
+from definers.logger import init_logger
+
+STEM_CACHE_VERSION = 1
+DEFAULT_STEM_CACHE_MAX_BYTES = 4 << 30
+_MANIFEST_NAME = "manifest.json"
+_HASH_CHUNK_BYTES = 1 << 20
+
+_logger = init_logger()
+
+
+def stem_cache_max_bytes() -> int:
+    configured_value = os.environ.get(
+        "DEFINERS_STEM_CACHE_MAX_BYTES",
+        str(DEFAULT_STEM_CACHE_MAX_BYTES),
+    ).strip()
+    try:
+        return max(int(float(configured_value)), 0)
+    except Exception:
+        return DEFAULT_STEM_CACHE_MAX_BYTES
+
+
+def stem_cache_root() -> str:
+    from definers.system.output_paths import managed_output_dir
+
+    return managed_output_dir("audio", "stem-cache")
+
+
+def audio_content_hash(audio_path: str) -> str | None:
+    digest = hashlib.sha256()
+    try:
+        with open(audio_path, "rb") as handle:
+            for chunk in iter(lambda: handle.read(_HASH_CHUNK_BYTES), b""):
+                digest.update(chunk)
+    except (OSError, TypeError, ValueError):
+        return None
+    return digest.hexdigest()
+
+
+def _settings_json_default(value: object) -> object:
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    return repr(value)
+
+
+def stem_cache_key(audio_path: str, **settings: object) -> str | None:
+    content_hash = audio_content_hash(audio_path)
+    if content_hash is None:
+        return None
+    payload = json.dumps(
+        {
+            "version": STEM_CACHE_VERSION,
+            "content": content_hash,
+            "settings": settings,
+        },
+        sort_keys=True,
+        default=_settings_json_default,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _entry_dir(cache_key: str) -> Path:
+    return Path(stem_cache_root()) / cache_key
+
+
+def _read_manifest(entry_dir: Path) -> dict[str, object] | None:
+    try:
+        with open(entry_dir / _MANIFEST_NAME, encoding="utf-8") as handle:
+            manifest = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != STEM_CACHE_VERSION:
+        return None
+    return manifest
+
+
+def load_cached_stems(
+    cache_key: str | None,
+    output_root: str,
+) -> tuple[dict[str, str], dict[str, dict[str, object]]] | None:
+    if cache_key is None:
+        return None
+    entry_dir = _entry_dir(cache_key)
+    manifest = _read_manifest(entry_dir)
+    if manifest is None:
+        return None
+    final_dir = Path(output_root) / "final"
+    stem_paths: dict[str, str] = {}
+    try:
+        final_dir.mkdir(parents=True, exist_ok=True)
+        for stem_name, file_name in manifest["stems"].items():
+            destination_path = final_dir / file_name
+            shutil.copyfile(entry_dir / file_name, destination_path)
+            stem_paths[stem_name] = str(destination_path)
+        os.utime(entry_dir / _MANIFEST_NAME)
+    except (OSError, KeyError, AttributeError):
+        for stem_path in stem_paths.values():
+            Path(stem_path).unlink(missing_ok=True)
+        return None
+    provenance = {
+        stem_name: {
+            **values,
+            "quality_flags": tuple(values.get("quality_flags", ())),
+        }
+        for stem_name, values in manifest.get("provenance", {}).items()
+    }
+    return stem_paths, provenance
+
+
+def store_cached_stems(
+    cache_key: str | None,
+    stem_paths: Mapping[str, str],
+    provenance: Mapping[str, Mapping[str, object]],
+) -> bool:
+    if cache_key is None or not stem_paths:
+        return False
+    entry_dir = _entry_dir(cache_key)
+    if entry_dir.is_dir():
+        return True
+    staging_dir = entry_dir.parent / f".{cache_key}.{uuid.uuid4().hex}"
+    try:
+        staging_dir.mkdir(parents=True)
+        stem_files: dict[str, str] = {}
+        for stem_name, stem_path in stem_paths.items():
+            file_name = Path(stem_path).name
+            shutil.copyfile(stem_path, staging_dir / file_name)
+            stem_files[stem_name] = file_name
+        with open(
+            staging_dir / _MANIFEST_NAME, "w", encoding="utf-8"
+        ) as handle:
+            json.dump(
+                {
+                    "version": STEM_CACHE_VERSION,
+                    "stems": stem_files,
+                    "provenance": {
+                        stem_name: dict(values)
+                        for stem_name, values in provenance.items()
+                    },
+                },
+                handle,
+            )
+        os.replace(staging_dir, entry_dir)
+    except OSError as error:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        if entry_dir.is_dir():
+            return True
+        _logger.warning("Could not cache separated stems: %s", error)
+        return False
+    evict_stem_cache()
+    return True
+
+
+def _entry_size(entry_dir: Path) -> int:
+    size = 0
+    for file_path in entry_dir.iterdir():
+        try:
+            size += file_path.stat().st_size
+        except OSError:
+            continue
+    return size
+
+
+def evict_stem_cache(max_bytes: int | None = None) -> int:
+    if max_bytes is None:
+        max_bytes = stem_cache_max_bytes()
+    entries = []
+    for entry_dir in Path(stem_cache_root()).iterdir():
+        if not entry_dir.is_dir() or entry_dir.name.startswith("."):
+            continue
+        try:
+            last_used = (entry_dir / _MANIFEST_NAME).stat().st_mtime
+        except OSError:
+            last_used = 0.0
+        entries.append((last_used, entry_dir, _entry_size(entry_dir)))
+    entries.sort(key=lambda entry: entry[0])
+    total_bytes = sum(size for _last_used, _entry_dir, size in entries)
+    removed_bytes = 0
+    for _last_used, entry_dir, size in entries:
+        if total_bytes <= max_bytes:
+            break
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        total_bytes -= size
+        removed_bytes += size
+    return removed_bytes
+
+
+__all__ = [
+    "DEFAULT_STEM_CACHE_MAX_BYTES",
+    "STEM_CACHE_VERSION",
+    "audio_content_hash",
+    "evict_stem_cache",
+    "load_cached_stems",
+    "stem_cache_key",
+    "stem_cache_max_bytes",
+    "stem_cache_root",
+    "store_cached_stems",
+]
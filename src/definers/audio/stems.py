@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import contextvars
 import os
 import re
+import shutil
+import tempfile
 import uuid
 from collections.abc import Mapping, Sequence
 from contextlib import nullcontext
@@ -20,6 +23,8 @@ from definers.text import random_string
 from .dependencies import librosa_module
 from .file_processing import normalize_audio_to_peak
 from .io import read_audio, save_audio
+from .separator_pool import DEFAULT_SEPARATOR_POOL
+from .stem_cache import load_cached_stems, stem_cache_key, store_cached_stems
 
 _logger = init_logger()
 
@@ -79,6 +84,13 @@ class MasteringSeparatorPlan:
     instrumental_cleanup_stage: SeparatorModelStage | None
 
 
+STAGE_HANDOFF_MODES = ("disk", "memory")
+_DEFAULT_STAGE_SCRATCH_ROOT = "/dev/shm"
+_STAGE_SCRATCH_MIN_FREE_BYTES = 1 << 30
+_STAGE_SIGNALS: contextvars.ContextVar[dict[tuple, np.ndarray] | None] = (
+    contextvars.ContextVar("definers_stage_signals", default=None)
+)
+
 _STEM_SEPARATION_PROVENANCE_BY_OUTPUT_PATH: dict[str, dict[str, object]] = {}
 _STEM_SEPARATION_PROVENANCE_BY_OUTPUT_DIR: dict[
     str, dict[str, dict[str, object]]
@@ -192,6 +204,56 @@ def get_stem_separation_provenance(
     return _empty_stem_separation_provenance()
 
 
+def _restore_stem_separation_provenance(
+    output_root: str,
+    written_paths: Mapping[str, str],
+    provenance_by_stem: Mapping[str, Mapping[str, object]],
+) -> None:
+    output_provenance: dict[str, dict[str, object]] = {}
+    for stem_name, output_path in written_paths.items():
+        provenance = provenance_by_stem.get(stem_name)
+        if provenance is None:
+            continue
+        output_provenance[_canonicalize_stem_name(stem_name)] = dict(provenance)
+        _STEM_SEPARATION_PROVENANCE_BY_OUTPUT_PATH[str(Path(output_path))] = (
+            dict(provenance)
+        )
+    if output_provenance:
+        _STEM_SEPARATION_PROVENANCE_BY_OUTPUT_DIR[str(Path(output_root))] = (
+            output_provenance
+        )
+
+
+def _load_cached_stem_layers(
+    cache_key: str | None,
+    output_root: str,
+) -> dict[str, str] | None:
+    cached = load_cached_stems(cache_key, output_root)
+    if cached is None:
+        return None
+    (stem_paths, provenance_by_stem) = cached
+    _restore_stem_separation_provenance(
+        output_root,
+        stem_paths,
+        provenance_by_stem,
+    )
+    return stem_paths
+
+
+def _store_cached_stem_layers(
+    cache_key: str | None,
+    stem_paths: Mapping[str, str],
+) -> None:
+    store_cached_stems(
+        cache_key,
+        stem_paths,
+        {
+            stem_name: get_stem_separation_provenance(stem_path)
+            for stem_name, stem_path in stem_paths.items()
+        },
+    )
+
+
 def _normalize_model_name(value: str, *, option_name: str) -> str:
     normalized = str(value).strip()
     if not normalized:
@@ -695,15 +757,16 @@ def _run_separator_stage(
     for model_candidate in runtime_model_candidates:
         _prepare_stage_directory(output_dir)
         try:
-            separator = Separator(
-                **_build_separator_kwargs(
+            with DEFAULT_SEPARATOR_POOL.lease(
+                Separator,
+                model_candidate,
+                _build_separator_kwargs(
                     output_dir,
                     target_sample_rate,
                     shifts=shifts,
-                )
-            )
-            separator.load_model(model_filename=model_candidate)
-            output_files = separator.separate(input_path)
+                ),
+            ) as separator:
+                output_files = separator.separate(input_path)
             resolved_output_files = _resolve_output_paths(
                 output_files, output_dir
             )
@@ -756,14 +819,6 @@ def _run_separator_stage_batch(
     for model_candidate in runtime_model_candidates:
         _prepare_stage_directory(output_dir)
         try:
-            separator = Separator(
-                **_build_separator_kwargs(
-                    output_dir,
-                    target_sample_rate,
-                    shifts=shifts,
-                )
-            )
-            separator.load_model(model_filename=model_candidate)
             batch_input: str | list[str]
             if len(batched_input_paths) == 1:
                 batch_input = str(batched_input_paths[0])
@@ -771,17 +826,26 @@ def _run_separator_stage_batch(
                 batch_input = [
                     str(input_path) for input_path in batched_input_paths
                 ]
-            try:
-                output_files = separator.separate(batch_input)
-            except Exception as error:
-                if len(batched_input_paths) <= 1:
-                    raise
-                if not _separator_requires_single_input(error):
-                    raise
-                output_files = _run_loaded_separator_for_each_input(
-                    separator,
-                    batched_input_paths,
-                )
+            with DEFAULT_SEPARATOR_POOL.lease(
+                Separator,
+                model_candidate,
+                _build_separator_kwargs(
+                    output_dir,
+                    target_sample_rate,
+                    shifts=shifts,
+                ),
+            ) as separator:
+                try:
+                    output_files = separator.separate(batch_input)
+                except Exception as error:
+                    if len(batched_input_paths) <= 1:
+                        raise
+                    if not _separator_requires_single_input(error):
+                        raise
+                    output_files = _run_loaded_separator_for_each_input(
+                        separator,
+                        batched_input_paths,
+                    )
             resolved_output_files = _resolve_output_paths(
                 output_files, output_dir
             )
@@ -828,10 +892,10 @@ def _resample_audio_array(
     original_sample_rate: int,
     target_sample_rate: int,
 ) -> np.ndarray:
-    librosa = librosa_module()
     audio_array = _as_audio_array(audio_signal)
     if int(original_sample_rate) == int(target_sample_rate):
         return audio_array.astype(np.float32, copy=False)
+    librosa = librosa_module()
     resampled_channels = [
         librosa.resample(
             np.asarray(channel, dtype=np.float32),
@@ -977,9 +1041,82 @@ def _prefer_preserved_optional_stage_output(
     return source_path
 
 
+def _stage_signal_key(
+    audio_path: str,
+    target_sample_rate: int,
+) -> tuple | None:
+    try:
+        stat_result = os.stat(audio_path)
+    except (OSError, TypeError, ValueError):
+        return None
+    return (
+        os.path.abspath(audio_path),
+        stat_result.st_mtime_ns,
+        stat_result.st_size,
+        int(target_sample_rate),
+    )
+
+
+def _remember_stage_signal(
+    audio_path: str,
+    target_sample_rate: int,
+    audio_signal: np.ndarray,
+) -> None:
+    stage_signals = _STAGE_SIGNALS.get()
+    if stage_signals is None:
+        return
+    signal_key = _stage_signal_key(audio_path, target_sample_rate)
+    if signal_key is None:
+        return
+    stage_signal = _as_audio_array(audio_signal)
+    stage_signal.flags.writeable = False
+    stage_signals[signal_key] = stage_signal
+
+
 def _read_stage_signal(audio_path: str, target_sample_rate: int) -> np.ndarray:
+    stage_signals = _STAGE_SIGNALS.get()
+    signal_key = None
+    if stage_signals is not None:
+        signal_key = _stage_signal_key(audio_path, target_sample_rate)
+        if signal_key in stage_signals:
+            return stage_signals[signal_key]
     sample_rate, audio_signal = read_audio(audio_path)
-    return _resample_audio_array(audio_signal, sample_rate, target_sample_rate)
+    stage_signal = _resample_audio_array(
+        audio_signal, sample_rate, target_sample_rate
+    )
+    if signal_key is not None:
+        stage_signal.flags.writeable = False
+        stage_signals[signal_key] = stage_signal
+    return stage_signal
+
+
+def stage_scratch_root() -> str | None:
+    configured_root = os.environ.get("DEFINERS_STAGE_SCRATCH_DIR", "").strip()
+    if configured_root:
+        return str(Path(configured_root).expanduser())
+    if os.path.isdir(_DEFAULT_STAGE_SCRATCH_ROOT):
+        return _DEFAULT_STAGE_SCRATCH_ROOT
+    return None
+
+
+def _create_stage_scratch_dir(output_root: str) -> str | None:
+    scratch_root = stage_scratch_root()
+    if scratch_root is not None:
+        try:
+            if (
+                shutil.disk_usage(scratch_root).free
+                >= _STAGE_SCRATCH_MIN_FREE_BYTES
+            ):
+                return tempfile.mkdtemp(
+                    prefix="definers-stems-", dir=scratch_root
+                )
+        except OSError:
+            pass
+    try:
+        os.makedirs(output_root, exist_ok=True)
+        return tempfile.mkdtemp(prefix=".stages-", dir=output_root)
+    except OSError:
+        return None
 
 
 def _prepare_separator_input_audio(
@@ -1000,6 +1137,7 @@ def _prepare_separator_input_audio(
         sample_rate=target_sample_rate,
         bit_depth=32,
     )
+    _remember_stage_signal(prepared_path, target_sample_rate, prepared_signal)
     return prepared_path
 
 
@@ -1075,6 +1213,45 @@ def _run_mastering_separator_pipeline(
     plan: MasteringSeparatorPlan,
     *,
     shifts: int = 2,
+    stage_handoff: str = "memory",
+) -> dict[str, str]:
+    normalized_handoff = str(stage_handoff).strip().lower()
+    if normalized_handoff not in STAGE_HANDOFF_MODES:
+        raise ValueError(
+            f"Unsupported stage handoff: {stage_handoff!r}; "
+            f"expected one of {', '.join(STAGE_HANDOFF_MODES)}"
+        )
+    if normalized_handoff == "disk":
+        return _run_mastering_separator_stages(
+            audio_path,
+            output_root,
+            output_root,
+            plan,
+            shifts=shifts,
+        )
+    scratch_dir = _create_stage_scratch_dir(output_root)
+    signals_token = _STAGE_SIGNALS.set({})
+    try:
+        return _run_mastering_separator_stages(
+            audio_path,
+            output_root,
+            scratch_dir or output_root,
+            plan,
+            shifts=shifts,
+        )
+    finally:
+        _STAGE_SIGNALS.reset(signals_token)
+        if scratch_dir is not None:
+            shutil.rmtree(scratch_dir, ignore_errors=True)
+
+
+def _run_mastering_separator_stages(
+    audio_path: str,
+    output_root: str,
+    stage_root: str,
+    plan: MasteringSeparatorPlan,
+    *,
+    shifts: int = 2,
 ) -> dict[str, str]:
     primary_stage_shifts = max(int(shifts), 1)
     repair_stage_shifts = 1
@@ -1087,7 +1264,7 @@ def _run_mastering_separator_pipeline(
     ):
         working_mix_path = _prepare_separator_input_audio(
             audio_path,
-            output_root,
+            stage_root,
             plan.target_sample_rate,
         )
     for stage_index, stage in enumerate(plan.preprocess_stages):
@@ -1103,7 +1280,7 @@ def _run_mastering_separator_pipeline(
                 working_mix_path,
                 stage,
                 f"p{stage_index}",
-                output_root,
+                stage_root,
                 plan.target_sample_rate,
                 shifts=repair_stage_shifts,
             )
@@ -1129,7 +1306,7 @@ def _run_mastering_separator_pipeline(
             _model_name, vocal_pair_outputs = _run_separator_stage(
                 working_mix_path,
                 plan.vocal_pair_stage,
-                str(Path(output_root) / "pair"),
+                str(Path(stage_root) / "pair"),
                 plan.target_sample_rate,
                 shifts=primary_stage_shifts,
             )
@@ -1152,7 +1329,7 @@ def _run_mastering_separator_pipeline(
                 working_mix_path,
                 plan.reference_split_stage,
                 "ref_sep",
-                output_root,
+                stage_root,
                 plan.target_sample_rate,
                 shifts=repair_stage_shifts,
             )
@@ -1165,7 +1342,7 @@ def _run_mastering_separator_pipeline(
         _four_stem_model_name, four_stem_outputs = _run_separator_stage(
             four_stem_input_path,
             plan.four_stem_stage,
-            str(Path(output_root) / "4stem"),
+            str(Path(stage_root) / "4stem"),
             plan.target_sample_rate,
             shifts=primary_stage_shifts,
         )
@@ -1184,7 +1361,7 @@ def _run_mastering_separator_pipeline(
                 working_mix_path,
                 plan.vocal_stage,
                 "voc_isol",
-                output_root,
+                stage_root,
                 plan.target_sample_rate,
                 shifts=primary_stage_shifts,
             )
@@ -1198,7 +1375,7 @@ def _run_mastering_separator_pipeline(
                 isolated_vocal_path,
                 plan.vocal_restoration_stage,
                 "voc_rest",
-                output_root,
+                stage_root,
                 plan.target_sample_rate,
                 shifts=repair_stage_shifts,
             )
@@ -1225,7 +1402,7 @@ def _run_mastering_separator_pipeline(
                     "other": other_path,
                 },
                 plan.instrumental_cleanup_stage,
-                str(Path(output_root) / "instr_cln"),
+                str(Path(stage_root) / "instr_cln"),
                 plan.target_sample_rate,
                 shifts=repair_stage_shifts,
             )
@@ -1331,6 +1508,7 @@ def separate_stem_layers(
     two_stems: str | None = None,
     output_dir: str | None = None,
     quality_flags: Sequence[str] = (),
+    use_cache: bool = True,
 ) -> tuple[dict[str, str], str]:
     from definers.system.output_paths import managed_output_session_dir
 
@@ -1350,12 +1528,25 @@ def separate_stem_layers(
         if resolved_two_stems is not None:
             if resolved_two_stems != "vocals":
                 raise ValueError(f"Unsupported two-stems value: {two_stems}")
-            stem_paths = _run_vocal_pair_separator_pipeline(
-                audio_path,
-                resolved_output_dir,
-                model_name=model_name,
-                shifts=shifts,
+            cache_key = None
+            if use_cache:
+                cache_key = stem_cache_key(
+                    audio_path,
+                    pipeline="vocal_pair",
+                    stage=_build_vocal_pair_stage(model_name),
+                    shifts=int(shifts),
+                )
+            stem_paths = _load_cached_stem_layers(
+                cache_key, resolved_output_dir
             )
+            if stem_paths is None:
+                stem_paths = _run_vocal_pair_separator_pipeline(
+                    audio_path,
+                    resolved_output_dir,
+                    model_name=model_name,
+                    shifts=shifts,
+                )
+                _store_cached_stem_layers(cache_key, stem_paths)
             return stem_paths, str(resolved_output_dir)
 
         input_sample_rate, _input_signal = read_audio(audio_path)
@@ -1364,6 +1555,17 @@ def separate_stem_layers(
             quality_flags=quality_flags,
             model_name=model_name,
         )
+        cache_key = None
+        if use_cache:
+            cache_key = stem_cache_key(
+                audio_path,
+                pipeline="mastering",
+                plan=plan,
+                shifts=int(shifts),
+            )
+        stem_paths = _load_cached_stem_layers(cache_key, resolved_output_dir)
+        if stem_paths is not None:
+            return stem_paths, str(resolved_output_dir)
         with _separator_activity_scope(
             "Prepare separator models",
             detail="Resolving the required separator checkpoints before inference.",
@@ -1375,6 +1577,7 @@ def separate_stem_layers(
             plan,
             shifts=shifts,
         )
+        _store_cached_stem_layers(cache_key, stem_paths)
         return stem_paths, str(resolved_output_dir)
     except Exception:
         if owns_output_dir:
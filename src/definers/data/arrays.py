@@ -164,7 +164,7 @@ def str_to_numpy(txt):
         txt = "".join(txt)
     create_vectorizer, vectorize = runtime_vectorizers()
     vectorizer = create_vectorizer([txt])
-    return numpy_to_cupy(vectorize(vectorizer, [txt]))
+    return numpy_to_cupy(vectorize(vectorizer, [txt]).toarray())
 
 
 def one_dim_numpy(value):
@@ -291,22 +291,121 @@ def pad_nested(nested_data, lengths, fill_value=0):
     return ret
 
 
-def reshape_numpy(data, fill_value=0, lengths=None):
+def _ragged_leaf(value, numpy_module):
+    if is_cupy_value(value):
+        value = cupy_to_numpy(value)
+    if isinstance(value, numpy_module.ndarray) and value.dtype != object:
+        return value
+    if isinstance(value, (list, tuple, numpy_module.ndarray)):
+        try:
+            array = numpy_module.asarray(value)
+        except ValueError:
+            return None
+        return None if array.dtype == object and array.ndim else array
+    return numpy_module.asarray(value)
+
+
+def _ragged_tree(value, numpy_module):
+    leaf = _ragged_leaf(value, numpy_module)
+    if leaf is not None:
+        return leaf, leaf.shape, [leaf.dtype]
+    children = []
+    child_shapes = []
+    dtypes = []
+    for item in value:
+        child, child_shape, child_dtypes = _ragged_tree(item, numpy_module)
+        children.append(child)
+        child_shapes.append(child_shape)
+        dtypes.extend(child_dtypes)
+    depth = max((len(shape) for shape in child_shapes), default=0)
+    shape = [len(children)] + [0] * depth
+    for child_shape in child_shapes:
+        for index, size in enumerate(child_shape):
+            shape[index + 1] = max(shape[index + 1], size)
+    return children, tuple(shape), dtypes
+
+
+def _write_ragged(output, tree) -> None:
+    if not isinstance(tree, list):
+        if output.ndim < tree.ndim:
+            raise ValueError(
+                f"Cannot place {tree.ndim}-d values into {output.ndim}-d slot"
+            )
+        output[
+            tuple(slice(0, size) for size in tree.shape)
+            + (0,) * (output.ndim - tree.ndim)
+        ] = tree
+        return
+    for index, child in enumerate(tree):
+        _write_ragged(output[index], child)
+
+
+def _row_batch_trailing_shape(values, numpy_module):
+    if not isinstance(values, (list, tuple)) or not values:
+        return None
+    first = values[0]
+    if not isinstance(first, numpy_module.ndarray) or first.ndim == 0:
+        return None
+    trailing = first.shape[1:]
+    for row in values:
+        if (
+            not isinstance(row, numpy_module.ndarray)
+            or row.dtype == object
+            or row.shape[1:] != trailing
+            or row.ndim == 0
+        ):
+            return None
+    return trailing
+
+
+def pack_ragged(values, lengths=None, *, fill_value=0, dtype=None):
+    _, numpy_module = runtime_numpy_modules()
+    trailing = _row_batch_trailing_shape(values, numpy_module)
+    if trailing is not None:
+        tree = None
+        sizes = numpy_module.fromiter(
+            (row.shape[0] for row in values),
+            dtype=numpy_module.int64,
+            count=len(values),
+        )
+        shape = (len(values), int(sizes.max())) + trailing
+        dtypes = {row.dtype for row in values}
+    else:
+        tree, shape, dtypes = _ragged_tree(values, numpy_module)
+    if lengths is not None:
+        shape = tuple(
+            max(int(lengths[index]), size) if index < len(lengths) else size
+            for index, size in enumerate(shape)
+        )
+    if dtype is None:
+        try:
+            dtype = numpy_module.result_type(*set(dtypes), fill_value)
+        except TypeError:
+            dtype = object
+    output = numpy_module.full(shape, fill_value, dtype=dtype)
+    if tree is None:
+        filled = numpy_module.arange(shape[1]) < sizes[:, None]
+        target = output[
+            (slice(0, len(values)), slice(None))
+            + tuple(slice(0, size) for size in trailing)
+        ]
+        target[filled] = numpy_module.concatenate(values)
+    else:
+        _write_ragged(output, tree)
+    return output
+
+
+def reshape_numpy(data, fill_value=0, lengths=None, dtype=None):
     _, numpy_module = runtime_numpy_modules()
-    if isinstance(data, numpy_module.ndarray):
-        data = data.tolist()
-    if not data:
-        return numpy_module.array([])
     try:
-        if lengths is None:
-            lengths = get_max_shapes(data)
+        if data is None or len(data) == 0:
+            return numpy_module.array([])
         log("Reshaping data", lengths)
-        reshaped_data = pad_nested(data, lengths, fill_value)
-        log("Reshaped data", lengths)
-        return numpy_module.array(reshaped_data)
-    except (TypeError, IndexError) as error:
-        catch(error)
-        return numpy_module.array([])
+        reshaped_data = pack_ragged(
+            data, lengths, fill_value=fill_value, dtype=dtype
+        )
+        log("Reshaped data", reshaped_data.shape)
+        return reshaped_data
     except Exception as error:
         catch(error)
         return numpy_module.array([])
@@ -108,7 +108,9 @@ class FittedVectorizerPort(Protocol):
 
 
 class VectorizationPort(Protocol):
-    def create_vectorizer(self, texts: TextValues) -> FittedVectorizerPort: ...
+    def create_vectorizer(
+        self, texts: TextValues, n_features: int | None = None
+    ) -> FittedVectorizerPort: ...
 
     def vectorize(
         self,
@@ -135,6 +137,7 @@ class TensorAdapterPort(Protocol):
         value: Any,
         fill_value: int = 0,
         lengths: Sequence[int] | None = None,
+        dtype: Any = None,
     ) -> Any: ...
 
     def get_max_shapes(self, *data: Any) -> list[int]: ...
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+from definers.runtime_numpy import get_numpy_module
+
+np = get_numpy_module()
+
+FEATURE_EXTRACTOR_VERSION = 1
+DEFAULT_FEATURE_CACHE_MAX_BYTES = 2 << 30
+_HASH_CHUNK_BYTES = 1024 * 1024
+_LIST_ITEM_PREFIX = "item_"
+_STAGING_PREFIX = "."
+_EVICTION_LOW_WATER = 0.9
+
+
+def feature_cache_max_bytes() -> int:
+    configured_value = os.environ.get(
+        "DEFINERS_FEATURE_CACHE_MAX_BYTES",
+        str(DEFAULT_FEATURE_CACHE_MAX_BYTES),
+    ).strip()
+    try:
+        return max(int(float(configured_value)), 0)
+    except Exception:
+        return DEFAULT_FEATURE_CACHE_MAX_BYTES
+
+
+def feature_cache_dir() -> str:
+    configured_cache_dir = os.environ.get(
+        "DEFINERS_FEATURE_CACHE_DIR", ""
+    ).strip()
+    configured_data_root = os.environ.get("DEFINERS_DATA_ROOT", "").strip()
+    if configured_cache_dir:
+        target_root = Path(configured_cache_dir).expanduser()
+    elif configured_data_root:
+        target_root = (
+            Path(configured_data_root).expanduser() / "cache" / "features"
+        )
+    elif os.name == "nt":
+        local_app_data = os.environ.get("LOCALAPPDATA", "").strip()
+        target_root = (
+            Path(local_app_data).expanduser() / "definers" / "features"
+            if local_app_data
+            else Path.home() / "AppData" / "Local" / "definers" / "features"
+        )
+    else:
+        target_root = Path.home() / ".cache" / "definers" / "features"
+    return str(target_root)
+
+
+def file_feature_key(path: str, *, training: bool = False) -> str | None:
+    if not path or not os.path.isfile(path):
+        return None
+    digest = hashlib.sha256()
+    digest.update(f"v{FEATURE_EXTRACTOR_VERSION}\0".encode())
+    digest.update(f"{bool(training)}\0".encode())
+    digest.update(os.path.splitext(str(path))[1].lower().encode("utf-8"))
+    digest.update(b"\0")
+    try:
+        with open(path, "rb") as handle:
+            for chunk in iter(lambda: handle.read(_HASH_CHUNK_BYTES), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def _is_cacheable_array(value) -> bool:
+    return isinstance(value, np.ndarray) and value.dtype != object
+
+
+class FeatureCache:
+    def __init__(
+        self,
+        directory: str | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        self.directory = directory or feature_cache_dir()
+        self.max_bytes = max_bytes
+        self._cached_bytes: int | None = None
+
+    def _max_bytes(self) -> int:
+        if self.max_bytes is not None:
+            return self.max_bytes
+        return feature_cache_max_bytes()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.npz")
+
+    def load(self, key: str | None):
+        if key is None:
+            return None
+        entry_path = self._entry_path(key)
+        if not os.path.isfile(entry_path):
+            return None
+        try:
+            with np.load(entry_path, allow_pickle=False) as entry:
+                if "value" in entry.files:
+                    value = entry["value"]
+                else:
+                    item_names = sorted(
+                        name
+                        for name in entry.files
+                        if name.startswith(_LIST_ITEM_PREFIX)
+                    )
+                    value = [entry[name] for name in item_names]
+        except Exception:
+            return None
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        return value
+
+    def store(self, key: str | None, value) -> bool:
+        if key is None:
+            return False
+        if _is_cacheable_array(value):
+            arrays = {"value": value}
+        elif (
+            isinstance(value, list)
+            and value
+            and all(_is_cacheable_array(item) for item in value)
+        ):
+            arrays = {
+                f"{_LIST_ITEM_PREFIX}{index:08d}": item
+                for index, item in enumerate(value)
+            }
+        else:
+            return False
+        entry_path = self._entry_path(key)
+        try:
+            previous_bytes = os.path.getsize(entry_path)
+        except OSError:
+            previous_bytes = 0
+        try:
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+            handle, staging_path = tempfile.mkstemp(
+                prefix=_STAGING_PREFIX,
+                suffix=".npz",
+                dir=os.path.dirname(entry_path),
+            )
+            try:
+                with os.fdopen(handle, "wb") as staging_file:
+                    np.savez(staging_file, **arrays)
+                stored_bytes = os.path.getsize(staging_path)
+                os.replace(staging_path, entry_path)
+            except Exception:
+                os.remove(staging_path)
+                raise
+        except Exception:
+            return False
+        if self._cached_bytes is None:
+            self.evict()
+        else:
+            self._cached_bytes += stored_bytes - previous_bytes
+            max_bytes = self._max_bytes()
+            if self._cached_bytes > max_bytes:
+                self.evict(int(max_bytes * _EVICTION_LOW_WATER))
+        return True
+
+    def evict(self, max_bytes: int | None = None) -> int:
+        if max_bytes is None:
+            max_bytes = self._max_bytes()
+        entries = []
+        for entry_path in Path(self.directory).glob("*/*.npz"):
+            if entry_path.name.startswith(_STAGING_PREFIX):
+                continue
+            try:
+                stat_result = entry_path.stat()
+            except OSError:
+                continue
+            entries.append(
+                (stat_result.st_mtime, entry_path, stat_result.st_size)
+            )
+        entries.sort(key=lambda entry: entry[0])
+        total_bytes = sum(size for _last_used, _entry_path, size in entries)
+        removed_bytes = 0
+        for _last_used, entry_path, size in entries:
+            if total_bytes <= max_bytes:
+                break
+            try:
+                entry_path.unlink()
+            except OSError:
+                continue
+            total_bytes -= size
+            removed_bytes += size
+        self._cached_bytes = total_bytes
+        return removed_bytes
+
+
+__all__ = [
+    "DEFAULT_FEATURE_CACHE_MAX_BYTES",
+    "FEATURE_EXTRACTOR_VERSION",
+    "FeatureCache",
+    "feature_cache_dir",
+    "feature_cache_max_bytes",
+    "file_feature_key",
+]
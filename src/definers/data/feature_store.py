@@ -0,0 +1,333 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from collections.abc import Iterable
+
+from definers.runtime_numpy import get_numpy_module
+
+np = get_numpy_module()
+
+FEATURE_STORE_VERSION = 1
+DEFAULT_SHARD_ROWS = 64
+_INDEX_NAME = "index.json"
+
+
+def _normalize_layout(layout) -> tuple[tuple[int | None, str], ...]:
+    normalized = []
+    for position, (width, dtype) in enumerate(layout):
+        resolved_width = None if width is None else int(width)
+        if resolved_width is None and position != len(layout) - 1:
+            raise ValueError(
+                "Only the last feature store block may have an open width"
+            )
+        normalized.append((resolved_width, np.dtype(dtype).name))
+    if not normalized:
+        raise ValueError("Feature store layout must contain a block")
+    return tuple(normalized)
+
+
+def _is_representable(values: np.ndarray, dtype: np.dtype) -> bool:
+    if values.size == 0:
+        return True
+    if np.issubdtype(dtype, np.integer):
+        limits = np.iinfo(dtype)
+        return bool(
+            np.all(np.isfinite(values))
+            and values.min() >= limits.min
+            and values.max() <= limits.max
+            and np.array_equal(values, np.round(values))
+        )
+    converted = values.astype(dtype)
+    return bool(
+        np.array_equal(converted.astype(values.dtype), values, equal_nan=True)
+    )
+
+
+def _layout_matches(existing, requested) -> bool:
+    return len(existing) == len(requested) and all(
+        dtype == requested_dtype
+        and (requested_width is None or width == requested_width)
+        for (width, dtype), (requested_width, requested_dtype) in zip(
+            existing, requested
+        )
+    )
+
+
+class FeatureStore:
+    def __init__(
+        self,
+        directory: str,
+        *,
+        layout=None,
+        shard_rows: int = DEFAULT_SHARD_ROWS,
+    ) -> None:
+        self.directory = str(directory)
+        self._shards: dict[int, list[np.ndarray]] = {}
+        index_path = os.path.join(self.directory, _INDEX_NAME)
+        if os.path.isfile(index_path):
+            with open(index_path, encoding="utf-8") as handle:
+                index = json.load(handle)
+            if index.get("version") != FEATURE_STORE_VERSION:
+                raise ValueError(
+                    f"Unsupported feature store version: {index.get('version')!r}"
+                )
+            self._layout = tuple(
+                (int(width), str(dtype)) for width, dtype in index["layout"]
+            )
+            if layout is not None and not _layout_matches(
+                self._layout, _normalize_layout(layout)
+            ):
+                raise ValueError(
+                    "Feature store layout does not match the existing index"
+                )
+            self.shard_rows = int(index["shard_rows"])
+            self._samples = [tuple(sample) for sample in index["samples"]]
+        else:
+            self._layout = None if layout is None else _normalize_layout(layout)
+            self.shard_rows = max(int(shard_rows), 1)
+            self._samples = []
+        self._row_count = sum(count for _start, count, _ndim in self._samples)
+
+    @property
+    def layout(self):
+        return self._layout
+
+    @property
+    def row_width(self) -> int | None:
+        if self._layout is None or self._layout[-1][0] is None:
+            return None
+        return sum(width for width, _dtype in self._layout)
+
+    @property
+    def row_count(self) -> int:
+        return self._row_count
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def _resolve_layout(self, row: np.ndarray) -> None:
+        if self._layout is None:
+            self._layout = ((int(row.size), np.dtype(np.float32).name),)
+            return
+        fixed_width = sum(
+            width for width, _dtype in self._layout if width is not None
+        )
+        if self._layout[-1][0] is None:
+            if row.size < fixed_width:
+                raise ValueError(
+                    f"Feature row of width {row.size} is narrower than the "
+                    f"store layout prefix of {fixed_width}"
+                )
+            self._layout = self._layout[:-1] + (
+                (int(row.size - fixed_width), self._layout[-1][1]),
+            )
+
+    def _block_bounds(self):
+        offset = 0
+        for width, dtype in self._layout:
+            yield offset, offset + width, np.dtype(dtype)
+            offset += width
+
+    def _shard_path(self, shard_index: int, block_index: int) -> str:
+        return os.path.join(
+            self.directory,
+            f"shard-{shard_index:05d}.block{block_index}.npy",
+        )
+
+    def _shard(self, shard_index: int, *, writable: bool) -> list[np.ndarray]:
+        blocks = self._shards.get(shard_index)
+        if blocks is not None and (
+            not writable or all(block.flags.writeable for block in blocks)
+        ):
+            return blocks
+        blocks = []
+        for block_index, (width, dtype) in enumerate(self._layout):
+            shard_path = self._shard_path(shard_index, block_index)
+            if os.path.isfile(shard_path):
+                mode = "r+" if writable else "r"
+                blocks.append(np.lib.format.open_memmap(shard_path, mode=mode))
+            else:
+                os.makedirs(self.directory, exist_ok=True)
+                blocks.append(
+                    np.lib.format.open_memmap(
+                        shard_path,
+                        mode="w+",
+                        dtype=np.dtype(dtype),
+                        shape=(self.shard_rows, width),
+                    )
+                )
+        self._shards[shard_index] = blocks
+        return blocks
+
+    def _write_row(self, row_index: int, row: np.ndarray) -> None:
+        if row.size != self.row_width:
+            raise ValueError(
+                f"Feature row of width {row.size} does not match the store "
+                f"width {self.row_width}"
+            )
+        (shard_index, shard_row) = divmod(row_index, self.shard_rows)
+        blocks = self._shard(shard_index, writable=True)
+        for block, (start, stop, dtype) in zip(blocks, self._block_bounds()):
+            values = row[start:stop]
+            if not _is_representable(values, dtype):
+                raise ValueError(
+                    f"Feature values in columns {start}:{stop} are not "
+                    f"representable as {dtype.name}"
+                )
+            block[shard_row] = values
+
+    def append(self, values) -> int:
+        if isinstance(values, np.ndarray) or not isinstance(values, Iterable):
+            array = np.asarray(values, dtype=np.float32)
+            rows = [array.reshape(-1)] if array.ndim <= 1 else array
+            sample_ndim = 1 if array.ndim <= 1 else 2
+        else:
+            rows = values
+            sample_ndim = 2
+        start_row = self._row_count
+        count = 0
+        try:
+            for row in rows:
+                flat_row = np.asarray(row, dtype=np.float32).reshape(-1)
+                self._resolve_layout(flat_row)
+                self._write_row(start_row + count, flat_row)
+                count += 1
+            if count == 0:
+                raise ValueError("Feature sample has no rows")
+        except BaseException:
+            self._discard_shards_after(start_row)
+            raise
+        self._samples.append((start_row, count, sample_ndim))
+        self._row_count += count
+        return len(self._samples) - 1
+
+    def extend(self, samples) -> list[int]:
+        return [self.append(sample) for sample in samples]
+
+    def _discard_shards_after(self, row_index: int) -> None:
+        first_unused = -(-row_index // self.shard_rows)
+        for shard_index in [
+            index for index in self._shards if index >= first_unused
+        ]:
+            del self._shards[shard_index]
+            for block_index in range(len(self._layout or ())):
+                shard_path = self._shard_path(shard_index, block_index)
+                if os.path.isfile(shard_path):
+                    os.remove(shard_path)
+
+    def flush(self) -> None:
+        if self._layout is None:
+            return
+        for blocks in self._shards.values():
+            for block in blocks:
+                if block.flags.writeable:
+                    block.flush()
+        os.makedirs(self.directory, exist_ok=True)
+        handle, staging_path = tempfile.mkstemp(
+            suffix=".json", dir=self.directory
+        )
+        try:
+            with os.fdopen(handle, "w", encoding="utf-8") as staging_file:
+                json.dump(
+                    {
+                        "version": FEATURE_STORE_VERSION,
+                        "layout": [list(block) for block in self._layout],
+                        "shard_rows": self.shard_rows,
+                        "samples": [list(sample) for sample in self._samples],
+                    },
+                    staging_file,
+                )
+            os.replace(staging_path, os.path.join(self.directory, _INDEX_NAME))
+        except Exception:
+            if os.path.exists(staging_path):
+                os.remove(staging_path)
+            raise
+
+    def read_rows(self, start: int, stop: int) -> np.ndarray:
+        rows = np.empty((max(stop - start, 0), self.row_width or 0), np.float32)
+        position = start
+        while position < stop:
+            (shard_index, shard_row) = divmod(position, self.shard_rows)
+            taken = min(stop - position, self.shard_rows - shard_row)
+            blocks = self._shard(shard_index, writable=False)
+            target = rows[position - start : position - start + taken]
+            for block, (column_start, column_stop, _dtype) in zip(
+                blocks, self._block_bounds()
+            ):
+                target[:, column_start:column_stop] = block[
+                    shard_row : shard_row + taken
+                ]
+            position += taken
+        return rows
+
+    def sample(self, index: int) -> np.ndarray:
+        (start, count, ndim) = self._samples[index]
+        rows = self.read_rows(start, start + count)
+        return rows[0] if ndim == 1 and count == 1 else rows
+
+    def sample_rows(self, index: int) -> int:
+        return self._samples[index][1]
+
+    def view(self) -> FeatureStoreView:
+        self.flush()
+        return FeatureStoreView(self)
+
+
+class FeatureStoreView:
+    def __init__(self, store: FeatureStore) -> None:
+        self.store = store
+        self._row_dims = {ndim for _start, _count, ndim in store._samples}
+        self._max_rows = max(
+            (count for _start, count, _ndim in store._samples), default=0
+        )
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.dtype(np.float32)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        width = self.store.row_width or 0
+        if self._row_dims <= {1}:
+            return (len(self.store), width)
+        return (len(self.store), self._max_rows, width)
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def _padded_sample(self, index: int) -> np.ndarray:
+        sample = self.store.sample(index)
+        if self._row_dims <= {1}:
+            return sample
+        rows = np.zeros(self.shape[1:], dtype=np.float32)
+        sample_rows = sample.reshape(-1, rows.shape[1])
+        rows[: sample_rows.shape[0]] = sample_rows
+        return rows
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.take(range(len(self))[index])
+        if isinstance(index, (list, tuple, np.ndarray)):
+            return self.take(index)
+        return self._padded_sample(int(index))
+
+    def take(self, indices) -> np.ndarray:
+        selected = [int(index) for index in indices]
+        batch = np.empty((len(selected), *self.shape[1:]), dtype=np.float32)
+        for position, index in enumerate(selected):
+            batch[position] = self._padded_sample(index)
+        return batch
+
+    def __array__(self, dtype=None, copy=None):
+        batch = self.take(range(len(self)))
+        return batch if dtype is None else batch.astype(dtype)
+
+
+__all__ = [
+    "DEFAULT_SHARD_ROWS",
+    "FEATURE_STORE_VERSION",
+    "FeatureStore",
+    "FeatureStoreView",
+]
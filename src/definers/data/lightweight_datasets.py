@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import math
 import random
+from collections import deque
 
-from definers.runtime_numpy import get_array_module
+from definers.runtime_numpy import get_array_module, get_numpy_module
 
 np = get_array_module()
+host_np = get_numpy_module()
 
 
 class LightweightTensorDataset:
@@ -46,6 +48,27 @@ def _stack_batch_column(column_values):
             return list(column_values)
 
 
+def _gather_sources(dataset, indices):
+    if isinstance(dataset, LightweightSubset):
+        subset_indices = host_np.asarray(dataset.indices, dtype=host_np.intp)
+        return _gather_sources(dataset.dataset, subset_indices[indices])
+    if isinstance(dataset, LightweightTensorDataset) and all(
+        hasattr(tensor, "shape") for tensor in dataset.tensors
+    ):
+        return dataset.tensors, indices
+    return None
+
+
+def _pin_batch_value(value):
+    pin_memory = getattr(value, "pin_memory", None)
+    if callable(pin_memory):
+        try:
+            return pin_memory()
+        except Exception:
+            return value
+    return value
+
+
 class LightweightDataLoader:
     def __init__(
         self,
@@ -56,6 +79,8 @@ class LightweightDataLoader:
         shuffle=True,
         drop_last=False,
         sampler=None,
+        prefetch_factor=2,
+        generator=None,
     ):
         self.dataset = dataset
         self.batch_size = max(int(batch_size or 1), 1)
@@ -64,29 +89,69 @@ class LightweightDataLoader:
         self.sampler = sampler
         self.pin_memory = bool(pin_memory)
         self.num_workers = max(num_workers, 0)
+        self.prefetch_factor = max(int(prefetch_factor or 1), 1)
+        self.generator = generator
+
+    def _epoch_indices(self):
+        if self.sampler is not None:
+            return host_np.fromiter(
+                (int(index) for index in self.sampler), dtype=host_np.intp
+            )
+        dataset_length = len(self.dataset)
+        if not self.shuffle:
+            return host_np.arange(dataset_length, dtype=host_np.intp)
+        generator = self.generator or host_np.random.default_rng()
+        return generator.permutation(dataset_length).astype(host_np.intp)
 
-    def __iter__(self):
-        indices = (
-            list(self.sampler)
-            if self.sampler is not None
-            else list(range(len(self.dataset)))
-        )
+    def _batch_slices(self, indices):
         for start_index in range(0, len(indices), self.batch_size):
             batch_indices = indices[start_index : start_index + self.batch_size]
             if self.drop_last and len(batch_indices) < self.batch_size:
                 break
-            batch_rows = [self.dataset[index] for index in batch_indices]
-            if not batch_rows:
-                continue
-            first_row = batch_rows[0]
-            if isinstance(first_row, tuple):
-                columns = list(zip(*batch_rows))
-                yield tuple(
+            if len(batch_indices):
+                yield batch_indices
+
+    def _fetch_batch(self, batch_indices):
+        sources = _gather_sources(self.dataset, batch_indices)
+        if sources is not None:
+            (tensors, source_indices) = sources
+            batch = tuple(tensor[source_indices] for tensor in tensors)
+        else:
+            batch_rows = [self.dataset[int(index)] for index in batch_indices]
+            if isinstance(batch_rows[0], tuple):
+                batch = tuple(
                     _stack_batch_column(column_values)
-                    for column_values in columns
+                    for column_values in zip(*batch_rows)
+                )
+            else:
+                return batch_rows
+        if self.pin_memory:
+            return tuple(_pin_batch_value(value) for value in batch)
+        return batch
+
+    def __iter__(self):
+        batches = self._batch_slices(self._epoch_indices())
+        if self.num_workers == 0:
+            for batch_indices in batches:
+                yield self._fetch_batch(batch_indices)
+            return
+        from concurrent.futures import ThreadPoolExecutor
+
+        executor = ThreadPoolExecutor(max_workers=self.num_workers)
+        pending = deque()
+        try:
+            for batch_indices in batches:
+                pending.append(
+                    executor.submit(self._fetch_batch, batch_indices)
                 )
-                continue
-            yield batch_rows
+                if len(pending) >= self.num_workers * self.prefetch_factor:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
 
     def __len__(self):
         dataset_length = len(self.dataset)
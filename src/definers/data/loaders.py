@@ -251,10 +251,8 @@ def load_audio_values(path: str, training: bool):
             directory_path, _ = definers.split_mp3(temp_mp3_path, 5)
             files = read(directory_path) or [temp_mp3_path]
             return [
-                definers.numpy_to_cupy(
-                    definers.extract_audio_features(file_path)
-                )
-                for file_path in files
+                definers.numpy_to_cupy(features)
+                for features in definers.extract_audio_features_batch(files)
             ]
         temp_mp3_path = tmp("mp3")
         transformer.build_file(path, temp_mp3_path)
@@ -307,6 +305,77 @@ def load_video_values(path: str):
     )
 
 
+def feature_store_layout(paths: Iterable[str]):
+    from definers.constants import iio_formats
+    from definers.image.helpers import visual_feature_layout
+
+    extensions = [path_extension(str(path)) for path in paths]
+    if extensions and all(
+        extension in iio_formats or is_video_extension(extension)
+        for extension in extensions
+    ):
+        return visual_feature_layout()
+    return None
+
+
+def is_video_extension(extension: str | None) -> bool:
+    from definers.constants import iio_formats
+
+    return extension is not None and extension not in {
+        "wav",
+        "mp3",
+        "csv",
+        "xlsx",
+        "json",
+        "txt",
+        *iio_formats,
+    }
+
+
+def load_into_feature_store(path: str, store) -> bool:
+    import definers
+    from definers.constants import iio_formats
+    from definers.video.helpers import iter_video_features
+
+    try:
+        safe_input_path = safe_path(path)
+        if safe_input_path is None:
+            logger.error("Rejected unsafe or invalid path: %s", path)
+            return False
+        extension = path_extension(safe_input_path)
+        if extension in iio_formats:
+            resized = definers.resize_image(safe_input_path, 1024, 1024)
+            resized_path = resized[0] if isinstance(resized, tuple) else resized
+            features = definers.extract_image_features(resized_path)
+            if features is None:
+                return False
+            store.append(features)
+            return True
+        if is_video_extension(extension):
+            resized_video_file = definers.resize_video(
+                safe_input_path, 1024, 1024
+            )
+            adjusted_fps_file = definers.convert_video_fps(
+                resized_video_file, 24
+            )
+            store.append(iter_video_features(adjusted_fps_file))
+            return True
+        loaded = load_as_numpy(safe_input_path, training=True)
+        if loaded is None or loaded_values_have_strings(loaded, np):
+            return False
+        cupy_to_numpy = runtime().cupy_to_numpy
+        if isinstance(loaded, list):
+            store.extend(
+                cupy_to_numpy(item) for item in loaded if item is not None
+            )
+        else:
+            store.append(cupy_to_numpy(loaded))
+        return True
+    except Exception as error:
+        catch(error)
+        return False
+
+
 def load_as_numpy(path: str, training: bool = False):
     import logging
 
@@ -472,14 +541,133 @@ def append_loaded_values(target: list, loaded, convert_value) -> None:
     target.append(convert_value(loaded))
 
 
+def _resolve_loader_workers(job_count: int, max_workers: int | None) -> int:
+    import os
+
+    if job_count <= 1:
+        return 1
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    return max(1, min(int(max_workers), job_count))
+
+
+def _can_run_in_worker_process(function) -> bool:
+    import pickle
+
+    try:
+        pickle.dumps(function)
+    except Exception:
+        return False
+    return True
+
+
+def _load_paths_in_processes(
+    jobs: list[tuple[int, str]],
+    *,
+    training: bool,
+    max_workers: int | None,
+    load_fn,
+) -> dict[int, object]:
+    from concurrent.futures import (
+        FIRST_COMPLETED,
+        ProcessPoolExecutor,
+        wait,
+    )
+
+    worker_count = _resolve_loader_workers(len(jobs), max_workers)
+    if worker_count <= 1 or not _can_run_in_worker_process(load_fn):
+        return {index: load_fn(path, training=training) for index, path in jobs}
+    results: dict[int, object] = {}
+    pending_jobs = iter(jobs)
+    in_flight = {}
+    with ProcessPoolExecutor(max_workers=worker_count) as executor:
+
+        def submit_next() -> None:
+            for index, path in pending_jobs:
+                future = executor.submit(load_fn, path, training=training)
+                in_flight[future] = index
+                return
+
+        for _ in range(worker_count * 2):
+            submit_next()
+        while in_flight:
+            done, _pending = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[in_flight.pop(future)] = future.result()
+                submit_next()
+    return results
+
+
+def _feature_cache_key(path: str, training: bool) -> str | None:
+    import os
+
+    from definers.data.feature_cache import file_feature_key
+
+    if not os.path.isfile(path):
+        return None
+    safe_input_path = safe_path(path)
+    if safe_input_path is None:
+        return None
+    return file_feature_key(safe_input_path, training=training)
+
+
+def load_many_as_numpy(
+    paths: Iterable[str],
+    *,
+    training: bool = False,
+    max_workers: int | None = None,
+    cache_dir: str | None = None,
+    use_cache: bool = True,
+) -> list:
+    from definers.data.feature_cache import FeatureCache
+
+    path_list = [str(path) for path in paths]
+    cache = FeatureCache(cache_dir) if use_cache else None
+    keys = [
+        _feature_cache_key(path, training) if cache else None
+        for path in path_list
+    ]
+    loaded: list = [None] * len(path_list)
+    jobs = []
+    for index, (path, key) in enumerate(zip(path_list, keys)):
+        cached = cache.load(key) if cache else None
+        if cached is None:
+            jobs.append((index, path))
+        else:
+            loaded[index] = cached
+    for index, value in _load_paths_in_processes(
+        jobs,
+        training=training,
+        max_workers=max_workers,
+        load_fn=load_as_numpy,
+    ).items():
+        loaded[index] = value
+        if cache is not None and value is not None:
+            cache.store(keys[index], value)
+    return loaded
+
+
 def collect_loaded_values(
-    paths: Iterable[str], role: str, numpy_module
+    paths: Iterable[str],
+    role: str,
+    numpy_module,
+    *,
+    max_workers: int | None = None,
+    cache_dir: str | None = None,
+    use_cache: bool = True,
 ) -> tuple[list, bool] | None:
     active_runtime = _runtime()
+    path_list = list(paths)
     values = []
     has_strings = False
-    for path in paths:
-        loaded = load_as_numpy(path, training=True)
+    loaded_values = load_many_as_numpy(
+        path_list,
+        training=True,
+        max_workers=max_workers,
+        cache_dir=cache_dir,
+        use_cache=use_cache,
+    )
+    for path, loaded in zip(path_list, loaded_values):
         if loaded is None:
             if role == "feature":
                 active_runtime.logger.exception(
@@ -515,28 +703,15 @@ def tokenize_loaded_values(values, numpy_module):
 
 
 def stack_tensor_rows(values, max_lengths, active_runtime):
+    rows = list(values)
+    packed = active_runtime.cupy_to_numpy(
+        active_runtime.reshape_numpy(rows, lengths=[len(rows), *max_lengths])
+    )
     try:
         import torch
     except Exception:
-        return np.stack(
-            [
-                active_runtime.cupy_to_numpy(
-                    active_runtime.reshape_numpy(value, lengths=max_lengths)
-                )
-                for value in values
-            ],
-            axis=0,
-        )
-    return active_runtime.convert_tensor_dtype(
-        torch.stack(
-            [
-                torch.tensor(
-                    active_runtime.reshape_numpy(value, lengths=max_lengths)
-                )
-                for value in values
-            ]
-        )
-    )
+        return packed
+    return active_runtime.convert_tensor_dtype(torch.as_tensor(packed))
 
 
 def build_tensor_dataset(features, labels, active_runtime):
@@ -554,17 +729,99 @@ def build_tensor_dataset(features, labels, active_runtime):
     return tensor_dataset_cls(features_tensor)
 
 
-def files_to_dataset(features_paths, labels_paths=None):
+def load_labels_tensor(labels_paths, loader_options, active_runtime):
+    label_batch = collect_loaded_values(
+        labels_paths, "label", np, **loader_options
+    )
+    if label_batch is None:
+        return None
+    labels, labels_have_strings = label_batch
+    if labels_have_strings:
+        labels = tokenize_loaded_values(labels, np)
+    if not labels:
+        return None
+    return stack_tensor_rows(
+        labels, active_runtime.get_max_shapes(*labels), active_runtime
+    )
+
+
+def files_to_feature_store_dataset(
+    features_paths,
+    labels_paths,
+    feature_store_dir: str,
+    loader_options,
+):
+    from definers.data.feature_store import FeatureStore
+    from definers.data.lightweight_datasets import LightweightTensorDataset
+
+    active_runtime = _runtime()
+    path_list = list(features_paths)
+    try:
+        store = FeatureStore(
+            feature_store_dir, layout=feature_store_layout(path_list)
+        )
+        if len(store):
+            raise ValueError(f"Feature store is not empty: {feature_store_dir}")
+        for path in path_list:
+            if not load_into_feature_store(path, store):
+                active_runtime.logger.exception(
+                    f"Error loading feature file: {path}"
+                )
+                return None
+        if not len(store):
+            active_runtime.logger.warning("No valid data loaded.")
+            return None
+        features_view = store.view()
+        if not labels_paths:
+            return LightweightTensorDataset(features_view)
+        labels_tensor = load_labels_tensor(
+            labels_paths, loader_options, active_runtime
+        )
+        if labels_tensor is None:
+            return None
+        if len(labels_tensor) != len(features_view):
+            raise ValueError(
+                f"Loaded {len(features_view)} feature samples but "
+                f"{len(labels_tensor)} label rows"
+            )
+        return LightweightTensorDataset(features_view, labels_tensor)
+    except Exception as error:
+        _catch(error)
+        return None
+
+
+def files_to_dataset(
+    features_paths,
+    labels_paths=None,
+    *,
+    max_workers: int | None = None,
+    cache_dir: str | None = None,
+    use_cache: bool = True,
+    feature_store_dir: str | None = None,
+):
     active_runtime = _runtime()
+    loader_options = {
+        "max_workers": max_workers,
+        "cache_dir": cache_dir,
+        "use_cache": use_cache,
+    }
+    if feature_store_dir is not None:
+        return files_to_feature_store_dataset(
+            features_paths, labels_paths, feature_store_dir, loader_options
+        )
     try:
-        feature_batch = collect_loaded_values(features_paths, "feature", np)
+        feature_batch = collect_loaded_values(
+            features_paths, "feature", np, **loader_options
+        )
         if feature_batch is None:
             return None
         features, features_have_strings = feature_batch
         labels = []
         labels_have_strings = False
         if labels_paths:
-            label_batch = collect_loaded_values(labels_paths, "label", np)
+            label_batch = collect_loaded_values(
+                labels_paths, "label", np, **loader_options
+            )
             if label_batch is None:
                 return None
             labels, labels_have_strings = label_batch
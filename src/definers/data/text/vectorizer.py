@@ -1,88 +1,175 @@
 from __future__ import annotations
 
-import math
 import re
-from collections import Counter
+import zlib
 from collections.abc import Mapping
+from itertools import chain
 
-from definers.runtime_numpy import get_array_module
+from definers.runtime_numpy import get_array_module, get_numpy_module
 
 np = get_array_module()
+host_np = get_numpy_module()
 
 
 class DenseFeatureMatrix:
     def __init__(self, values):
-        self._values = np.asarray(values, dtype=np.float32)
+        if hasattr(values, "tocsr"):
+            self._values = values.tocsr()
+        else:
+            self._values = np.asarray(values, dtype=np.float32)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return tuple(self._values.shape)
+
+    @property
+    def is_sparse(self) -> bool:
+        return hasattr(self._values, "tocsr")
+
+    def tocsr(self):
+        if self.is_sparse:
+            return self._values
+        from scipy import sparse
+
+        values = self._values
+        if not isinstance(values, host_np.ndarray):
+            values = host_np.asarray(values.get())
+        return sparse.csr_matrix(values)
 
     def toarray(self) -> np.ndarray:
+        if self.is_sparse:
+            return np.asarray(self._values.toarray(), dtype=np.float32)
         return np.asarray(self._values, dtype=np.float32)
 
 
+def _hash_token(token: str, n_features: int) -> int:
+    return zlib.crc32(token.encode("utf-8")) % n_features
+
+
 class LightweightTfidfVectorizer:
-    def __init__(self, token_pattern: str = r"(?u)\b\w+\b"):
+    def __init__(
+        self,
+        token_pattern: str = r"(?u)\b\w+\b",
+        *,
+        n_features: int | None = None,
+    ):
+        if n_features is not None and int(n_features) <= 0:
+            raise ValueError("n_features must be a positive integer")
         self.token_pattern = token_pattern
+        self.n_features = None if n_features is None else int(n_features)
         self._token_regex = re.compile(token_pattern)
         self.vocabulary_: dict[str, int] = {}
-        self._idf = np.empty((0,), dtype=np.float32)
+        self._idf = host_np.empty((0,), dtype=host_np.float32)
 
     def _tokenize(self, text: str) -> list[str]:
         return [token.lower() for token in self._token_regex.findall(str(text))]
 
+    def _feature_count(self) -> int:
+        if self.n_features is not None:
+            return self.n_features
+        return len(self.vocabulary_)
+
+    def _token_columns(self, tokens: list[str]) -> list[int]:
+        if self.n_features is not None:
+            return [_hash_token(token, self.n_features) for token in tokens]
+        vocabulary = self.vocabulary_
+        return [vocabulary[token] for token in tokens if token in vocabulary]
+
+    def _document_cells(self, documents: list[list[str]]):
+        columns_by_document = [
+            self._token_columns(tokens) for tokens in documents
+        ]
+        lengths = host_np.fromiter(
+            (len(columns) for columns in columns_by_document),
+            dtype=host_np.int64,
+            count=len(columns_by_document),
+        )
+        columns = host_np.fromiter(
+            chain.from_iterable(columns_by_document),
+            dtype=host_np.int64,
+            count=int(lengths.sum()),
+        )
+        rows = host_np.repeat(host_np.arange(len(documents)), lengths)
+        feature_count = max(self._feature_count(), 1)
+        cells, counts = host_np.unique(
+            rows * feature_count + columns, return_counts=True
+        )
+        return cells // feature_count, cells % feature_count, counts
+
     def fit(self, texts):
         documents = [self._tokenize(text) for text in texts]
-        vocabulary: dict[str, int] = {}
-        document_frequency: Counter[str] = Counter()
-        for tokens in documents:
-            for token in tokens:
-                if token not in vocabulary:
-                    vocabulary[token] = len(vocabulary)
-            for token in set(tokens):
-                document_frequency[token] += 1
-        document_count = max(len(documents), 1)
-        self.vocabulary_ = vocabulary
-        self._idf = np.ones(len(vocabulary), dtype=np.float32)
-        for token, index in vocabulary.items():
-            self._idf[index] = float(
-                math.log(
-                    (1.0 + document_count) / (1.0 + document_frequency[token])
+        if self.n_features is None:
+            self.vocabulary_ = {
+                token: index
+                for index, token in enumerate(
+                    dict.fromkeys(chain.from_iterable(documents))
                 )
-                + 1.0
-            )
+            }
+        _rows, columns, _counts = self._document_cells(documents)
+        document_frequency = host_np.bincount(
+            columns, minlength=self._feature_count()
+        )
+        document_count = max(len(documents), 1)
+        self._idf = (
+            host_np.log((1.0 + document_count) / (1.0 + document_frequency))
+            + 1.0
+        ).astype(host_np.float32)
         return self
 
     def transform(self, texts) -> DenseFeatureMatrix:
-        if not self.vocabulary_:
+        from scipy import sparse
+
+        if self._idf.size == 0:
             raise ValueError("Vectorizer is not fitted")
-        rows = np.zeros((len(texts), len(self.vocabulary_)), dtype=np.float32)
-        for row_index, text in enumerate(texts):
-            token_counts = Counter(self._tokenize(text))
-            if not token_counts:
-                continue
-            total_tokens = float(sum(token_counts.values()))
-            for token, count in token_counts.items():
-                token_index = self.vocabulary_.get(token)
-                if token_index is None:
-                    continue
-                rows[row_index, token_index] = (
-                    count / total_tokens
-                ) * self._idf[token_index]
-            row_norm = float(np.linalg.norm(rows[row_index]))
-            if row_norm > 0.0:
-                rows[row_index] /= row_norm
-        return DenseFeatureMatrix(rows)
+        documents = [self._tokenize(text) for text in texts]
+        token_totals = host_np.asarray(
+            [max(len(tokens), 1) for tokens in documents],
+            dtype=host_np.float32,
+        )
+        rows, columns, counts = self._document_cells(documents)
+        values = (
+            counts.astype(host_np.float32) / token_totals[rows]
+        ) * self._idf[columns]
+        row_norms = host_np.sqrt(
+            host_np.bincount(
+                rows, weights=values * values, minlength=len(documents)
+            )
+        ).astype(host_np.float32)
+        values /= row_norms[rows]
+        indptr = host_np.zeros(len(documents) + 1, dtype=host_np.int64)
+        host_np.cumsum(
+            host_np.bincount(rows, minlength=len(documents)),
+            out=indptr[1:],
+        )
+        return DenseFeatureMatrix(
+            sparse.csr_matrix(
+                (values, columns, indptr),
+                shape=(len(documents), self._feature_count()),
+            )
+        )
 
     def fit_transform(self, texts) -> DenseFeatureMatrix:
         self.fit(texts)
         return self.transform(texts)
 
     def get_feature_names_out(self) -> np.ndarray:
+        if self.n_features is not None:
+            raise ValueError("Hashed features have no names")
         feature_names = sorted(
             self.vocabulary_.items(), key=lambda item: item[1]
         )
         return np.asarray([token for token, _ in feature_names], dtype=object)
 
 
-def create_text_vectorizer(token_pattern: str = r"(?u)\b\w+\b"):
+def create_text_vectorizer(
+    token_pattern: str = r"(?u)\b\w+\b",
+    *,
+    n_features: int | None = None,
+):
+    if n_features is not None:
+        return LightweightTfidfVectorizer(
+            token_pattern=token_pattern, n_features=n_features
+        )
     try:
         from sklearn.feature_extraction.text import TfidfVectorizer
 
@@ -105,5 +192,5 @@ def vectorizer_from_vocabulary(vocabulary, token_pattern: str = r"(?u)\b\w+\b"):
     vectorizer.vocabulary_ = {
         token: index for index, token in enumerate(ordered_tokens)
     }
-    vectorizer._idf = np.ones(len(ordered_tokens), dtype=np.float32)
+    vectorizer._idf = host_np.ones(len(ordered_tokens), dtype=host_np.float32)
     return vectorizer
@@ -1,11 +1,13 @@
-from definers.runtime_numpy import get_array_module
+from definers.runtime_numpy import get_numpy_module
+
+DEFAULT_DENSE_BATCH_ROWS = 1024
 
 
 def normalize_texts(texts) -> list[str]:
     return [str(text) for text in texts]
 
 
-def create_vectorizer(texts):
+def create_vectorizer(texts, n_features: int | None = None):
     from definers.data.text.vectorizer import (
         create_text_vectorizer,
     )
@@ -13,42 +15,80 @@ def create_vectorizer(texts):
     normalized_texts = normalize_texts(texts)
     if not normalized_texts:
         raise ValueError("texts must not be empty")
-    vectorizer = create_text_vectorizer(token_pattern="(?u)\\b\\w+\\b")
+    vectorizer = create_text_vectorizer(
+        token_pattern="(?u)\\b\\w+\\b", n_features=n_features
+    )
     vectorizer.fit(normalized_texts)
     return vectorizer
 
 
+def vectorizer_feature_count(vectorizer) -> int:
+    return getattr(vectorizer, "n_features", None) or len(
+        getattr(vectorizer, "vocabulary_", {}) or {}
+    )
+
+
 def empty_vectorized_rows(vectorizer):
-    np = get_array_module()
+    from scipy import sparse
 
-    vocabulary_size = len(getattr(vectorizer, "vocabulary_", {}) or {})
-    return np.empty((0, vocabulary_size))
+    return sparse.csr_matrix(
+        (0, vectorizer_feature_count(vectorizer)),
+        dtype=get_numpy_module().float32,
+    )
 
 
 def vectorize(vectorizer, texts):
-    np = get_array_module()
-
     if vectorizer is None or texts is None:
         return None
     if isinstance(texts, list) and not texts:
         return empty_vectorized_rows(vectorizer)
-    tfidf_matrix = vectorizer.transform(normalize_texts(texts))
-    return np.asarray(tfidf_matrix.toarray())
+    return vectorizer.transform(normalize_texts(texts)).tocsr()
+
+
+def is_sparse_rows(values) -> bool:
+    return hasattr(values, "tocsr")
+
+
+def dense_row_batches(matrix, batch_rows: int = DEFAULT_DENSE_BATCH_ROWS):
+    np = get_numpy_module()
+
+    rows = matrix.tocsr()
+    batch_rows = max(int(batch_rows), 1)
+    for start in range(0, rows.shape[0], batch_rows):
+        yield (
+            start,
+            np.asarray(
+                rows[start : start + batch_rows].toarray(), dtype=np.float32
+            ),
+        )
 
 
 def invert_vocabulary(vocabulary) -> dict[int, str]:
     return {index: token for token, index in vocabulary.items()}
 
 
+def _row_entries(vectorized_data):
+    if not is_sparse_rows(vectorized_data):
+        for row in vectorized_data:
+            yield enumerate(row)
+        return
+    rows = vectorized_data.tocsr()
+    for row_index in range(rows.shape[0]):
+        start, stop = rows.indptr[row_index], rows.indptr[row_index + 1]
+        yield sorted(
+            zip(rows.indices[start:stop].tolist(), rows.data[start:stop])
+        )
+
+
 def unvectorize(vectorizer, vectorized_data):
     if vectorizer is None or vectorized_data is None:
         return None
     index_to_word = invert_vocabulary(vectorizer.vocabulary_)
     unvectorized_texts: list[str] = []
-    for row in vectorized_data:
+    for entries in _row_entries(vectorized_data):
         words = [
             index_to_word[index]
-            for index, value in enumerate(row)
+            for index, value in entries
             if value > 0 and index in index_to_word
         ]
         unvectorized_texts.append(" ".join(words))
@@ -44,6 +44,13 @@ def _log_media_exception(message, exception):
     init_logger().exception(message)
 
 
+VISUAL_HISTOGRAM_WIDTH = 256 * 3
+
+
+def visual_feature_layout():
+    return ((VISUAL_HISTOGRAM_WIDTH, "float32"), (None, "uint8"))
+
+
 def _extract_visual_features(image, gray_image):
     import cv2
 
@@ -77,7 +84,7 @@ def _reconstruct_visual_frame(predicted_features, frame_shape):
     import cv2
 
     (height, width, channels) = frame_shape
-    hist_size = 256 * 3
+    hist_size = VISUAL_HISTOGRAM_WIDTH
     spatial_size = height * width
     expected_size = hist_size + spatial_size * 2
     features = _np.asarray(predicted_features, dtype=_np.float32).reshape(-1)
@@ -23,6 +23,7 @@ from definers.ml.analysis import (
     kmeans_k_suggestions,
 )
 from definers.ml.answer.service import answer
+from definers.ml.cross_validation import run_cross_validation
 from definers.ml.health_api import (
     get_ml_health_snapshot,
     ml_health_markdown,
@@ -67,6 +68,7 @@ from definers.ml.training import (
 
 from . import (
     contracts,
+    cross_validation,
     health,
     health_api,
     inference,
@@ -133,9 +135,13 @@ try:
     from definers.data.loaders import load_as_numpy
     from definers.data.vectorizers import (
         create_vectorizer,
+        dense_row_batches,
+        is_sparse_rows,
     )
 except Exception:
     create_vectorizer = None
+    dense_row_batches = None
+    is_sparse_rows = None
     cupy_to_numpy = None
     dtype = None
     get_prediction_file_extension = None
@@ -1668,6 +1674,10 @@ class AutoTrainer:
         early_stopping: bool | None = None,
         patience: int | None = None,
         cv_folds: int = 0,
+        cv_workers: int | None = None,
+        cv_executor: str = "thread",
+        training_buffer_dir: str | None = None,
+        text_hash_features: int | None = None,
     ):
         self.source = source
         self.target = target
@@ -1684,6 +1694,10 @@ class AutoTrainer:
         self.early_stopping = early_stopping
         self.patience = patience
         self.cv_folds = max(0, int(cv_folds or 0))
+        self.cv_workers = cv_workers
+        self.cv_executor = cv_executor
+        self.training_buffer_dir = training_buffer_dir
+        self.text_hash_features = text_hash_features
         self.vectorizer = None
         self.label_mapping = None
         self.last_training_plan = None
@@ -2041,9 +2055,14 @@ class AutoTrainer:
         if create_vectorizer is None:
             return np.asarray(normalized_rows, dtype=object).reshape(-1, 1)
         if self.vectorizer is None:
-            self.vectorizer = create_vectorizer(normalized_rows)
-        matrix = self.vectorizer.transform(normalized_rows)
-        return np.asarray(matrix.toarray())
+            self.vectorizer = create_vectorizer(
+                normalized_rows, n_features=self.text_hash_features
+            )
+        return self.vectorizer.transform(normalized_rows).tocsr()
+
+    @staticmethod
+    def _has_sparse_rows(feature_array) -> bool:
+        return dense_row_batches is not None and is_sparse_rows(feature_array)
 
     def _coerce_feature_data(self, data):
         if data is None:
@@ -2133,6 +2152,19 @@ class AutoTrainer:
         )
         feature_array = self._coerce_feature_data(feature_data)
         label_array = self._coerce_label_data(label_data)
+        if not self._has_sparse_rows(feature_array):
+            return self._feed_rows(feature_array, label_array, epochs)
+        for _epoch in range(epochs):
+            for start, rows in dense_row_batches(feature_array):
+                labels = (
+                    None
+                    if label_array is None
+                    else label_array[start : start + rows.shape[0]]
+                )
+                self._feed_rows(rows, labels, 1)
+        return self.model
+
+    def _feed_rows(self, feature_array, label_array, epochs: int):
         self.model = feed(
             self.model,
             feature_array,
@@ -2140,6 +2172,7 @@ class AutoTrainer:
             epochs=epochs,
             logger=log,
             concatenate=_concatenate_training_rows(),
+            buffer_dir=self.training_buffer_dir,
         )
         return self.model
 
@@ -2281,6 +2314,7 @@ class AutoTrainer:
                         numpy_to_cupy(labels_batch),
                         logger=log,
                         concatenate=_concatenate_training_rows(),
+                        buffer_dir=self.training_buffer_dir,
                     )
                     continue
                 features_batch = pad_sequences(
@@ -2291,6 +2325,7 @@ class AutoTrainer:
                     numpy_to_cupy(features_batch),
                     logger=log,
                     concatenate=_concatenate_training_rows(),
+                    buffer_dir=self.training_buffer_dir,
                 )
         return self.model
 
@@ -2454,44 +2489,19 @@ class AutoTrainer:
             labels = self._coerce_label_data(label_data)
             if features is None or labels is None:
                 return
-            n = int(getattr(features, "shape", [len(features)])[0])
-            folds = max(2, min(cv_folds, n))
-            scores: list[float] = []
-            fold_size = n // folds
-            for fold_index in range(folds):
-                start = fold_index * fold_size
-                end = n if fold_index == folds - 1 else start + fold_size
-                val_X = features[start:end]
-                val_y = labels[start:end]
-                indices = list(range(0, start)) + list(range(end, n))
-                if not indices:
-                    continue
-                train_X = (
-                    features[indices]
-                    if hasattr(features, "__getitem__")
-                    else features
-                )
-                train_y = (
-                    labels[indices]
-                    if hasattr(labels, "__getitem__")
-                    else labels
-                )
-                fold_model = HybridModel()
-                try:
-                    fold_model.fit(train_X, train_y)
-                    if hasattr(fold_model, "score"):
-                        scores.append(float(fold_model.score(val_X, val_y)))
-                    elif hasattr(fold_model, "predict"):
-                        preds = fold_model.predict(val_X)
-                        try:
-                            correct = float(
-                                (np.asarray(preds) == np.asarray(val_y)).mean()
-                            )
-                            scores.append(correct)
-                        except Exception:
-                            pass
-                except Exception as fold_error:
-                    catch(fold_error)
+            scores = run_cross_validation(
+                features,
+                labels,
+                cv_folds,
+                model_factory=HybridModel,
+                max_workers=self.cv_workers,
+                executor=self.cv_executor,
+                on_score=lambda fold_index, score: log(
+                    "Cross-validation fold",
+                    f"{fold_index + 1}: {score:.4f}",
+                ),
+                on_error=catch,
+            )
             self.cv_scores = scores
             if scores:
                 avg = sum(scores) / len(scores)
@@ -2582,6 +2592,20 @@ class AutoTrainer:
         feature_array = self._coerce_feature_data(feature_data)
         if feature_array is None:
             return None
+        if self._has_sparse_rows(feature_array):
+            predictions = [
+                self._predict_rows(model, rows)
+                for _start, rows in dense_row_batches(feature_array)
+            ]
+            if not predictions:
+                return None
+            return _np.concatenate(
+                [_np.asarray(prediction) for prediction in predictions]
+            )
+        return self._predict_rows(model, feature_array)
+
+    @staticmethod
+    def _predict_rows(model, feature_array):
         prediction_input = np.asarray(feature_array)
         if prediction_input.ndim == 1:
             prediction_input = prediction_input.reshape(1, -1)
@@ -1,5 +1,12 @@
-from . import service
+from . import prefix_cache, service
+from .prefix_cache import (
+    AnswerGenerationEngine,
+    answer_generation_engine,
+    clear_answer_generation_engine,
+)
 from .service import (
+    DEFAULT_ANSWER_HISTORY_CACHE,
+    AnswerHistoryCache,
     answer,
     append_history_message,
     content_paths,
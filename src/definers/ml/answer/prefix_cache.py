@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import copy
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+DEFAULT_PREFIX_CACHE_BYTES = 1 << 30
+
+_ENGINE_SLOT: dict[str, Any] = {
+    "model": None,
+    "processor": None,
+    "engine": None,
+}
+_ENGINE_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
+class PrefixCacheEntry:
+    token_ids: tuple[int, ...]
+    past_key_values: Any
+    nbytes: int
+
+
+def cache_layer_tensors(past_key_values: Any) -> list[Any]:
+    if past_key_values is None:
+        return []
+    if hasattr(past_key_values, "layers"):
+        pairs = [
+            (getattr(layer, "keys", None), getattr(layer, "values", None))
+            for layer in past_key_values.layers
+        ]
+    elif hasattr(past_key_values, "key_cache"):
+        pairs = list(
+            zip(past_key_values.key_cache, past_key_values.value_cache)
+        )
+    else:
+        pairs = [(layer[0], layer[1]) for layer in past_key_values]
+    return [tensor for pair in pairs for tensor in pair if tensor is not None]
+
+
+def cache_nbytes(past_key_values: Any) -> int:
+    return sum(
+        int(tensor.numel()) * int(tensor.element_size())
+        for tensor in cache_layer_tensors(past_key_values)
+    )
+
+
+def map_cache_tensors(past_key_values: Any, transform: Any) -> Any:
+    memo = {
+        id(tensor): transform(tensor)
+        for tensor in cache_layer_tensors(past_key_values)
+    }
+    return copy.deepcopy(past_key_values, memo)
+
+
+def crop_cache(past_key_values: Any, length: int) -> Any:
+    return map_cache_tensors(
+        past_key_values, lambda tensor: tensor[..., :length, :]
+    )
+
+
+def expand_cache(past_key_values: Any, num_beams: int) -> Any:
+    if num_beams <= 1:
+        return map_cache_tensors(past_key_values, lambda tensor: tensor)
+    return map_cache_tensors(
+        past_key_values,
+        lambda tensor: tensor.repeat_interleave(num_beams, dim=0),
+    )
+
+
+def common_prefix_length(
+    cached_ids: tuple[int, ...], token_ids: tuple[int, ...]
+) -> int:
+    limit = min(len(cached_ids), len(token_ids))
+    for position in range(limit):
+        if cached_ids[position] != token_ids[position]:
+            return position
+    return limit
+
+
+def logits_to_keep_kwargs(model: Any) -> dict[str, int]:
+    try:
+        parameters = inspect.signature(model.forward).parameters
+    except (AttributeError, TypeError, ValueError):
+        return {}
+    if "num_logits_to_keep" in parameters:
+        return {"num_logits_to_keep": 1}
+    return {}
+
+
+class AnswerGenerationEngine:
+    def __init__(
+        self,
+        model: Any,
+        processor: Any,
+        *,
+        memory_budget_bytes: int = DEFAULT_PREFIX_CACHE_BYTES,
+        device: Any | None = None,
+        max_length: int = 4096,
+    ) -> None:
+        self.model = model
+        self.processor = processor
+        self.memory_budget_bytes = max(int(memory_budget_bytes), 0)
+        self.device = device
+        self.max_length = int(max_length)
+        self.last_stats: dict[str, float] = {}
+        self._entries: OrderedDict[int, PrefixCacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._next_entry_id = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def cached_bytes(self) -> int:
+        return sum(entry.nbytes for entry in self._entries.values())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _target_device(self) -> Any:
+        if self.device is None:
+            from definers.cuda import device
+
+            self.device = device()
+        return self.device
+
+    def _encode(self, history: list[dict[str, str]]) -> Any:
+        prompt = self.processor.tokenizer.apply_chat_template(
+            history,
+            tokenize=False,
+            add_generation_prompt=True,
+        )
+        inputs = self.processor(text=prompt, return_tensors="pt")
+        return inputs.to(self._target_device())
+
+    def _longest_prefix(
+        self, token_ids: tuple[int, ...]
+    ) -> tuple[int | None, int, PrefixCacheEntry | None]:
+        best_id = None
+        best_length = 0
+        with self._lock:
+            for entry_id, entry in self._entries.items():
+                length = common_prefix_length(entry.token_ids, token_ids)
+                if length > best_length:
+                    (best_id, best_length) = (entry_id, length)
+            if best_id is None:
+                return None, 0, None
+            self._entries.move_to_end(best_id)
+            entry = self._entries[best_id]
+        return best_id, best_length, entry
+
+    def _store(
+        self,
+        replaced_id: int | None,
+        token_ids: tuple[int, ...],
+        past_key_values: Any,
+    ) -> None:
+        nbytes = cache_nbytes(past_key_values)
+        with self._lock:
+            if replaced_id is not None:
+                self._entries.pop(replaced_id, None)
+            if nbytes > self.memory_budget_bytes:
+                return
+            entry_id = self._next_entry_id
+            self._next_entry_id += 1
+            self._entries[entry_id] = PrefixCacheEntry(
+                token_ids, past_key_values, nbytes
+            )
+            while self.cached_bytes > self.memory_budget_bytes:
+                self._entries.popitem(last=False)
+
+    def prefill(self, inputs: Any) -> tuple[Any, int]:
+        import torch
+
+        input_ids = inputs["input_ids"]
+        token_ids = tuple(int(token) for token in input_ids[0].tolist())
+        prefix_end = len(token_ids) - 1
+        if prefix_end <= 0:
+            return None, 0
+        (matched_id, reused, entry) = self._longest_prefix(token_ids)
+        reused = min(reused, prefix_end)
+        if entry is None:
+            past_key_values = None
+        elif reused == prefix_end:
+            return crop_cache(entry.past_key_values, reused), reused
+        else:
+            if 2 * reused < len(entry.token_ids):
+                matched_id = None
+            past_key_values = crop_cache(entry.past_key_values, reused)
+        attention_mask = inputs.get("attention_mask")
+        if attention_mask is None:
+            attention_mask = torch.ones_like(input_ids)
+        with torch.no_grad():
+            outputs = self.model(
+                input_ids=input_ids[:, reused:prefix_end],
+                attention_mask=attention_mask[:, :prefix_end],
+                past_key_values=past_key_values,
+                use_cache=True,
+            )
+        past_key_values = outputs.past_key_values
+        self._store(matched_id, token_ids[:prefix_end], past_key_values)
+        return past_key_values, reused
+
+    def generate(self, history: list[dict[str, str]]) -> Any:
+        from definers.constants import beam_kwargs
+
+        started = time.perf_counter()
+        inputs = self._encode(history)
+        (past_key_values, reused) = self.prefill(inputs)
+        prefill_seconds = time.perf_counter() - started
+        generate_ids = self.model.generate(
+            **inputs,
+            past_key_values=expand_cache(
+                past_key_values, int(beam_kwargs.get("num_beams", 1))
+            ),
+            **beam_kwargs,
+            max_length=self.max_length,
+            **logits_to_keep_kwargs(self.model),
+        )
+        prompt_tokens = int(inputs["input_ids"].shape[1])
+        self.last_stats = {
+            "prompt_tokens": prompt_tokens,
+            "reused_tokens": reused,
+            "prefill_seconds": prefill_seconds,
+        }
+        output_ids = generate_ids[:, prompt_tokens:]
+        return self.processor.batch_decode(
+            output_ids,
+            skip_special_tokens=True,
+            clean_up_tokenization_spaces=False,
+        )[0]
+
+
+def answer_generation_engine(
+    model: Any,
+    processor: Any,
+    *,
+    memory_budget_bytes: int = DEFAULT_PREFIX_CACHE_BYTES,
+) -> AnswerGenerationEngine:
+    with _ENGINE_LOCK:
+        engine = _ENGINE_SLOT["engine"]
+        if (
+            engine is None
+            or _ENGINE_SLOT["model"] is not model
+            or _ENGINE_SLOT["processor"] is not processor
+        ):
+            engine = AnswerGenerationEngine(
+                model,
+                processor,
+                memory_budget_bytes=memory_budget_bytes,
+            )
+            _ENGINE_SLOT.update(model=model, processor=processor, engine=engine)
+        return engine
+
+
+def clear_answer_generation_engine() -> None:
+    with _ENGINE_LOCK:
+        _ENGINE_SLOT.update(model=None, processor=None, engine=None)
+
+
+__all__ = [
+    "DEFAULT_PREFIX_CACHE_BYTES",
+    "AnswerGenerationEngine",
+    "PrefixCacheEntry",
+    "answer_generation_engine",
+    "cache_nbytes",
+    "clear_answer_generation_engine",
+    "common_prefix_length",
+    "crop_cache",
+    "expand_cache",
+    "logits_to_keep_kwargs",
+    "map_cache_tensors",
+]
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import hashlib
+import os
 import sys
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any
 
+ANSWER_HISTORY_CACHE_SIZE = 1024
+ANSWER_HISTORY_CACHE_BYTES = 256 << 20
+
 
 @dataclass(frozen=True, slots=True)
 class AnswerRuntime:
@@ -11,6 +18,101 @@ class AnswerRuntime:
     PROCESSORS: object
 
 
+def history_value_nbytes(value: Any) -> int:
+    if value is None:
+        return 0
+    if isinstance(value, (tuple, list)):
+        return sum(history_value_nbytes(item) for item in value)
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    if hasattr(value, "getbands") and hasattr(value, "size"):
+        (width, height) = value.size
+        return int(width) * int(height) * len(value.getbands())
+    return sys.getsizeof(value)
+
+
+class AnswerHistoryCache:
+    def __init__(
+        self,
+        max_entries: int = ANSWER_HISTORY_CACHE_SIZE,
+        max_bytes: int = ANSWER_HISTORY_CACHE_BYTES,
+    ) -> None:
+        self.max_entries = max(int(max_entries), 1)
+        self.max_bytes = max(int(max_bytes), 0)
+        self._entries: OrderedDict[tuple, tuple[Any, int]] = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def lookup(self, key: tuple | None) -> tuple[bool, Any]:
+        if key is None:
+            return False, None
+        with self._lock:
+            if key not in self._entries:
+                return False, None
+            self._entries.move_to_end(key)
+            return True, self._entries[key][0]
+
+    def _discard(self, key: tuple) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._nbytes -= entry[1]
+
+    def store(self, key: tuple | None, value: Any) -> Any:
+        if key is None:
+            return value
+        nbytes = history_value_nbytes(value)
+        with self._lock:
+            self._discard(key)
+            if nbytes > self.max_bytes:
+                return value
+            self._entries[key] = (value, nbytes)
+            self._nbytes += nbytes
+            while (
+                len(self._entries) > self.max_entries
+                or self._nbytes > self.max_bytes
+            ):
+                (_key, (_value, evicted_nbytes)) = self._entries.popitem(
+                    last=False
+                )
+                self._nbytes -= evicted_nbytes
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+
+DEFAULT_ANSWER_HISTORY_CACHE = AnswerHistoryCache()
+
+
+def text_cache_key(text: str, required_lang: str) -> tuple:
+    digest = hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+    return ("text", required_lang, digest)
+
+
+def file_cache_key(kind: str, path: str, *extra: object) -> tuple | None:
+    try:
+        stat_result = os.stat(path)
+    except (OSError, TypeError, ValueError):
+        return None
+    return (
+        kind,
+        os.path.abspath(path),
+        stat_result.st_mtime_ns,
+        stat_result.st_size,
+        *extra,
+    )
+
+
 def content_paths(content: object) -> list[str]:
     if isinstance(content, dict):
         path = content.get("path")
@@ -41,6 +143,20 @@ def normalize_answer_text(text: str, required_lang: str) -> str:
     return text
 
 
+def cached_answer_text(
+    text: str,
+    required_lang: str,
+    history_cache: AnswerHistoryCache,
+) -> str:
+    if required_lang == "en" and text.isascii():
+        return text
+    key = text_cache_key(text, required_lang)
+    (hit, normalized_text) = history_cache.lookup(key)
+    if hit:
+        return normalized_text
+    return history_cache.store(key, normalize_answer_text(text, required_lang))
+
+
 def append_history_message(
     history_items: list[dict[str, str]],
     role: str,
@@ -78,6 +194,20 @@ def load_librosa_module() -> Any | None:
     return librosa_module
 
 
+def detach_answer_image(image: Any) -> Any | None:
+    if not hasattr(image, "load") or not hasattr(image, "copy"):
+        return image
+    try:
+        image.load()
+        return image.copy()
+    except Exception:
+        return None
+    finally:
+        close = getattr(image, "close", None)
+        if close is not None:
+            close()
+
+
 def read_answer_image(path: str, image_module: Any) -> Any | None:
     from definers.image import (
         get_max_resolution,
@@ -86,7 +216,7 @@ def read_answer_image(path: str, image_module: Any) -> Any | None:
     )
 
     try:
-        return image_module.open(path)
+        return detach_answer_image(image_module.open(path))
     except Exception:
         try:
             shape = image_resolution(path)
@@ -107,7 +237,7 @@ def read_answer_image(path: str, image_module: Any) -> Any | None:
                     if isinstance(resized, tuple):
                         return resized[1]
                     return resized
-                return image_module.open(path)
+                return detach_answer_image(image_module.open(path))
         except Exception:
             return None
     return None
@@ -140,9 +270,12 @@ def prepare_answer_history(
     history: list[dict[str, Any]],
     runtime: Any,
     dependency_loader: Any,
+    history_cache: AnswerHistoryCache | None = None,
 ) -> tuple[list[dict[str, str]], list[Any], list[Any]]:
     from definers.system import get_ext, read
 
+    if history_cache is None:
+        history_cache = DEFAULT_ANSWER_HISTORY_CACHE
     required_lang = "en"
     unloaded = object()
     image_module: Any = unloaded
@@ -161,46 +294,65 @@ def prepare_answer_history(
             content, tuple
         )
         if is_text:
-            add_content = normalize_answer_text(str(content), required_lang)
+            add_content = cached_answer_text(
+                str(content), required_lang, history_cache
+            )
         else:
             for path in content_paths(content):
                 extension = get_ext(path)
                 if extension in runtime.common_audio_formats:
-                    if soundfile_module is unloaded:
-                        soundfile_module = (
-                            dependency_loader.load_soundfile_module()
-                        )
-                    loaded_audio = read_answer_audio(
-                        path, soundfile_module, None
-                    )
-                    if loaded_audio is None:
-                        if librosa_module is unloaded:
-                            librosa_module = (
-                                dependency_loader.load_librosa_module()
+                    audio_key = file_cache_key("audio", path)
+                    (hit, loaded_audio) = history_cache.lookup(audio_key)
+                    if not hit:
+                        if soundfile_module is unloaded:
+                            soundfile_module = (
+                                dependency_loader.load_soundfile_module()
                             )
                         loaded_audio = read_answer_audio(
-                            path, None, librosa_module
+                            path, soundfile_module, None
                         )
+                        if loaded_audio is None:
+                            if librosa_module is unloaded:
+                                librosa_module = (
+                                    dependency_loader.load_librosa_module()
+                                )
+                            loaded_audio = read_answer_audio(
+                                path, None, librosa_module
+                            )
+                        history_cache.store(audio_key, loaded_audio)
                     if loaded_audio is not None:
                         audio_items.append(loaded_audio)
                         add_content += f" <|audio_{len(audio_items)}|>"
                 elif extension in runtime.iio_formats:
-                    if image_module is unloaded:
-                        image_module = dependency_loader.load_image_module()
-                    if image_module is not None:
-                        image = read_answer_image(path, image_module)
-                        if image is not None:
-                            image_items.append(image)
-                            add_content += f" <|image_{len(image_items)}|>"
+                    image_key = file_cache_key("image", path)
+                    (hit, image) = history_cache.lookup(image_key)
+                    if not hit:
+                        if image_module is unloaded:
+                            image_module = dependency_loader.load_image_module()
+                        if image_module is None:
+                            continue
+                        image = history_cache.store(
+                            image_key, read_answer_image(path, image_module)
+                        )
+                    if image is not None:
+                        image_items.append(image)
+                        add_content += f" <|image_{len(image_items)}|>"
                 else:
-                    try:
-                        file_content = read(path)
-                    except Exception:
-                        continue
-                    add_content += "\n\n" + normalize_answer_text(
-                        str(file_content),
-                        required_lang,
-                    )
+                    text_key = file_cache_key("text", path, required_lang)
+                    (hit, file_text) = history_cache.lookup(text_key)
+                    if not hit:
+                        try:
+                            file_content = read(path)
+                        except Exception:
+                            continue
+                        file_text = history_cache.store(
+                            text_key,
+                            normalize_answer_text(
+                                str(file_content),
+                                required_lang,
+                            ),
+                        )
+                    add_content += "\n\n" + file_text
         if add_content.strip():
             append_history_message(prepared_history, role, add_content)
     return prepared_history, image_items, audio_items
@@ -273,6 +425,8 @@ def answer(
     history: list[dict[str, Any]],
     runtime: Any | None = None,
     dependency_loader=None,
+    history_cache: AnswerHistoryCache | None = None,
+    generation_engine: Any | None = None,
 ):
     if runtime is None:
         from definers.constants import MODELS, PROCESSORS
@@ -294,6 +448,7 @@ def answer(
         history,
         runtime,
         dependency_loader,
+        history_cache,
     )
     if processor is None:
         return generate_answer_without_processor(
@@ -302,13 +457,19 @@ def answer(
             image_items,
             audio_items,
         )
-    return generate_answer_with_processor(
-        processor,
-        model,
-        prepared_history,
-        image_items,
-        audio_items,
-    )
+    if image_items or audio_items:
+        return generate_answer_with_processor(
+            processor,
+            model,
+            prepared_history,
+            image_items,
+            audio_items,
+        )
+    if generation_engine is None:
+        from definers.ml.answer.prefix_cache import answer_generation_engine
+
+        generation_engine = answer_generation_engine(model, processor)
+    return generation_engine.generate(prepared_history)
 
 
 __all__ = [glb for glb in globals() if not glb.startswith("_")]
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+
+from definers.runtime_numpy import get_numpy_module
+
+np = get_numpy_module()
+
+CV_EXECUTORS = ("thread", "process")
+_MAX_STRATIFIED_CLASSES = 256
+
+
+def _stratification_labels(labels, folds: int):
+    if labels is None:
+        return None
+    values = np.asarray(labels)
+    if values.ndim > 1:
+        if values.ndim != 2 or values.shape[-1] != 1:
+            return None
+        values = values.reshape(-1)
+    if values.dtype.kind == "f":
+        if not np.all(np.isfinite(values)) or not np.array_equal(
+            values, np.round(values)
+        ):
+            return None
+    elif values.dtype.kind not in "biuUSO":
+        return None
+    try:
+        (classes, inverse, counts) = np.unique(
+            values, return_inverse=True, return_counts=True
+        )
+    except TypeError:
+        return None
+    if (
+        classes.size < 2
+        or classes.size > _MAX_STRATIFIED_CLASSES
+        or counts.min() < folds
+    ):
+        return None
+    return inverse.reshape(-1)
+
+
+def fold_assignments(
+    sample_count: int,
+    folds: int,
+    labels=None,
+    *,
+    stratify: bool = True,
+) -> np.ndarray:
+    sample_count = int(sample_count)
+    folds = max(1, min(int(folds), max(sample_count, 1)))
+    encoded = _stratification_labels(labels, folds) if stratify else None
+    if encoded is None or encoded.size != sample_count:
+        fold_size = sample_count // folds
+        assignment = np.minimum(
+            np.arange(sample_count) // max(fold_size, 1), folds - 1
+        )
+        return assignment.astype(np.intp)
+    order = np.argsort(encoded, kind="stable")
+    class_starts = np.searchsorted(encoded[order], encoded[order])
+    assignment = np.empty(sample_count, dtype=np.intp)
+    assignment[order] = (np.arange(sample_count) - class_starts) % folds
+    return assignment
+
+
+def _contiguous_bounds(mask: np.ndarray) -> tuple[int, int] | None:
+    positions = np.flatnonzero(mask)
+    if positions.size == 0:
+        return None
+    start = int(positions[0])
+    stop = int(positions[-1]) + 1
+    if stop - start != positions.size:
+        return None
+    return start, stop
+
+
+def _split_rows(values, mask: np.ndarray):
+    bounds = _contiguous_bounds(mask)
+    if bounds is None:
+        return values[~mask], values[mask]
+    (start, stop) = bounds
+    if start == 0:
+        return values[stop:], values[start:stop]
+    if stop == mask.size:
+        return values[:start], values[start:stop]
+    return values[~mask], values[start:stop]
+
+
+def score_fold(model_factory, train_X, train_y, val_X, val_y):
+    fold_model = model_factory()
+    fold_model.fit(train_X, train_y)
+    if hasattr(fold_model, "score"):
+        return float(fold_model.score(val_X, val_y))
+    if hasattr(fold_model, "predict"):
+        predictions = fold_model.predict(val_X)
+        return float((np.asarray(predictions) == np.asarray(val_y)).mean())
+    return None
+
+
+def _resolve_cv_workers(
+    folds: int,
+    max_workers: int | None,
+    model_factory: Callable[[], object] | None = None,
+) -> int:
+    if max_workers is None:
+        if getattr(model_factory, "gpu_backed", False):
+            max_workers = 1
+        else:
+            max_workers = os.cpu_count() or 1
+    return max(1, min(int(max_workers), folds))
+
+
+def run_cross_validation(
+    features,
+    labels,
+    folds: int,
+    *,
+    model_factory: Callable[[], object],
+    stratify: bool = True,
+    max_workers: int | None = None,
+    executor: str = "thread",
+    on_score: Callable[[int, float], None] | None = None,
+    on_error: Callable[[Exception], None] | None = None,
+) -> list[float]:
+    from concurrent.futures import (
+        FIRST_COMPLETED,
+        ProcessPoolExecutor,
+        ThreadPoolExecutor,
+        wait,
+    )
+
+    normalized_executor = str(executor).strip().lower()
+    if normalized_executor not in CV_EXECUTORS:
+        raise ValueError(
+            f"Unsupported cross-validation executor: {executor!r}; "
+            f"expected one of {', '.join(CV_EXECUTORS)}"
+        )
+    sample_count = int(getattr(features, "shape", [len(features)])[0])
+    folds = max(2, min(int(folds), sample_count))
+    assignment = fold_assignments(
+        sample_count, folds, labels, stratify=stratify
+    )
+    worker_count = _resolve_cv_workers(folds, max_workers, model_factory)
+    pool_cls = (
+        ProcessPoolExecutor
+        if normalized_executor == "process" and worker_count > 1
+        else ThreadPoolExecutor
+    )
+    fold_scores: dict[int, float] = {}
+    fold_indices = iter(range(folds))
+    with pool_cls(max_workers=worker_count) as pool:
+        in_flight = {}
+
+        def submit_next() -> None:
+            for fold_index in fold_indices:
+                validation_mask = assignment == fold_index
+                if validation_mask.all() or not validation_mask.any():
+                    continue
+                (train_X, val_X) = _split_rows(features, validation_mask)
+                (train_y, val_y) = _split_rows(labels, validation_mask)
+                future = pool.submit(
+                    score_fold, model_factory, train_X, train_y, val_X, val_y
+                )
+                in_flight[future] = fold_index
+                return
+
+        for _ in range(worker_count):
+            submit_next()
+        while in_flight:
+            done, _pending = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                fold_index = in_flight.pop(future)
+                submit_next()
+                try:
+                    score = future.result()
+                except Exception as fold_error:
+                    if on_error is not None:
+                        on_error(fold_error)
+                    continue
+                if score is None:
+                    continue
+                fold_scores[fold_index] = score
+                if on_score is not None:
+                    on_score(fold_index, score)
+    return [fold_scores[index] for index in sorted(fold_scores)]
+
+
+__all__ = [
+    "CV_EXECUTORS",
+    "fold_assignments",
+    "run_cross_validation",
+    "score_fold",
+]
@@ -1,3 +1,9 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+
 def ensure_summary_runtime():
     from definers.constants import MODELS, TOKENIZERS
     from definers.system.download_activity import report_download_activity
@@ -13,14 +19,58 @@ def ensure_summary_runtime():
         init_pretrained_model("summary")
 
 
+SUMMARY_PREFIX = "summarize: "
+SUMMARY_BATCH_SIZE = 8
+SUMMARY_CACHE_SIZE = 4096
+_SUMMARY_CACHE: dict[str, object] = {"model": None, "entries": None}
+_SUMMARY_CACHE_LOCK = threading.Lock()
+
+
+def summary_cache_key(text_to_summarize, generation_kwargs):
+    payload = json.dumps(
+        [text_to_summarize, generation_kwargs], sort_keys=True, default=repr
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _summary_cache_entries(model):
+    if _SUMMARY_CACHE["model"] is not model:
+        _SUMMARY_CACHE["model"] = model
+        _SUMMARY_CACHE["entries"] = OrderedDict()
+    return _SUMMARY_CACHE["entries"]
+
+
+def cached_summary(model, key):
+    with _SUMMARY_CACHE_LOCK:
+        entries = _summary_cache_entries(model)
+        cached = entries.get(key)
+        if cached is not None:
+            entries.move_to_end(key)
+        return cached
+
+
+def store_summary(model, key, summarized_text):
+    with _SUMMARY_CACHE_LOCK:
+        entries = _summary_cache_entries(model)
+        entries[key] = summarized_text
+        entries.move_to_end(key)
+        while len(entries) > SUMMARY_CACHE_SIZE:
+            entries.popitem(last=False)
+
+
+def clear_summary_cache():
+    with _SUMMARY_CACHE_LOCK:
+        _SUMMARY_CACHE["model"] = None
+        _SUMMARY_CACHE["entries"] = None
+
+
 def encode_summary_prompt(text_to_summarize):
     from definers.constants import TOKENIZERS
     from definers.cuda import device
 
     ensure_summary_runtime()
-    prefix = "summarize: "
     encoded = TOKENIZERS["summary"](
-        prefix + text_to_summarize,
+        SUMMARY_PREFIX + text_to_summarize,
         return_tensors="pt",
         truncation=True,
         max_length=512,
@@ -57,6 +107,11 @@ def summarize(text_to_summarize: str) -> str:
 
     report = create_activity_reporter(2)
     ensure_summary_runtime()
+    generation_kwargs = summary_generation_kwargs()
+    cache_key = summary_cache_key(text_to_summarize, generation_kwargs)
+    cached = cached_summary(MODELS["summary"], cache_key)
+    if cached is not None:
+        return cached
     report(
         1,
         "Encode summary prompt",
@@ -70,10 +125,62 @@ def summarize(text_to_summarize: str) -> str:
     )
     generated = MODELS["summary"].generate(
         **encoded,
-        **summary_generation_kwargs(),
+        **generation_kwargs,
         max_length=512,
     )
-    return TOKENIZERS["summary"].decode(generated[0], skip_special_tokens=True)
+    summarized_text = TOKENIZERS["summary"].decode(
+        generated[0], skip_special_tokens=True
+    )
+    store_summary(MODELS["summary"], cache_key, summarized_text)
+    return summarized_text
+
+
+def summarize_batch(texts, batch_size=SUMMARY_BATCH_SIZE, report=None):
+    from definers.constants import MODELS, TOKENIZERS
+    from definers.cuda import device
+
+    ensure_summary_runtime()
+    model = MODELS["summary"]
+    tokenizer = TOKENIZERS["summary"]
+    generation_kwargs = summary_generation_kwargs()
+    keys = [summary_cache_key(text, generation_kwargs) for text in texts]
+    summaries = {}
+    pending = {}
+    for text, key in zip(texts, keys):
+        cached = cached_summary(model, key)
+        if cached is not None:
+            summaries[key] = cached
+        elif key not in pending:
+            pending[key] = text
+    pending_items = sorted(
+        pending.items(), key=lambda item: len(item[1].split())
+    )
+    batch_size = max(int(batch_size), 1)
+    active_device = device()
+    for start in range(0, len(pending_items), batch_size):
+        batch = pending_items[start : start + batch_size]
+        if report is not None:
+            report(start + len(batch), len(pending_items))
+        encoded = tokenizer(
+            [SUMMARY_PREFIX + text for _key, text in batch],
+            return_tensors="pt",
+            padding=True,
+            truncation=True,
+            max_length=512,
+        )
+        generated = model.generate(
+            **{
+                name: tensor.to(active_device)
+                for name, tensor in encoded.items()
+            },
+            **generation_kwargs,
+            max_length=512,
+        )
+        decoded = tokenizer.batch_decode(generated, skip_special_tokens=True)
+        for (key, _text), summarized_text in zip(batch, decoded):
+            summaries[key] = summarized_text
+            store_summary(model, key, summarized_text)
+    return [summaries[key] for key in keys]
 
 
 def map_reduce_summary(text: str, max_words: int) -> str:
@@ -92,20 +199,20 @@ def map_reduce_summary(text: str, max_words: int) -> str:
             detail=f"Running map-reduce pass {iteration}.",
             phase="step",
         )
-        chunk_summaries = []
         chunk_texts = list(summary_chunks(text, chunk_size, overlap))
         chunk_report = create_activity_reporter(len(chunk_texts) or 1)
-        for chunk_index, chunk_text in enumerate(chunk_texts, start=1):
+
+        def report_chunks(completed, total, pass_index=iteration):
             chunk_report(
-                chunk_index,
+                completed,
                 "Summarize chunks",
                 detail=(
-                    f"Summarizing chunk {chunk_index}/{len(chunk_texts) or 1} "
-                    f"in pass {iteration}."
+                    f"Summarizing chunks {completed}/{total or 1} "
+                    f"in pass {pass_index}."
                 ),
             )
-            chunk_summaries.append(summarize(chunk_text))
-        text = " ".join(chunk_summaries)
+
+        text = " ".join(summarize_batch(chunk_texts, report=report_chunks))
     return summarize(text)
 
 
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import os
+import tempfile
+import weakref
 from time import time
 from typing import Any
 
-from definers.runtime_numpy import get_array_module
+from definers.runtime_numpy import get_array_module, get_numpy_module
 
 np = get_array_module()
+host_np = get_numpy_module()
 
 from definers.ml.contracts import (
     ArrayConcatenatePort,
@@ -92,7 +95,125 @@ def _normalize_training_store(value: Any) -> Any | None:
     return value
 
 
-def _accumulate_training_rows(
+_MIN_TRAINING_ROW_CAPACITY = 16
+_TRAINING_ROW_BUFFERS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _remove_row_buffer_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class TrainingRowBuffer:
+    def __init__(
+        self,
+        rows: Any,
+        *,
+        capacity: int = 0,
+        directory: str | None = None,
+    ) -> None:
+        values = host_np.asarray(rows)
+        if values.ndim == 0:
+            raise ValueError("Training rows need at least one dimension")
+        self.directory = directory
+        self.row_shape = tuple(values.shape[1:])
+        self._storage = None
+        self._path: str | None = None
+        self._finalizer = None
+        self._size = 0
+        self._view = None
+        self._allocate(
+            max(int(capacity), values.shape[0], _MIN_TRAINING_ROW_CAPACITY),
+            values.dtype,
+        )
+        self.extend(values)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return int(self._storage.shape[0])
+
+    @property
+    def dtype(self) -> Any:
+        return self._storage.dtype
+
+    @property
+    def is_memory_mapped(self) -> bool:
+        return self._path is not None
+
+    def view(self) -> Any:
+        if self._view is None:
+            self._view = self._storage[: self._size]
+        return self._view
+
+    def owns(self, value: Any) -> bool:
+        return value is not None and value is self._view
+
+    def accepts(self, rows: Any) -> bool:
+        return (
+            isinstance(rows, host_np.ndarray)
+            and rows.ndim >= 1
+            and tuple(rows.shape[1:]) == self.row_shape
+        )
+
+    def extend(self, rows: Any, repeat: int = 1) -> Any:
+        values = host_np.asarray(rows)
+        repeat = max(int(repeat), 0)
+        required = self._size + values.shape[0] * repeat
+        dtype = host_np.result_type(self.dtype, values.dtype)
+        if required > self.capacity or dtype != self.dtype:
+            self._allocate(max(required, self.capacity * 2), dtype)
+        for _ in range(repeat):
+            end = self._size + values.shape[0]
+            self._storage[self._size : end] = values
+            self._size = end
+        self._view = None
+        return self.view()
+
+    def _allocate(self, capacity: int, dtype: Any) -> None:
+        dtype = host_np.dtype(dtype)
+        shape = (capacity,) + self.row_shape
+        nbytes = int(host_np.prod(shape, dtype=host_np.int64)) * dtype.itemsize
+        if self.directory is None or nbytes == 0:
+            self._replace_storage(host_np.empty(shape, dtype=dtype), None)
+            return
+        if self._path is not None and self._storage.dtype == dtype:
+            self._storage.flush()
+            os.truncate(self._path, nbytes)
+            self._storage = host_np.memmap(
+                self._path, dtype=dtype, mode="r+", shape=shape
+            )
+            return
+        handle, path = tempfile.mkstemp(
+            prefix="definers-rows-",
+            suffix=".bin",
+            dir=self.directory,
+        )
+        os.close(handle)
+        self._replace_storage(
+            host_np.memmap(path, dtype=dtype, mode="w+", shape=shape),
+            path,
+        )
+
+    def _replace_storage(self, storage: Any, path: str | None) -> None:
+        if self._storage is not None and self._size:
+            storage[: self._size] = self._storage[: self._size]
+        if self._finalizer is not None:
+            self._finalizer()
+        self._storage = storage
+        self._path = path
+        self._finalizer = (
+            None
+            if path is None
+            else weakref.finalize(self, _remove_row_buffer_file, path)
+        )
+
+
+def _concatenate_rows(
     current_value: Any | None,
     new_value: Any,
     epochs: int,
@@ -111,6 +232,45 @@ def _accumulate_training_rows(
     return accumulated
 
 
+def _model_row_buffers(model: Any) -> dict[str, TrainingRowBuffer]:
+    try:
+        return _TRAINING_ROW_BUFFERS.setdefault(model, {})
+    except TypeError:
+        return {}
+
+
+def _accumulate_training_rows(
+    model: Any,
+    attribute: str,
+    new_value: Any,
+    epochs: int,
+    concatenate: ArrayConcatenatePort,
+    buffer_dir: str | None = None,
+) -> Any:
+    current_value = _normalize_training_store(getattr(model, attribute, None))
+    if current_value is not None and epochs <= 0:
+        return current_value
+    buffers = _model_row_buffers(model)
+    buffer = buffers.pop(attribute, None)
+    if (
+        buffer is not None
+        and buffer.owns(current_value)
+        and buffer.accepts(new_value)
+    ):
+        buffers[attribute] = buffer
+        return buffer.extend(new_value, epochs)
+    if not isinstance(new_value, host_np.ndarray) or new_value.ndim == 0:
+        return _concatenate_rows(current_value, new_value, epochs, concatenate)
+    rows = new_value
+    if current_value is not None:
+        rows = concatenate((current_value, new_value), axis=0)
+        if not isinstance(rows, host_np.ndarray):
+            return _concatenate_rows(rows, new_value, epochs - 1, concatenate)
+    buffer = TrainingRowBuffer(rows, directory=buffer_dir)
+    buffers[attribute] = buffer
+    return buffer.extend(new_value, epochs - 1)
+
+
 def feed(
     model: Any,
     X_new: Any,
@@ -119,25 +279,24 @@ def feed(
     epochs: int = 1,
     logger: LogPort,
     concatenate: ArrayConcatenatePort,
+    buffer_dir: str | None = None,
 ):
     current_model = model or HybridModel()
-    current_X = _normalize_training_store(getattr(current_model, "X_all", None))
     if y_new is None:
         for epoch in range(epochs):
             logger(f"Feeding epoch {epoch + 1} X", X_new)
         current_model.X_all = _accumulate_training_rows(
-            current_X, X_new, epochs, concatenate
+            current_model, "X_all", X_new, epochs, concatenate, buffer_dir
         )
         return current_model
-    current_y = _normalize_training_store(getattr(current_model, "y_all", None))
     for epoch in range(epochs):
         logger(f"Feeding epoch {epoch + 1} X", X_new)
         logger(f"Feeding epoch {epoch + 1} y", y_new)
     current_model.X_all = _accumulate_training_rows(
-        current_X, X_new, epochs, concatenate
+        current_model, "X_all", X_new, epochs, concatenate, buffer_dir
     )
     current_model.y_all = _accumulate_training_rows(
-        current_y, y_new, epochs, concatenate
+        current_model, "y_all", y_new, epochs, concatenate, buffer_dir
     )
     return current_model
 
@@ -232,11 +391,20 @@ def train_linear_regression(
     return model_torch
 
 
+def _dense_model_rows(values: Any) -> Any:
+    if hasattr(values, "tocsr"):
+        return host_np.asarray(values.toarray(), dtype=host_np.float32)
+    return values
+
+
 class HybridModel:
+    gpu_backed = True
+
     def __init__(self):
         self.model = None
 
     def fit(self, X, y=None):
+        X = _dense_model_rows(X)
         if y is not None:
             import importlib
 
@@ -273,6 +441,7 @@ class HybridModel:
 
         if self.model is None:
             raise ValueError("Model must be trained before prediction.")
+        X = _dense_model_rows(X)
         start_predict = time()
         predictions = self.model.predict(X)
         if hasattr(np, "cuda"):
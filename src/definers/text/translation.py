@@ -3,6 +3,7 @@ from __future__ import annotations
 import re
 import sys
 from collections.abc import Callable
+from functools import lru_cache
 
 from definers.constants import (
     MODELS,
@@ -45,7 +46,31 @@ def resolve_target_language(lang: str) -> tuple[str, str]:
     return normalized_lang, normalized_lang
 
 
+LONG_PARAGRAPH_THRESHOLD = 800
+MIN_TRANSLATION_BATCH_TOKENS = 4096
+DEFAULT_TRANSLATION_BATCH_TOKENS = 65536
+MAX_TRANSLATION_BATCH_TOKENS = 1048576
+_BYTES_PER_BEAM_TOKEN = 128 * 1024
+_PUNCT_NORMALIZERS: dict[tuple[object, str], object] = {}
+
+
+def get_punct_normalizer(language_code: str):
+    from sacremoses import MosesPunctNormalizer
+
+    cache_key = (MosesPunctNormalizer, language_code)
+    normalizer = _PUNCT_NORMALIZERS.get(cache_key)
+    if normalizer is None:
+        normalizer = MosesPunctNormalizer(lang=language_code)
+        _PUNCT_NORMALIZERS[cache_key] = normalizer
+    return normalizer
+
+
 def get_sentence_splitter(source_code: str):
+    return _load_sentence_splitter(source_code[:3])
+
+
+@lru_cache(maxsize=64)
+def _load_sentence_splitter(source_code: str):
     try:
         import importlib
 
@@ -57,7 +82,7 @@ def get_sentence_splitter(source_code: str):
         def get_split_algo(*_args, **_kwargs):
             return lambda value: [value]
 
-    return get_split_algo(source_code[:3], "default")
+    return get_split_algo(source_code, "default")
 
 
 def translation_error(paragraph: str) -> str:
@@ -77,29 +102,86 @@ def matches_empty_text(value: str | None) -> bool:
     return value is None or value.strip() == ""
 
 
-def translate_text_segment(
+def translation_batch_token_budget() -> int:
+    try:
+        import torch
+
+        if str(device()).startswith("cuda") and torch.cuda.is_available():
+            (free_bytes, _total_bytes) = torch.cuda.mem_get_info()
+            return max(
+                MIN_TRANSLATION_BATCH_TOKENS,
+                min(
+                    int(free_bytes) // _BYTES_PER_BEAM_TOKEN,
+                    MAX_TRANSLATION_BATCH_TOKENS,
+                ),
+            )
+    except Exception:
+        pass
+    return DEFAULT_TRANSLATION_BATCH_TOKENS
+
+
+def segment_token_lengths(tokenizer: object, texts: list[str]) -> list[int]:
+    encoded = tokenizer(list(texts), truncation=True)
+    return [len(input_ids) for input_ids in encoded["input_ids"]]
+
+
+def plan_translation_batches(
+    lengths: list[int], token_budget: int, num_beams: int = 1
+) -> list[list[int]]:
+    order = sorted(range(len(lengths)), key=lambda index: lengths[index])
+    batches: list[list[int]] = []
+    current: list[int] = []
+    for index in order:
+        padded_length = max(int(lengths[index]), 1)
+        if (
+            current
+            and (len(current) + 1) * padded_length * max(num_beams, 1)
+            > token_budget
+        ):
+            batches.append(current)
+            current = []
+        current.append(index)
+    if current:
+        batches.append(current)
+    return batches
+
+
+def translate_text_segments(
     model: object,
     tokenizer: object,
-    text: str,
+    texts: list[str],
     target_code: str,
     generation_kwargs: dict,
-) -> str:
+) -> list[str]:
     inputs = tokenizer(
-        text,
+        list(texts),
         return_tensors="pt",
         padding=True,
         truncation=True,
     )
-    input_ids = inputs.input_ids.to(device())
+    active_device = device()
     forced_token_id = tokenizer.convert_tokens_to_ids(target_code)
     translated_ids = model.generate(
-        input_ids=input_ids,
+        input_ids=inputs.input_ids.to(active_device),
+        attention_mask=inputs.attention_mask.to(active_device),
         forced_bos_token_id=forced_token_id,
         renormalize_logits=True,
         max_length=512,
         **generation_kwargs,
     )
-    return tokenizer.decode(translated_ids[0], skip_special_tokens=True)
+    return tokenizer.batch_decode(translated_ids, skip_special_tokens=True)
+
+
+def translate_text_segment(
+    model: object,
+    tokenizer: object,
+    text: str,
+    target_code: str,
+    generation_kwargs: dict,
+) -> str:
+    return translate_text_segments(
+        model, tokenizer, [text], target_code, generation_kwargs
+    )[0]
 
 
 def translate_with_code_using(
@@ -123,9 +205,55 @@ def translate_with_code_using(
     return "".join(processed_parts)
 
 
-def ai_translate(text: str, lang: str = "en") -> str:
-    from sacremoses import MosesPunctNormalizer
+def _translate_source_group(
+    model: object,
+    tokenizer: object,
+    source_code: str,
+    texts: list[str],
+    target_code: str,
+    generation_kwargs: dict,
+    report_batch: Callable[[int], None],
+    catch: Callable[[Exception], None],
+) -> list[str | None]:
+    tokenizer.src_lang = source_code
+    translated: list[str | None] = [None] * len(texts)
+    batches = plan_translation_batches(
+        segment_token_lengths(tokenizer, texts),
+        translation_batch_token_budget(),
+        int(generation_kwargs.get("num_beams", 1)),
+    )
+    for batch in batches:
+        report_batch(len(batch))
+        batch_texts = [texts[index] for index in batch]
+        try:
+            outputs = translate_text_segments(
+                model, tokenizer, batch_texts, target_code, generation_kwargs
+            )
+        except Exception as error:
+            if len(batch) == 1:
+                catch(error)
+                continue
+            outputs = []
+            for text in batch_texts:
+                try:
+                    outputs.extend(
+                        translate_text_segments(
+                            model,
+                            tokenizer,
+                            [text],
+                            target_code,
+                            generation_kwargs,
+                        )
+                    )
+                except Exception as segment_error:
+                    catch(segment_error)
+                    outputs.append(None)
+        for index, output in zip(batch, outputs):
+            translated[index] = output
+    return translated
+
 
+def ai_translate(text: str, lang: str = "en") -> str:
     from definers.system import catch
     from definers.system.download_activity import (
         create_activity_reporter,
@@ -135,7 +263,6 @@ def ai_translate(text: str, lang: str = "en") -> str:
     if not text or not text.strip():
         return ""
     normalized_text = strip_nikud(text)
-    long_paragraph_threshold = 800
     target_code = resolve_target_code(lang)
     if MODELS["translate"] is None or TOKENIZERS["translate"] is None:
         from definers.ml import init_pretrained_model
@@ -149,14 +276,18 @@ def ai_translate(text: str, lang: str = "en") -> str:
     model = MODELS["translate"]
     tokenizer = TOKENIZERS["translate"]
     tokenizer.tgt_lang = target_code
-    translated_paragraphs: list[str] = []
+    generation_kwargs = dict(beam_kwargs)
+    generation_kwargs["num_beams"] = higher_beams
     paragraphs = normalized_text.split("\n")
+    translated_paragraphs: list[str] = list(paragraphs)
+    paragraph_segments: dict[int, list[tuple[str, int]]] = {}
+    source_texts: dict[str, list[str]] = {}
     paragraph_total = sum(1 for paragraph in paragraphs if paragraph.strip())
     paragraph_report = create_activity_reporter(paragraph_total or 1)
     paragraph_index = 0
-    for paragraph in paragraphs:
+    for position, paragraph in enumerate(paragraphs):
         if not paragraph.strip():
-            translated_paragraphs.append("")
+            translated_paragraphs[position] = ""
             continue
         paragraph_index += 1
         paragraph_report(
@@ -170,64 +301,71 @@ def ai_translate(text: str, lang: str = "en") -> str:
             )
         except (KeyError, Exception) as error:
             catch(error)
-            translated_paragraphs.append(paragraph)
             continue
         if source_code == target_code:
-            translated_paragraphs.append(paragraph)
-            continue
-        punct_normalizer = MosesPunctNormalizer(lang=source_language_code)
-        paragraph = punct_normalizer.normalize(paragraph)
-        splitter = get_sentence_splitter(source_code)
-        tokenizer.src_lang = source_code
-        generation_kwargs = dict(beam_kwargs)
-        generation_kwargs["num_beams"] = higher_beams
-        if len(paragraph) < long_paragraph_threshold:
-            try:
-                translated_paragraphs.append(
-                    translate_text_segment(
-                        model,
-                        tokenizer,
-                        paragraph,
-                        target_code,
-                        generation_kwargs,
-                    )
-                )
-            except Exception as error:
-                catch(error)
-                translated_paragraphs.append(translation_error(paragraph))
             continue
         try:
-            translated_sentences = []
-            sentences = [
-                sentence
-                for sentence in list(splitter(paragraph))
-                if sentence.strip()
-            ]
-            sentence_report = create_activity_reporter(len(sentences) or 1)
-            for sentence_index, sentence in enumerate(sentences, start=1):
-                if not sentence.strip():
-                    continue
-                sentence_report(
-                    sentence_index,
-                    "Translate sentence",
-                    detail=(
-                        f"Paragraph {paragraph_index}/{paragraph_total}, "
-                        f"sentence {sentence_index}/{len(sentences) or 1}."
-                    ),
-                )
-                translated_sentences.append(
-                    translate_text_segment(
-                        model,
-                        tokenizer,
-                        sentence,
-                        target_code,
-                        generation_kwargs,
-                    )
-                )
-            translated_paragraphs.append(" ".join(translated_sentences))
+            paragraph = get_punct_normalizer(source_language_code).normalize(
+                paragraph
+            )
+            translated_paragraphs[position] = paragraph
+            if len(paragraph) < LONG_PARAGRAPH_THRESHOLD:
+                segments = [paragraph]
+            else:
+                splitter = get_sentence_splitter(source_code)
+                segments = [
+                    sentence
+                    for sentence in list(splitter(paragraph))
+                    if sentence.strip()
+                ]
         except Exception as error:
             catch(error)
-            translated_paragraphs.append(translation_error(paragraph))
+            translated_paragraphs[position] = translation_error(paragraph)
+            continue
+        group = source_texts.setdefault(source_code, [])
+        paragraph_segments[position] = [
+            (source_code, len(group) + offset)
+            for offset in range(len(segments))
+        ]
+        group.extend(segments)
+    segment_total = sum(len(texts) for texts in source_texts.values())
+    batch_report = create_activity_reporter(segment_total or 1)
+    translated_segments: dict[str, list[str | None]] = {}
+    completed_segments = 0
+
+    def report_batch(batch_size: int) -> None:
+        nonlocal completed_segments
+        completed_segments += batch_size
+        batch_report(
+            completed_segments,
+            "Translate batch",
+            detail=(
+                f"Translating segments {completed_segments}/{segment_total}."
+            ),
+        )
+
+    for source_code, texts in source_texts.items():
+        translated_segments[source_code] = _translate_source_group(
+            model,
+            tokenizer,
+            source_code,
+            texts,
+            target_code,
+            generation_kwargs,
+            report_batch,
+            catch,
+        )
+    for position, segments in paragraph_segments.items():
+        outputs = [
+            translated_segments[source_code][index]
+            for source_code, index in segments
+        ]
+        if any(output is None for output in outputs):
+            translated_paragraphs[position] = translation_error(
+                translated_paragraphs[position]
+            )
+            continue
+        translated_paragraphs[position] = " ".join(outputs)
     return "\n".join(translated_paragraphs)
 
 
@@ -8,35 +8,37 @@ from definers.system import catch
 np, _np = init_cupy_numpy()
 
 
-def extract_video_features(video_path, frame_interval=10):
+def iter_video_features(video_path, frame_interval=10):
     import cv2
 
-    cap = None
+    cap = cv2.VideoCapture(video_path)
     try:
-        cap = cv2.VideoCapture(video_path)
         if not cap.isOpened():
             raise ValueError("Error opening video file.")
         frame_count = 0
-        all_frame_features = []
         while True:
             (ret, frame) = cap.read()
             if not ret:
                 break
             if frame_count % frame_interval == 0:
                 frame_gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                all_frame_features.append(
-                    _extract_visual_features(frame, frame_gray)
-                )
+                yield _extract_visual_features(frame, frame_gray)
             frame_count += 1
+    finally:
+        cap.release()
+
+
+def extract_video_features(video_path, frame_interval=10):
+    try:
+        all_frame_features = list(
+            iter_video_features(video_path, frame_interval)
+        )
         if not all_frame_features:
             return None
         return np.array(all_frame_features)
     except Exception as e:
         catch(e)
         return None
-    finally:
-        if cap is not None:
-            cap.release()
 
 
 def features_to_video(
@@ -58,7 +58,7 @@ def _clear_scipy_stubs():
 def _test_import_module(name, package=None):
     if name == "sox":
         raise ImportError
-    if name == "sklearn" or name.startswith("sklearn."):
+    if name.split(".")[0] in {"sklearn", "transformers"}:
         _clear_scipy_stubs()
     return _original_import_module(name, package)
 
@@ -66,7 +66,7 @@ def _test_import_module(name, package=None):
 def _test_import(name, globals=None, locals=None, fromlist=(), level=0):
     if name == "sox":
         raise ImportError
-    if name == "sklearn" or name.startswith("sklearn."):
+    if name.split(".")[0] in {"sklearn", "transformers"}:
         _clear_scipy_stubs()
     return _original_import(name, globals, locals, fromlist, level)
 
@@ -0,0 +1,155 @@
+import sys
+import types
+
+import pytest
+
+import definers.text.translation as translation
+from definers.constants import MODELS, TOKENIZERS
+
+
+class _Encoded(dict):
+    def __getattr__(self, name):
+        return self[name]
+
+
+class _Tensor(list):
+    def to(self, _device):
+        return self
+
+
+class _FakeTokenizer:
+    def __init__(self):
+        self.src_lang = None
+        self.tgt_lang = None
+
+    def __call__(self, texts, return_tensors=None, padding=False, **_kwargs):
+        input_ids = [[self.src_lang, *text.split()] for text in texts]
+        if return_tensors is None:
+            return _Encoded(input_ids=input_ids)
+        width = max(len(ids) for ids in input_ids)
+        return _Encoded(
+            input_ids=_Tensor(
+                ids + ["<pad>"] * (width - len(ids)) for ids in input_ids
+            ),
+            attention_mask=_Tensor(
+                [1] * len(ids) + [0] * (width - len(ids)) for ids in input_ids
+            ),
+        )
+
+    def convert_tokens_to_ids(self, code):
+        return code
+
+    def batch_decode(self, rows, skip_special_tokens=True):
+        return [
+            " ".join(
+                token.upper()
+                for token in row[1:]
+                if not (skip_special_tokens and token == "<pad>")
+            )
+            for row in rows
+        ]
+
+
+class _FakeModel:
+    def __init__(self, fail_on=None):
+        self.batches = []
+        self.fail_on = fail_on
+
+    def generate(self, input_ids, attention_mask, forced_bos_token_id, **_):
+        self.batches.append((input_ids[0][0], len(input_ids)))
+        if self.fail_on is not None and any(
+            self.fail_on in row for row in input_ids
+        ):
+            raise RuntimeError("generation failed")
+        return input_ids
+
+
+@pytest.fixture
+def translate_runtime(monkeypatch):
+    tokenizer = _FakeTokenizer()
+    model = _FakeModel()
+    monkeypatch.setitem(MODELS, "translate", model)
+    monkeypatch.setitem(TOKENIZERS, "translate", tokenizer)
+    monkeypatch.setitem(
+        sys.modules,
+        "sacremoses",
+        types.SimpleNamespace(
+            MosesPunctNormalizer=lambda lang: types.SimpleNamespace(
+                normalize=lambda value: value.strip()
+            )
+        ),
+    )
+    monkeypatch.setattr(translation, "device", lambda: "cpu")
+    monkeypatch.setattr(translation, "resolve_target_code", lambda lang: "en")
+    monkeypatch.setattr(
+        translation,
+        "resolve_source_translation_context",
+        lambda paragraph: (
+            ("fr", "fr") if paragraph.startswith("fr") else ("he", "he")
+        ),
+    )
+    monkeypatch.setattr(
+        translation,
+        "get_sentence_splitter",
+        lambda _code: lambda value: value.split(". "),
+    )
+    monkeypatch.setattr(translation, "LONG_PARAGRAPH_THRESHOLD", 40)
+    monkeypatch.setattr(
+        "definers.system.download_activity.report_download_activity",
+        lambda *args, **kwargs: None,
+    )
+    return model
+
+
+def test_document_is_translated_in_a_few_language_batches(translate_runtime):
+    paragraphs = [f"he words {index}" for index in range(200)]
+    paragraphs[10] = "fr bonjour"
+    paragraphs[20] = ""
+
+    translated = translation.ai_translate("\n".join(paragraphs)).split("\n")
+
+    assert translated[0] == "HE WORDS 0"
+    assert translated[10] == "FR BONJOUR"
+    assert translated[20] == ""
+    assert translated[199] == "HE WORDS 199"
+    assert sorted(translate_runtime.batches) == [("fr", 1), ("he", 198)]
+
+
+def test_long_paragraph_sentences_are_rejoined(translate_runtime):
+    document = (
+        "he one two three. he four five six. he seven eight nine ten\nhe x"
+    )
+
+    translated = translation.ai_translate(document)
+
+    assert translated == (
+        "HE ONE TWO THREE HE FOUR FIVE SIX HE SEVEN EIGHT NINE TEN\nHE X"
+    )
+    assert translate_runtime.batches == [("he", 4)]
+
+
+def test_failed_batch_retries_segments_individually(translate_runtime):
+    translate_runtime.fail_on = "broken"
+    caught = []
+    import definers.system as system_module
+
+    original_catch = system_module.catch
+    system_module.catch = caught.append
+    try:
+        translated = translation.ai_translate("he fine\nhe broken\nhe ok")
+    finally:
+        system_module.catch = original_catch
+
+    lines = translated.split("\n")
+    assert lines[0] == "HE FINE"
+    assert lines[1] == translation.translation_error("he broken")
+    assert lines[2] == "HE OK"
+    assert len(caught) == 1
+
+
+def test_plan_translation_batches_respects_beam_token_budget():
+    lengths = [5, 50, 6, 7, 48, 120]
+
+    batches = translation.plan_translation_batches(lengths, 399, num_beams=4)
+
+    assert batches == [[0, 2, 3], [4], [1], [5]]
@@ -0,0 +1,168 @@
+import os
+
+from definers.ml.answer import service as answer_service
+from definers.ml.answer.service import (
+    AnswerHistoryCache,
+    prepare_answer_history,
+)
+from tests.test_application_ml_answer_history_preparer import (
+    TrackingDependencyLoader,
+    runtime_stub,
+)
+
+
+def _counting_normalizer(monkeypatch):
+    calls = []
+
+    def normalize(text, required_lang):
+        calls.append(text)
+        return text.upper()
+
+    monkeypatch.setattr(answer_service, "normalize_answer_text", normalize)
+    return calls
+
+
+def test_follow_up_turn_only_prepares_the_new_message(monkeypatch):
+    calls = _counting_normalizer(monkeypatch)
+    cache = AnswerHistoryCache()
+    history = [
+        {"role": "user", "content": "café"},
+        {"role": "assistant", "content": "olé"},
+    ]
+
+    first, _images, _audio = prepare_answer_history(
+        history, runtime_stub(), TrackingDependencyLoader(), cache
+    )
+    history.append({"role": "user", "content": "über"})
+    second, _images, _audio = prepare_answer_history(
+        history, runtime_stub(), TrackingDependencyLoader(), cache
+    )
+
+    assert calls == ["café", "olé", "über"]
+    assert second[:3] == first
+    assert second[-1] == {"role": "user", "content": "ÜBER"}
+
+
+def test_cached_files_are_invalidated_by_modification(monkeypatch, tmp_path):
+    import definers.system as system_module
+
+    calls = _counting_normalizer(monkeypatch)
+    reads = []
+    images = []
+    image_path = tmp_path / "photo.jpg"
+    image_path.write_bytes(b"jpg")
+    notes_path = tmp_path / "notes.txt"
+    notes_path.write_text("first")
+    monkeypatch.setattr(
+        system_module, "get_ext", lambda path: path.rsplit(".", 1)[-1]
+    )
+    monkeypatch.setattr(
+        system_module,
+        "read",
+        lambda path: reads.append(path) or open(path).read(),
+    )
+    monkeypatch.setattr(
+        answer_service,
+        "read_answer_image",
+        lambda path, image_module: images.append(path) or object(),
+    )
+    cache = AnswerHistoryCache()
+    history = [
+        {
+            "role": "user",
+            "content": (
+                {"path": str(image_path)},
+                {"path": str(notes_path)},
+            ),
+        }
+    ]
+
+    loader = TrackingDependencyLoader(image_module=object())
+    first, first_images, _audio = prepare_answer_history(
+        history, runtime_stub(), loader, cache
+    )
+    repeat_loader = TrackingDependencyLoader(image_module=object())
+    second, second_images, _audio = prepare_answer_history(
+        history, runtime_stub(), repeat_loader, cache
+    )
+
+    assert second == first
+    assert second_images == first_images
+    assert len(images) == len(reads) == len(calls) == 1
+    assert repeat_loader.image_calls == 0
+
+    notes_path.write_text("second edit")
+    stat_result = os.stat(notes_path)
+    os.utime(
+        notes_path,
+        ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 10**9),
+    )
+    third, _images, _audio = prepare_answer_history(
+        history, runtime_stub(), repeat_loader, cache
+    )
+
+    assert len(images) == 1
+    assert len(reads) == 2
+    assert third[-1]["content"].endswith("SECOND EDIT")
+
+
+def test_history_cache_evicts_least_recently_used_entries():
+    cache = AnswerHistoryCache(max_entries=2)
+    cache.store(("a",), 1)
+    cache.store(("b",), None)
+    assert cache.lookup(("a",)) == (True, 1)
+    cache.store(("c",), 3)
+
+    assert len(cache) == 2
+    assert cache.lookup(("b",)) == (False, None)
+    assert cache.lookup(("a",)) == (True, 1)
+    assert cache.store(None, 4) == 4
+    assert cache.lookup(None) == (False, None)
+
+
+def test_history_cache_is_bounded_by_bytes():
+    import numpy as np
+
+    cache = AnswerHistoryCache(max_bytes=3000)
+    cache.store(("a",), np.zeros(1000, dtype=np.uint8))
+    cache.store(("b",), (np.zeros(1000, dtype=np.uint8), 16000))
+    cache.store(("c",), np.zeros(1500, dtype=np.uint8))
+
+    assert cache.lookup(("a",)) == (False, None)
+    assert cache.lookup(("b",))[0]
+    assert cache.lookup(("c",))[0]
+    assert cache.nbytes <= 3000
+
+    oversized = np.zeros(4000, dtype=np.uint8)
+    assert cache.store(("c",), oversized) is oversized
+    assert cache.lookup(("c",)) == (False, None)
+    assert cache.nbytes == answer_service.history_value_nbytes(
+        cache.lookup(("b",))[1]
+    )
+    cache.clear()
+    assert cache.nbytes == 0
+
+
+def test_cached_images_are_loaded_copies_without_open_files(tmp_path):
+    from PIL import Image
+
+    image_path = tmp_path / "photo.png"
+    Image.new("RGB", (8, 4), "red").save(image_path)
+    opened = []
+
+    class TrackingImageModule:
+        @staticmethod
+        def open(path):
+            image = Image.open(path)
+            opened.append(image)
+            return image
+
+    image = answer_service.read_answer_image(
+        str(image_path), TrackingImageModule
+    )
+
+    assert image is not opened[0]
+    assert opened[0].fp is None
+    assert getattr(image, "fp", None) is None
+    assert image.getpixel((0, 0)) == (255, 0, 0)
+    assert answer_service.history_value_nbytes(image) == 8 * 4 * 3
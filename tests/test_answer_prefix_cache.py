@@ -0,0 +1,236 @@
+from types import SimpleNamespace
+
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from definers.ml.answer.prefix_cache import (
+    AnswerGenerationEngine,
+    cache_nbytes,
+    common_prefix_length,
+)
+from definers.ml.answer.service import answer
+from tests.test_application_ml_answer_history_preparer import runtime_stub
+
+
+class _TinyCausalModel(torch.nn.Module):
+    def __init__(self, width=128, layers=2):
+        super().__init__()
+        torch.manual_seed(0)
+        self.embed = torch.nn.Embedding(256, width)
+        self.projections = torch.nn.ModuleList(
+            torch.nn.Linear(width, 3 * width) for _ in range(layers)
+        )
+        self.forward_tokens = []
+
+    def forward(
+        self, input_ids, attention_mask=None, past_key_values=None, **kwargs
+    ):
+        self.forward_tokens.append(int(input_ids.shape[1]))
+        hidden = self.embed(input_ids)
+        past_length = (
+            0 if past_key_values is None else past_key_values[0][0].shape[-2]
+        )
+        new_length = hidden.shape[1]
+        positions = torch.arange(past_length + new_length)
+        visible = (
+            positions[None, :]
+            <= (past_length + torch.arange(new_length))[:, None]
+        )
+        next_cache = []
+        for index, projection in enumerate(self.projections):
+            (query, key, value) = projection(hidden).chunk(3, dim=-1)
+            key = key[:, None]
+            value = value[:, None]
+            if past_key_values is not None:
+                key = torch.cat((past_key_values[index][0], key), dim=-2)
+                value = torch.cat((past_key_values[index][1], value), dim=-2)
+            scores = (
+                query[:, None] @ key.transpose(-1, -2) / key.shape[-1] ** 0.5
+            )
+            scores = scores.masked_fill(~visible, float("-inf"))
+            hidden = hidden + (scores.softmax(-1) @ value)[:, 0]
+            next_cache.append((key, value))
+        logits = hidden @ self.embed.weight.T
+        return SimpleNamespace(logits=logits, past_key_values=tuple(next_cache))
+
+    def generate(
+        self, input_ids, attention_mask=None, past_key_values=None, **kwargs
+    ):
+        cached = (
+            0 if past_key_values is None else past_key_values[0][0].shape[-2]
+        )
+        sequence = input_ids.repeat_interleave(kwargs.get("num_beams", 1), 0)
+        step_ids = sequence[:, cached:]
+        with torch.no_grad():
+            for _ in range(4):
+                outputs = self(step_ids, past_key_values=past_key_values)
+                past_key_values = outputs.past_key_values
+                step_ids = outputs.logits[:, -1:].argmax(-1)
+                sequence = torch.cat((sequence, step_ids), dim=1)
+        return sequence[:1]
+
+
+class _Batch(dict):
+    def to(self, device):
+        return self
+
+
+class _ByteProcessor:
+    def __init__(self):
+        self.tokenizer = SimpleNamespace(apply_chat_template=self._template)
+
+    @staticmethod
+    def _template(history, tokenize, add_generation_prompt):
+        rendered = "".join(
+            f"<{message['role']}>{message['content']}" for message in history
+        )
+        return rendered + "<assistant>"
+
+    def __call__(self, text, return_tensors):
+        input_ids = torch.tensor([[ord(char) % 256 for char in text]])
+        return _Batch(
+            input_ids=input_ids, attention_mask=torch.ones_like(input_ids)
+        )
+
+    def batch_decode(self, output_ids, **kwargs):
+        return [
+            ",".join(str(int(token)) for token in row) for row in output_ids
+        ]
+
+
+def _conversation(turns, words=6):
+    history = [{"role": "system", "content": "system"}]
+    for turn in range(turns):
+        history.append(
+            {
+                "role": "user",
+                "content": " ".join(["question"] * words) + str(turn),
+            }
+        )
+        history.append({"role": "assistant", "content": f"reply {turn}"})
+    return history
+
+
+def test_common_prefix_length_stops_at_first_mismatch():
+    assert common_prefix_length((1, 2, 3), (1, 2, 4, 5)) == 2
+    assert common_prefix_length((1, 2), (1, 2, 3)) == 2
+    assert common_prefix_length((), (1,)) == 0
+
+
+def test_follow_up_turn_only_prefills_the_new_suffix():
+    model = _TinyCausalModel()
+    engine = AnswerGenerationEngine(model, _ByteProcessor(), device="cpu")
+    first_history = _conversation(2)
+    engine.generate(first_history)
+    first_prompt = engine.last_stats["prompt_tokens"]
+    follow_up = first_history + [{"role": "user", "content": "and then?"}]
+    model.forward_tokens = []
+
+    reply = engine.generate(follow_up)
+
+    reused = engine.last_stats["reused_tokens"]
+    assert reused == first_prompt - len("assistant>")
+    suffix = engine.last_stats["prompt_tokens"] - reused
+    assert model.forward_tokens[:2] == [suffix - 1, 1]
+    assert len(engine) == 1
+    cold = AnswerGenerationEngine(
+        _TinyCausalModel(), _ByteProcessor(), device="cpu"
+    )
+    assert cold.generate(follow_up) == reply
+    assert cold.last_stats["reused_tokens"] == 0
+
+
+def test_prefix_cache_is_evicted_by_memory_budget():
+    model = _TinyCausalModel(width=16, layers=1)
+    probe = AnswerGenerationEngine(model, _ByteProcessor(), device="cpu")
+    probe.generate(_conversation(1))
+    budget = probe.cached_bytes + 1024
+    engine = AnswerGenerationEngine(
+        model, _ByteProcessor(), memory_budget_bytes=budget, device="cpu"
+    )
+
+    engine.generate(_conversation(1))
+    engine.generate([{"role": "system", "content": "other"}] + _conversation(1))
+
+    assert len(engine) == 1
+    assert engine.cached_bytes <= budget
+    (entry,) = engine._entries.values()
+    assert cache_nbytes(entry.past_key_values) == entry.nbytes
+    assert AnswerGenerationEngine(
+        model, _ByteProcessor(), memory_budget_bytes=0, device="cpu"
+    ).generate(_conversation(1))
+
+
+def test_reused_prefix_cuts_time_to_first_token():
+    model = _TinyCausalModel(width=256)
+    engine = AnswerGenerationEngine(model, _ByteProcessor(), device="cpu")
+    history = _conversation(24, words=12)
+    engine.generate(history)
+    cold_seconds = engine.last_stats["prefill_seconds"]
+
+    engine.generate(history + [{"role": "user", "content": "next"}])
+
+    assert engine.last_stats["reused_tokens"] > 2000
+    assert engine.last_stats["prefill_seconds"] < cold_seconds
+
+
+def test_engine_matches_uncached_beam_search_in_transformers_generate():
+    transformers = pytest.importorskip("transformers")
+    from definers.constants import beam_kwargs
+
+    torch.manual_seed(0)
+    model = transformers.LlamaForCausalLM(
+        transformers.LlamaConfig(
+            vocab_size=256,
+            hidden_size=32,
+            intermediate_size=64,
+            num_hidden_layers=2,
+            num_attention_heads=4,
+            num_key_value_heads=2,
+        )
+    ).eval()
+    processor = _ByteProcessor()
+    engine = AnswerGenerationEngine(
+        model, processor, device="cpu", max_length=200
+    )
+    first_history = _conversation(2)
+    follow_up = first_history + [{"role": "user", "content": "and then?"}]
+
+    replies = [engine.generate(first_history), engine.generate(follow_up)]
+
+    assert engine.last_stats["reused_tokens"] > 0
+    for history, reply in zip((first_history, follow_up), replies):
+        inputs = engine._encode(history)
+        with torch.no_grad():
+            uncached = model.generate(
+                **inputs,
+                **beam_kwargs,
+                max_length=200,
+            )
+        expected = processor.batch_decode(
+            uncached[:, inputs["input_ids"].shape[1] :]
+        )[0]
+        assert reply == expected
+
+
+def test_answer_routes_text_only_turns_through_generation_engine():
+    prompts = []
+    engine = SimpleNamespace(
+        generate=lambda history: prompts.append(history) or "cached"
+    )
+    runtime = runtime_stub(model=object(), processor=object())
+
+    result = answer(
+        [{"role": "user", "content": "hello"}],
+        runtime=runtime,
+        generation_engine=engine,
+    )
+
+    assert result == "cached"
+    assert prompts == [
+        [
+            {"role": "system", "content": "system"},
+            {"role": "user", "content": "hello"},
+        ]
+    ]
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from definers.audio.envelopes import boxcar_mean
+
+
+@pytest.mark.parametrize("sample_count", [1, 2, 7, 64])
+@pytest.mark.parametrize("window_size", [1, 2, 5, 8, 65, 101])
+def test_boxcar_mean_matches_same_mode_convolution(sample_count, window_size):
+    values = np.random.default_rng(sample_count).standard_normal(
+        (3, sample_count)
+    )
+
+    averaged = boxcar_mean(values, window_size)
+
+    expected = np.stack(
+        [
+            np.convolve(
+                channel, np.ones(window_size) / window_size, mode="same"
+            )
+            for channel in values
+        ]
+    )
+    assert averaged.shape == expected.shape
+    np.testing.assert_allclose(averaged, expected, atol=1e-12)
+
+
+def test_boxcar_mean_edge_padding_keeps_dtype_and_length():
+    values = np.array([[1.0, 2.0, 3.0, 4.0, 5.0]], dtype=np.float32)
+
+    averaged = boxcar_mean(values, 3, padding=" Edge ")
+
+    assert averaged.dtype == np.float32
+    np.testing.assert_allclose(
+        averaged, [[4.0 / 3.0, 2.0, 3.0, 4.0, 14.0 / 3.0]], rtol=1e-6
+    )
+    assert boxcar_mean(np.arange(4), 2).dtype == np.float32
+    with pytest.raises(ValueError):
+        boxcar_mean(values, 3, padding="reflect")
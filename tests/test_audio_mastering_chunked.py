@@ -0,0 +1,129 @@
+import numpy as np
+
+from definers.audio.dsp import process_audio_chunks
+from definers.audio.mastering import SmartMastering
+from definers.audio.mastering.loudness import get_lufs, measure_true_peak
+
+
+def _stepped_program(sample_rate, seconds):
+    times = np.arange(int(sample_rate * seconds)) / float(sample_rate)
+    envelope = np.where((times % 8.0) < 4.0, 0.5, 0.05)
+    return (
+        np.vstack(
+            [
+                np.sin(2.0 * np.pi * 220.0 * times),
+                np.sin(2.0 * np.pi * 330.0 * times),
+            ]
+        )
+        * envelope
+    ).astype(np.float32)
+
+
+def test_process_chunked_matches_whole_file_render():
+    sample_rate = 8000
+    audio = _stepped_program(sample_rate, 16.0)
+    whole = SmartMastering(sample_rate, resampling_target=sample_rate)
+    chunked = SmartMastering(
+        sample_rate,
+        resampling_target=sample_rate,
+        chunk_seconds=4.0,
+        chunk_overlap_seconds=1.0,
+    )
+
+    _rate, whole_render = whole.process(audio, sample_rate)
+    chunked_rate, chunked_render = chunked.process_chunked(audio, sample_rate)
+
+    assert chunked_rate == sample_rate
+    assert chunked_render.shape == whole_render.shape
+    assert chunked.last_chunked_render_windows == 5
+    assert chunked.render_window is None
+    assert (
+        abs(
+            get_lufs(chunked_render, sample_rate)
+            - get_lufs(whole_render, sample_rate)
+        )
+        <= 0.05
+    )
+    segment = 3 * sample_rate
+    for start in range(0, whole_render.shape[-1] - segment + 1, segment):
+        assert (
+            abs(
+                get_lufs(
+                    chunked_render[:, start : start + segment], sample_rate
+                )
+                - get_lufs(
+                    whole_render[:, start : start + segment], sample_rate
+                )
+            )
+            <= 0.25
+        )
+    assert (
+        abs(
+            measure_true_peak(chunked_render, sample_rate)
+            - measure_true_peak(whole_render, sample_rate)
+        )
+        <= 0.1
+    )
+    assert len(chunked.last_finalization_actions) == len(
+        whole.last_finalization_actions
+    )
+    assert len(chunked.last_peak_catch_events) == len(
+        whole.last_peak_catch_events
+    )
+    assert (
+        chunked.last_character_stage_decision.reverted
+        == whole.last_character_stage_decision.reverted
+    )
+    assert np.shape(chunked.last_stage_signals.get("post_limiter")) == (
+        audio.shape
+    )
+
+
+def test_render_in_windows_only_splits_while_chunked():
+    mastering = SmartMastering(8000, resampling_target=8000)
+    audio = _stepped_program(8000, 10.0)
+    calls = []
+
+    def halve(window):
+        calls.append(window.shape)
+        return window * 0.5
+
+    assert np.allclose(mastering.render_in_windows(halve, audio), audio * 0.5)
+    assert calls == [audio.shape]
+
+    calls.clear()
+    mastering.render_window = (8000 * 4, 8000)
+    rendered = mastering.render_in_windows(halve, audio[0])
+
+    assert rendered.shape == audio[0].shape
+    assert np.allclose(rendered, audio[0] * 0.5, atol=1e-6)
+    assert calls == [(8000 * 4,)] * 3
+    assert mastering.last_chunked_render_windows == 3
+
+
+def test_process_audio_chunks_overlap_add_is_transparent():
+    audio = np.random.default_rng(0).standard_normal((2, 10000))
+
+    for chunk_size, overlap in [(4096, 1024), (4096, 0), (4096, 3000)]:
+        np.testing.assert_allclose(
+            process_audio_chunks(
+                lambda chunk: chunk, audio, chunk_size, overlap
+            ),
+            audio,
+            atol=1e-6,
+        )
+
+
+def test_process_audio_chunks_aligns_last_window_to_the_input_end():
+    audio = np.arange(1.0, 10001.0)[np.newaxis, :]
+    chunks = []
+
+    def record(chunk):
+        chunks.append(chunk.copy())
+        return chunk
+
+    process_audio_chunks(record, audio, 4096, 1024)
+
+    assert [chunk.shape[-1] for chunk in chunks] == [4096] * 3
+    assert chunks[-1][0, -1] == audio[0, -1]
+    assert np.all(chunks[-1] != 0.0)
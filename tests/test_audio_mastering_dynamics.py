@@ -172,6 +172,46 @@ def test_apply_spatial_enhancement_adds_subtle_stereo_tonal_variation_to_high_ba
     assert 0.0 < mastering.last_stereo_motion_correlation_guard <= 1.0
 
 
+def test_apply_spatial_enhancement_accepts_shared_boxcar():
+    from definers.audio.envelopes import boxcar_mean
+
+    def build_mastering():
+        return SimpleNamespace(
+            stereo_width=1.1,
+            mono_bass_hz=140.0,
+            low_cut=20.0,
+            high_cut=3900.0,
+            resampling_target=8000,
+            stereo_tone_variation_db=0.8,
+            stereo_tone_variation_cutoff_hz=1200.0,
+            stereo_tone_variation_smoothing_ms=40.0,
+        )
+
+    source = (
+        np.random.default_rng(3).standard_normal((2, 4000)).astype(np.float32)
+        * 0.2
+    )
+    legacy_mastering = build_mastering()
+    shared_mastering = build_mastering()
+
+    legacy = DYNAMICS_MODULE.apply_spatial_enhancement(
+        legacy_mastering,
+        source,
+        signal_module=scipy_signal,
+    )
+    shared = DYNAMICS_MODULE.apply_spatial_enhancement(
+        shared_mastering,
+        source,
+        signal_module=scipy_signal,
+        boxcar_fn=boxcar_mean,
+    )
+
+    np.testing.assert_allclose(shared, legacy, atol=1e-5)
+    assert shared_mastering.last_stereo_motion_activity == pytest.approx(
+        legacy_mastering.last_stereo_motion_activity, abs=1e-5
+    )
+
+
 def test_apply_spatial_enhancement_restrains_motion_when_band_is_already_anti_phase():
     mastering = SimpleNamespace(
         stereo_width=1.0,
@@ -0,0 +1,231 @@
+import os
+import time
+from collections import deque
+
+import numpy as np
+import pytest
+
+from definers.audio.dependencies import numba_available
+from definers.audio.mastering import SmartMastering, eq, gate_kernels
+
+
+def _legacy_moving_average(values, window_size):
+    samples = np.asarray(values, dtype=np.float32).reshape(-1)
+    window_size = max(1, min(int(window_size), samples.size))
+    cumulative = np.cumsum(samples, dtype=np.float64)
+    smoothed = np.empty_like(samples)
+    for index in range(samples.size):
+        start = max(0, index - window_size + 1)
+        total = cumulative[index]
+        if start > 0:
+            total -= cumulative[start - 1]
+        smoothed[index] = total / float(index - start + 1)
+    return smoothed
+
+
+def _legacy_rolling_max(values, window_size):
+    samples = np.asarray(values, dtype=np.float32).reshape(-1)
+    window_size = max(1, min(int(window_size), samples.size))
+    rolling: deque[int] = deque()
+    output = np.empty_like(samples)
+    for index, value in enumerate(samples):
+        while rolling and rolling[0] <= index - window_size:
+            rolling.popleft()
+        while rolling and samples[rolling[-1]] <= value:
+            rolling.pop()
+        rolling.append(index)
+        output[index] = samples[rolling[0]]
+    return output
+
+
+def _legacy_one_pole_cascade(channel, sample_rate, lowpass_hz, highpass_hz):
+    dt = 1.0 / float(sample_rate)
+    filtered = channel.astype(np.float32, copy=True)
+    rc = 1.0 / max(2.0 * np.pi * lowpass_hz, 1e-6)
+    alpha = float(np.clip(dt / (rc + dt), 0.0, 1.0))
+    for _ in range(2):
+        source = filtered
+        filtered = np.empty_like(source)
+        filtered[0] = source[0]
+        for index in range(1, source.size):
+            filtered[index] = filtered[index - 1] + alpha * (
+                source[index] - filtered[index - 1]
+            )
+    rc = 1.0 / max(2.0 * np.pi * highpass_hz, 1e-6)
+    alpha = float(np.clip(rc / (rc + dt), 0.0, 1.0))
+    for _ in range(4):
+        source = filtered
+        filtered = np.empty_like(source)
+        filtered[0] = source[0]
+        for index in range(1, source.size):
+            filtered[index] = alpha * (
+                filtered[index - 1] + source[index] - source[index - 1]
+            )
+    return filtered
+
+
+def _legacy_gate_curves(levels, threshold_db, close_db, hold, spans, attack):
+    state = np.zeros(levels.size, dtype=np.float32)
+    open_curve = np.zeros(levels.size, dtype=np.float64)
+    gate_open = False
+    hold_remaining = 0
+    current_open = 0.0
+    for index, level_db in enumerate(levels):
+        if gate_open:
+            if level_db < close_db:
+                if hold_remaining > 0:
+                    hold_remaining -= 1
+                else:
+                    gate_open = False
+            else:
+                hold_remaining = hold
+        elif level_db >= threshold_db:
+            gate_open = True
+            hold_remaining = hold
+        state[index] = 1.0 if gate_open else 0.0
+        target = 1.0 if gate_open and hold_remaining > 0 else 0.25
+        span = attack if target > current_open else spans[index]
+        current_open += (target - current_open) / float(span)
+        current_open = float(np.clip(current_open, 0.0, 1.0))
+        open_curve[index] = current_open
+    return state, open_curve
+
+
+def _gated_test_signal(sample_rate, seconds, seed=0):
+    rng = np.random.default_rng(seed)
+    times = np.arange(int(sample_rate * seconds)) / float(sample_rate)
+    phrase = (np.sin(2.0 * np.pi * 0.5 * times) > 0.0) * 0.5 + 0.01
+    return (
+        np.vstack(
+            [
+                np.sin(2.0 * np.pi * 220.0 * times) * phrase,
+                np.sin(2.0 * np.pi * 330.0 * times) * phrase,
+            ]
+        )
+        + rng.standard_normal((2, times.size)) * 0.003
+    ).astype(np.float32)
+
+
+@pytest.mark.parametrize("window_size", [1, 2, 3, 17, 256, 5000])
+def test_trailing_mean_and_rolling_max_match_reference_loops(window_size):
+    values = np.random.default_rng(1).standard_normal(3001).astype(np.float32)
+
+    assert np.array_equal(
+        eq._moving_average(values, window_size),
+        _legacy_moving_average(values, window_size),
+    )
+    assert np.array_equal(
+        eq._rolling_max(values, window_size),
+        _legacy_rolling_max(values, window_size),
+    )
+    assert np.array_equal(
+        gate_kernels._rolling_max_blocks(values, min(window_size, 3001)),
+        _legacy_rolling_max(values, window_size),
+    )
+
+
+def test_trailing_mean_runs_along_last_axis_of_channels():
+    values = np.random.default_rng(2).standard_normal((2, 900))
+
+    smoothed = gate_kernels.trailing_mean(values, 40)
+
+    assert smoothed.dtype == np.float32
+    assert np.array_equal(smoothed[1], _legacy_moving_average(values[1], 40))
+
+
+def test_one_pole_cascade_matches_reference_sidechain_filters():
+    channel = np.random.default_rng(3).standard_normal(2048).astype(np.float32)
+    expected = _legacy_one_pole_cascade(channel, 8000, 1800.0, 90.0)
+
+    compiled = gate_kernels._one_pole_cascade_kernel(
+        channel,
+        np.float32(gate_kernels._one_pole_coefficients(8000, 1800.0)[0]),
+        2,
+        np.float32(gate_kernels._one_pole_coefficients(8000, 90.0)[1]),
+        4,
+    )
+    filtered = eq._apply_gate_sidechain_filters(
+        channel,
+        8000,
+        {"sidechain_hpf_hz": 90.0, "sidechain_lpf_hz": 1800.0},
+    )
+
+    assert np.array_equal(compiled, expected)
+    assert filtered.shape == (1, channel.size)
+    assert np.allclose(filtered[0], expected, atol=1e-5)
+
+
+@pytest.mark.parametrize("hold_samples", [0, 1, 7])
+def test_gate_kernels_match_reference_state_machine(hold_samples):
+    rng = np.random.default_rng(4)
+    levels = np.repeat(rng.uniform(-80.0, 0.0, 300), 6)
+    spans = rng.integers(1, 30, levels.size).astype(np.float64)
+    expected_state, expected_open = _legacy_gate_curves(
+        levels, -30.0, -36.0, hold_samples, spans, 3.0
+    )
+
+    state, held = gate_kernels.gate_hysteresis(
+        levels, -30.0, -36.0, hold_samples
+    )
+    vector_state, vector_held = gate_kernels._gate_hysteresis_vectorized(
+        levels, -30.0, -36.0, hold_samples
+    )
+    open_curve = gate_kernels.gate_open_curve(
+        np.where(held, 1.0, 0.25), spans, 3.0
+    )
+
+    assert np.array_equal(state.astype(np.float32), expected_state)
+    assert np.array_equal(vector_state, state)
+    assert np.array_equal(vector_held, held)
+    assert np.array_equal(open_curve, expected_open)
+
+
+def test_nearest_zero_crossings_prefers_earlier_crossing_on_ties():
+    samples = np.array([1.0, -1.0, -1.0, 1.0, 1.0, 1.0, 1.0, -1.0])
+
+    nearest = gate_kernels.nearest_zero_crossings(
+        samples, np.array([2, 5, 6, 0]), 2
+    )
+
+    assert nearest.tolist() == [1, 3, 7, 1]
+    assert gate_kernels.nearest_zero_crossings(
+        samples, np.array([5]), 0
+    ).tolist() == [5]
+
+
+def test_stem_cleanup_keeps_shape_and_finite_samples():
+    sample_rate = 44100
+    source = _gated_test_signal(sample_rate, 1.0)
+
+    cleaned = SmartMastering(sample_rate).apply_stem_cleanup(
+        source, stem_role="vocals"
+    )
+
+    assert cleaned.shape == source.shape
+    assert np.all(np.isfinite(cleaned))
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(
+    os.environ.get("DEFINERS_RUN_BENCHMARKS") != "1",
+    reason="set DEFINERS_RUN_BENCHMARKS=1 to run benchmarks",
+)
+def test_benchmark_stem_cleanup_seconds_per_audio_minute(record_property):
+    sample_rate = 44100
+    seconds = 5.0
+    source = _gated_test_signal(sample_rate, seconds)
+    mastering = SmartMastering(sample_rate)
+    mastering.apply_stem_cleanup(source[:, :sample_rate], stem_role="vocals")
+
+    started = time.perf_counter()
+    cleaned = mastering.apply_stem_cleanup(source, stem_role="vocals")
+    elapsed = time.perf_counter() - started
+    seconds_per_audio_minute = elapsed * 60.0 / seconds
+
+    assert cleaned.shape == source.shape
+    record_property("seconds_per_audio_minute", seconds_per_audio_minute)
+    record_property("numba", numba_available())
+    print(
+        f"stem cleanup: {seconds_per_audio_minute:.2f} s per audio minute "
+        f"(numba={numba_available()})"
+    )
@@ -807,6 +807,94 @@ def test_multiband_compress_uses_zero_phase_lr4_filters(
     )
 
 
+def test_multiband_compress_reuses_crossover_bank_for_all_channels(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    mastering = MASTERING_MODULE.SmartMastering(8000, resampling_target=8000)
+    source = np.tile(np.arange(16, dtype=float), (2, 1))
+    butter_calls: list[str] = []
+    sosfiltfilt_shapes: list[tuple[int, ...]] = []
+
+    mastering.bands = [
+        {
+            "fc": fc,
+            "base_threshold": 100.0,
+            "ratio": 2.0,
+            "attack_ms": 1.0,
+            "release_ms": 1.0,
+            "makeup_db": 0.0,
+            "knee_db": 1.0,
+        }
+        for fc in (150.0, 900.0, 2500.0)
+    ]
+
+    def fake_butter(order, cutoff, btype, output):
+        butter_calls.append(btype)
+        return f"{btype}-sos"
+
+    def fake_sosfiltfilt(sos, x, axis=-1):
+        sosfiltfilt_shapes.append(np.shape(x))
+        return np.array(x, copy=True) * (0.25 if sos == "low-sos" else 0.75)
+
+    monkeypatch.setattr(MASTERING_MODULE.signal, "butter", fake_butter)
+    monkeypatch.setattr(
+        MASTERING_MODULE.signal,
+        "sosfiltfilt",
+        fake_sosfiltfilt,
+    )
+
+    first = mastering.multiband_compress(source)
+    second = mastering.multiband_compress(source)
+
+    assert butter_calls == ["low", "high", "low", "high"]
+    assert sosfiltfilt_shapes == [(2, 16)] * 8
+    assert np.allclose(first, source)
+    assert np.array_equal(first, second)
+    assert np.array_equal(source[0], np.arange(16, dtype=float))
+
+
+def test_crossover_bank_cache_is_safe_across_threads():
+    import importlib
+    import threading
+
+    dynamics = importlib.import_module("definers.audio.mastering.dynamics")
+    signal_module = types.SimpleNamespace(
+        butter=lambda order, cutoff, btype, output: f"{btype}-sos"
+    )
+    barrier = threading.Barrier(8)
+    errors = []
+
+    def hammer(worker_index):
+        barrier.wait()
+        try:
+            for step in range(2000):
+                sample_rate = 8000 + (worker_index * 40 + step) % 48
+                bank = dynamics.get_crossover_bank(
+                    sample_rate, (200.0,), signal_module=signal_module
+                )
+                assert bank.sample_rate == sample_rate
+        except Exception as error:
+            errors.append(error)
+
+    workers = [
+        threading.Thread(target=hammer, args=(index,)) for index in range(8)
+    ]
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert errors == []
+    assert (
+        len(dynamics._CROSSOVER_BANKS) <= dynamics._CROSSOVER_BANK_CACHE_LIMIT
+    )
+
+
 def test_multiband_compress_links_stereo_gain(
     monkeypatch: pytest.MonkeyPatch,
 ):
@@ -3127,6 +3215,7 @@ def test_master_routes_stem_mastering_through_audio_separator_pipeline(
         mastered_stems_bit_depth=32,
         mastered_stems_bitrate=320,
         mastered_stems_compression_level=9,
+        stem_execution="thread",
     ):
         helper_calls.append(
             (
@@ -3289,6 +3378,7 @@ def test_master_auto_selects_preset_before_stem_mastering_helper(
         mastered_stems_bit_depth=32,
         mastered_stems_bitrate=320,
         mastered_stems_compression_level=9,
+        stem_execution="thread",
     ):
         helper_calls.append(
             {
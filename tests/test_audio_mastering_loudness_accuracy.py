@@ -4,6 +4,7 @@ import numpy as np
 import pytest
 from scipy import signal as scipy_signal
 
+from definers.audio.mastering import loudness as loudness_module
 from definers.audio.mastering.loudness import (
     get_lufs,
     measure_mastering_loudness,
@@ -129,3 +130,82 @@ def test_measure_mastering_loudness_falls_back_when_signal_has_no_lfilter() -> (
         reference.max_momentary_lufs,
         abs=_BLOCK_LOUDNESS_ABSOLUTE_TOLERANCE,
     )
+
+
+def test_weighted_power_tail_matches_filtering_silence_padded_signal() -> None:
+    sample_rate = 48000
+    tone = np.vstack(
+        [_tone(220.0, 2.0, sample_rate), _tone(330.0, 2.0, sample_rate)]
+    )
+    padded = np.pad(tone, ((0, 0), (0, int(sample_rate * 1.5))))
+
+    power, tail_power = loudness_module._weighted_power_series(
+        tone,
+        sample_rate,
+        signal_module=scipy_signal,
+        tail_seconds=1.5,
+    )
+    padded_power, _unused_tail = loudness_module._weighted_power_series(
+        padded,
+        sample_rate,
+        signal_module=scipy_signal,
+    )
+
+    assert np.allclose(
+        np.concatenate((power, tail_power)),
+        padded_power,
+        rtol=1e-12,
+        atol=1e-15,
+    )
+
+
+def test_block_powers_from_cumulative_match_sliding_window_means() -> None:
+    power = np.random.default_rng(7).uniform(0.0, 1.0, 1000)
+
+    blocks = loudness_module._block_powers_from_cumulative(
+        loudness_module._cumulative_power(power),
+        100,
+        0.4,
+        0.1,
+    )
+    expected = np.lib.stride_tricks.sliding_window_view(power, 40)[::10].mean(
+        axis=-1
+    )
+
+    assert np.allclose(blocks, expected, rtol=1e-12)
+
+
+def test_loudness_series_maps_silent_and_invalid_blocks_to_gate_floor() -> None:
+    series = loudness_module._loudness_series(
+        np.array([1.0, 0.0, -1.0, np.nan, np.inf, 1e-3])
+    )
+
+    assert series[0] == pytest.approx(-0.691)
+    assert series[1:5].tolist() == [-70.0] * 4
+    assert series[5] == pytest.approx(-30.691)
+
+
+def test_measure_mastering_loudness_accepts_stateless_lfilter() -> None:
+    tone = _tone(220.0, 4.0, 8000)
+    stateless_signal = SimpleNamespace(
+        resample_poly=scipy_signal.resample_poly,
+        lfilter=lambda b, a, y, axis=-1: loudness_module._fallback_lfilter(
+            b, a, y, axis=axis
+        ),
+    )
+
+    reference = measure_mastering_loudness(tone, 8000)
+    metrics = measure_mastering_loudness(
+        tone,
+        8000,
+        signal_module=stateless_signal,
+    )
+
+    assert metrics.integrated_lufs == pytest.approx(
+        reference.integrated_lufs,
+        abs=5e-5,
+    )
+    assert metrics.loudness_range_lu == pytest.approx(
+        reference.loudness_range_lu,
+        abs=0.05,
+    )
@@ -0,0 +1,127 @@
+import numpy as np
+import pytest
+
+from definers.audio.dsp import process_audio_chunks
+from definers.audio.mastering.loudness import (
+    LoudnessMeter,
+    LoudnessMeterReading,
+    measure_mastering_loudness,
+)
+
+
+def _stepped_program(sample_rate, seconds, seed=0):
+    rng = np.random.default_rng(seed)
+    times = np.arange(int(sample_rate * seconds)) / float(sample_rate)
+    envelope = np.where((times % 6.0) < 3.0, 0.5, 0.05)
+    return (
+        np.vstack(
+            [
+                np.sin(2.0 * np.pi * 440.0 * times) * envelope,
+                np.sin(2.0 * np.pi * 660.0 * times) * envelope,
+            ]
+        )
+        + rng.standard_normal((2, times.size)) * 0.01
+    ).astype(np.float32)
+
+
+def _assert_reading_matches_offline(reading, offline):
+    assert reading.integrated_lufs == pytest.approx(
+        offline.integrated_lufs, abs=1e-6
+    )
+    assert reading.max_momentary_lufs == pytest.approx(
+        offline.max_momentary_lufs, abs=1e-6
+    )
+    assert reading.max_short_term_lufs == pytest.approx(
+        offline.max_short_term_lufs, abs=1e-6
+    )
+    assert reading.loudness_range_lu == pytest.approx(
+        offline.loudness_range_lu, abs=0.05
+    )
+    assert reading.sample_peak_dbfs == pytest.approx(offline.sample_peak_dbfs)
+    assert reading.true_peak_dbfs == pytest.approx(
+        offline.true_peak_dbfs, abs=1e-4
+    )
+
+
+@pytest.mark.parametrize("block_size", [512, 3001, 44100])
+def test_loudness_meter_matches_offline_meter_for_any_block_size(block_size):
+    sample_rate = 44100
+    audio = _stepped_program(sample_rate, 15.0)
+    meter = LoudnessMeter(sample_rate)
+
+    for start in range(0, audio.shape[-1], block_size):
+        meter.push(audio[:, start : start + block_size])
+
+    reading = meter.reading()
+
+    _assert_reading_matches_offline(
+        reading, measure_mastering_loudness(audio, sample_rate)
+    )
+    assert reading.duration_seconds == pytest.approx(15.0)
+    assert reading.momentary_lufs == pytest.approx(
+        measure_mastering_loudness(
+            audio[:, -17640:], sample_rate
+        ).integrated_lufs,
+        abs=0.01,
+    )
+
+
+def test_loudness_meter_matches_offline_meter_before_first_full_window():
+    sample_rate = 48000
+    audio = _stepped_program(sample_rate, 0.25)
+    meter = (
+        LoudnessMeter(sample_rate).push(audio[:, :5000]).push(audio[:, 5000:])
+    )
+
+    reading = meter.reading()
+    offline = measure_mastering_loudness(audio, sample_rate)
+
+    _assert_reading_matches_offline(reading, offline)
+    assert reading.momentary_lufs == pytest.approx(offline.integrated_lufs)
+    assert reading.short_term_lufs == pytest.approx(offline.integrated_lufs)
+
+
+def test_loudness_meter_reset_and_channel_validation():
+    meter = LoudnessMeter(8000)
+    empty = meter.reading()
+
+    assert isinstance(empty, LoudnessMeterReading)
+    assert empty.integrated_lufs == -70.0
+    assert empty.true_peak_dbfs == -120.0
+
+    meter.push(np.ones((2, 800), dtype=np.float32) * 0.1)
+    assert meter.channel_count == 2
+    with pytest.raises(ValueError):
+        meter.push(np.ones(800, dtype=np.float32))
+
+    meter.reset()
+    meter.push(np.zeros(800, dtype=np.float32))
+    assert meter.channel_count == 1
+    assert meter.reading().to_dict()["integrated_lufs"] == -70.0
+    with pytest.raises(ValueError):
+        LoudnessMeter(0)
+
+
+def test_process_audio_chunks_reports_loudness_of_finalized_output():
+    sample_rate = 16000
+    audio = _stepped_program(sample_rate, 8.0)
+    meter = LoudnessMeter(sample_rate)
+    readings = []
+
+    output = process_audio_chunks(
+        lambda chunk: chunk * 0.5,
+        audio,
+        4096,
+        overlap=1024,
+        loudness_meter=meter,
+        on_loudness=readings.append,
+    )
+
+    assert meter.sample_count == audio.shape[-1]
+    assert len(readings) == -(-(audio.shape[-1] - 1024) // 3072)
+    assert [reading.duration_seconds for reading in readings] == sorted(
+        reading.duration_seconds for reading in readings
+    )
+    _assert_reading_matches_offline(
+        readings[-1], measure_mastering_loudness(output, sample_rate)
+    )
@@ -0,0 +1,160 @@
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from definers.audio.mastering import loudness, oversampling
+
+scipy_signal = oversampling.signal
+
+
+def _counting_signal_module():
+    calls = []
+
+    def resample_poly(values, up, down, axis=-1, **kwargs):
+        calls.append((up, down))
+        return scipy_signal.resample_poly(values, up, down, axis=axis, **kwargs)
+
+    return (
+        SimpleNamespace(
+            firwin=scipy_signal.firwin,
+            resample_poly=resample_poly,
+        ),
+        calls,
+    )
+
+
+def test_oversampling_plan_matches_resample_poly_bit_for_bit():
+    values = (
+        np.random.default_rng(0).standard_normal((2, 4001)).astype(np.float32)
+    )
+    plan = oversampling.OversamplingPlan(44100, 4)
+
+    upsampled = plan.upsample(values)
+
+    assert plan.oversampled_rate == 176400
+    assert np.array_equal(
+        upsampled, scipy_signal.resample_poly(values, 4, 1, axis=-1)
+    )
+    assert np.array_equal(
+        plan.downsample(upsampled),
+        scipy_signal.resample_poly(upsampled, 1, 4, axis=-1),
+    )
+    with oversampling.oversampling_memo():
+        assert not plan.upsample(values).flags.writeable
+
+
+def test_oversampling_plan_reuses_upsample_until_signal_changes():
+    signal_module, calls = _counting_signal_module()
+    values = (
+        np.random.default_rng(1).standard_normal((2, 2048)).astype(np.float32)
+    )
+    plan = oversampling.get_oversampling_plan(
+        48000, 4, signal_module=signal_module
+    )
+
+    with oversampling.oversampling_memo():
+        first_peak = loudness.measure_true_peak(
+            values, 48000, 4, signal_module=signal_module
+        )
+        plan.upsample(np.array(values, copy=True))
+        assert calls == [(4, 1)]
+        assert first_peak == loudness.measure_true_peak(
+            values, 48000, 4, signal_module=signal_module
+        )
+
+        values[0, 100] += 0.5
+        loudness.measure_true_peak(
+            values, 48000, 4, signal_module=signal_module
+        )
+    plan.upsample(values)
+
+    assert calls == [(4, 1), (4, 1), (4, 1)]
+    assert (
+        oversampling.get_oversampling_plan(
+            48000, 4, signal_module=signal_module
+        )
+        is plan
+    )
+
+
+def test_oversampling_plan_keeps_nothing_outside_a_memo_scope():
+    signal_module, calls = _counting_signal_module()
+    values = np.ones((2, 512), dtype=np.float32)
+    plan = oversampling.get_oversampling_plan(
+        44100, 4, signal_module=signal_module
+    )
+
+    plan.peak(values)
+    plan.peak(values)
+
+    assert calls == [(4, 1), (4, 1)]
+    assert plan.upsample(values).flags.writeable
+
+
+def test_oversampling_memo_is_isolated_between_threads():
+    plan = oversampling.get_oversampling_plan(44100, 4)
+    barrier = threading.Barrier(2)
+    results = {}
+
+    def measure(scale):
+        values = np.full((2, 1024), scale, dtype=np.float32)
+        with oversampling.oversampling_memo():
+            plan.upsample(values)
+            barrier.wait()
+            barrier.wait()
+            results[scale] = plan.peak(values)
+
+    threads = [
+        threading.Thread(target=measure, args=(scale,)) for scale in (0.25, 0.5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == pytest.approx(
+        {
+            scale: oversampling.OversamplingPlan(44100, 4).peak(
+                np.full((2, 1024), scale, dtype=np.float32)
+            )
+            for scale in (0.25, 0.5)
+        }
+    )
+    assert results[0.5] > results[0.25]
+
+
+def test_oversampling_plan_meters_long_signals_in_blocks():
+    values = (
+        np.random.default_rng(2).standard_normal((2, 10000)).astype(np.float32)
+    )
+    plan = oversampling.OversamplingPlan(44100, 4)
+    whole_peak = plan.peak(values)
+
+    with oversampling.oversampling_memo(block_samples=999) as memo:
+        blockwise_peak = plan.peak(values)
+
+        assert memo == {}
+
+    assert blockwise_peak == pytest.approx(whole_peak, rel=1e-6)
+
+
+def test_oversampling_plan_falls_back_without_filter_design():
+    signal_module = SimpleNamespace(
+        resample_poly=lambda values, up, down, axis=-1: np.repeat(
+            values, up, axis=axis
+        )
+    )
+    plan = oversampling.OversamplingPlan(8000, 2, signal_module=signal_module)
+
+    assert plan.upsample(np.array([0.25, -0.5])).tolist() == [
+        0.25,
+        0.25,
+        -0.5,
+        -0.5,
+    ]
+    assert plan.peak(np.array([0.25, -0.5])) == 0.5
+    assert (
+        oversampling.OversamplingPlan(8000, 1).peak(np.array([-0.75])) == 0.75
+    )
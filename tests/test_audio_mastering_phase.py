@@ -73,7 +73,20 @@ def _install_scipy_stub() -> None:
         output = np.mean(np.asarray(Zxx_modified, dtype=np.float32), axis=0)
         return np.array([0.0], dtype=np.float32), output
 
+    def lfilter(b, a, x, axis=-1, zi=None):
+        values = np.asarray(x, dtype=np.float64)
+        output = np.empty_like(values)
+        state = np.asarray(zi, dtype=np.float64)[..., 0].copy()
+        for index in range(values.shape[-1]):
+            current = values[..., index]
+            output[..., index] = b[0] * current + state
+            state = -a[1] * output[..., index]
+            if len(b) > 1:
+                state = state + b[1] * current
+        return output, state[..., np.newaxis]
+
     signal_module.welch = welch
+    signal_module.lfilter = lfilter
     signal_module.stft = stft
     signal_module.istft = istft
     signal_module.resample_poly = lambda y, up, down, axis=-1: np.array(
@@ -0,0 +1,70 @@
+import os
+
+import numpy as np
+import pytest
+
+from definers.audio.mastering.snapshots import (
+    StageSnapshotStore,
+    resolve_stage_snapshot_mode,
+)
+
+
+def _stage_signal(seed, samples=4096):
+    return (
+        np.random.default_rng(seed)
+        .standard_normal((2, samples))
+        .astype(np.float64)
+    )
+
+
+def test_stage_snapshot_store_spills_past_memory_budget(tmp_path):
+    store = StageSnapshotStore(
+        memory_budget_mb=50000 / (1024 * 1024),
+        spill_dir=str(tmp_path),
+    )
+    first = _stage_signal(0)
+    second = _stage_signal(1)
+
+    store.capture("post_eq", first)
+    store.capture("post_limiter", second)
+    first[:] = 0.0
+
+    assert list(store) == ["post_eq", "post_limiter"]
+    assert store.spilled_stages == ("post_limiter",)
+    assert store.memory_bytes == 2 * 4096 * 4
+    assert store.spilled_bytes == 2 * 4096 * 4
+    assert store["post_eq"].dtype == np.float32
+    assert np.array_equal(store["post_eq"], _stage_signal(0).astype(np.float32))
+    assert isinstance(store["post_limiter"], np.memmap)
+    assert np.array_equal(store["post_limiter"], second.astype(np.float32))
+    spilled = store["post_limiter"]
+    spilled[0, 0] = 5.0
+    assert np.array_equal(
+        np.load(next(tmp_path.glob("*/post_limiter.npy"))),
+        second.astype(np.float32),
+    )
+
+    store.capture("post_limiter", np.zeros((2, 16)))
+    assert store.spilled_stages == ()
+    assert not list(tmp_path.glob("*/post_limiter.npy"))
+
+    store.capture("post_clamp", second)
+    spill_dir = next(tmp_path.iterdir())
+    store.close()
+    assert len(store) == 0
+    assert not os.path.exists(spill_dir)
+
+
+def test_stage_snapshot_store_memory_and_off_modes():
+    memory_store = StageSnapshotStore(mode="memory", memory_budget_mb=0.0)
+    memory_store.capture("post_eq", _stage_signal(2))
+    off_store = StageSnapshotStore(mode=" OFF ")
+    off_store.capture("post_eq", _stage_signal(2))
+
+    assert memory_store.spilled_stages == ()
+    assert memory_store.get("post_eq").shape == (2, 4096)
+    assert off_store.mode == "off"
+    assert off_store.get("post_eq") is None
+    assert resolve_stage_snapshot_mode("Auto") == "auto"
+    with pytest.raises(ValueError):
+        StageSnapshotStore(mode="disk")
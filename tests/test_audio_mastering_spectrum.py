@@ -203,6 +203,47 @@ def test_smooth_curve_averages_local_bandwidth():
     assert smoothed[3] == pytest.approx(20.0)
 
 
+def test_smooth_curve_matches_per_bin_window_mean_on_clipped_axis():
+    mastering = _make_mastering_instance()
+    freqs = np.clip(np.linspace(0.0, 4000.0, 513), 40.0, 3500.0)
+    curve = np.random.default_rng(0).standard_normal(freqs.size) * 12.0
+    curve[7] = np.nan
+
+    smoothed = mastering.smooth_curve(curve, freqs, smoothing_fraction=1 / 6)
+
+    expected = np.copy(curve)
+    bandwidth_scale = 2 ** (1 / 6) - 2 ** (-1 / 6)
+    for index, frequency_hz in enumerate(freqs):
+        half_bandwidth = frequency_hz * bandwidth_scale / 2
+        mask = (freqs >= frequency_hz - half_bandwidth) & (
+            freqs <= frequency_hz + half_bandwidth
+        )
+        expected[index] = np.mean(curve[mask])
+    np.testing.assert_allclose(smoothed, expected, atol=1e-9)
+    assert mastering.smooth_curve(curve, freqs) is curve
+
+
+def test_target_curves_and_bands_are_memoized_per_profile():
+    mastering = _make_mastering_instance()
+    freqs = np.linspace(20.0, 3900.0, 257)
+
+    first = mastering.build_target_curve(freqs)
+    first[:] = 99.0
+    second = mastering.build_target_curve(freqs)
+    bands = mastering.bands
+    mastering.update_bands()
+
+    assert len(mastering._target_curve_cache) == 2
+    assert not np.any(second == 99.0)
+    assert mastering.bands == bands and mastering.bands is not bands
+
+    mastering.slope_db = mastering.slope_db + 1.5
+
+    assert len(mastering._target_curve_cache) == 3
+    assert len(mastering._band_cache) == 2
+    assert not np.allclose(mastering.build_target_curve(freqs), second)
+
+
 def test_measure_spectrum_clips_frequency_axis_to_cut_range(
     monkeypatch: pytest.MonkeyPatch,
 ):
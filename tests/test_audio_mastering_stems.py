@@ -5,6 +5,7 @@ import types
 from pathlib import Path
 
 import numpy as np
+import pytest
 
 from definers.system.download_activity import (
     bind_download_activity_scope,
@@ -1018,3 +1019,110 @@ def test_apply_drum_edge_finish_adds_controlled_transient_bite():
         > float(np.max(np.abs(signal[:, ::128]))) * 1.08
     )
     assert float(np.max(np.abs(finished))) <= 0.98 + 1e-6
+
+
+def _halve_stem_signal(signal, sample_rate, mastering_kwargs):
+    return sample_rate, np.asarray(signal, dtype=np.float32) * 0.5
+
+
+def _read_test_stem(path):
+    seed = 1 if path == "drums.wav" else 2
+    return 8000, (
+        np.random.default_rng(seed)
+        .standard_normal((2, 4000))
+        .astype(np.float32)
+        * 0.1
+    )
+
+
+def test_process_stem_layers_process_mode_matches_thread_mode(monkeypatch):
+    base = CONFIG_MODULE.SmartMasteringConfig.balanced()
+    monkeypatch.setattr(
+        MASTERING_STEMS_MODULE,
+        "_resolve_process_stem_workers",
+        lambda stem_count: 2,
+    )
+
+    def render(stem_execution):
+        return MASTERING_STEMS_MODULE.process_stem_layers(
+            "song.wav",
+            base_config=base,
+            base_mastering_kwargs={"preset": "balanced"},
+            process_stem_fn=_halve_stem_signal,
+            separate_stems_fn=lambda audio_path, model_name, shifts, quality_flags=(): (
+                {"drums": "drums.wav", "vocals": "vocals.wav"},
+                "temp-demucs-dir",
+            ),
+            read_audio_fn=_read_test_stem,
+            delete_fn=lambda path: None,
+            save_mastered_stems=False,
+            stem_execution=stem_execution,
+        )
+
+    thread_sr, thread_signal = render("thread")
+    process_sr, process_signal = render("process")
+
+    assert process_sr == thread_sr
+    assert np.allclose(process_signal, thread_signal, atol=1e-6)
+
+
+def test_shared_stem_signal_round_trip_releases_block():
+    signal = np.arange(12, dtype=np.float32).reshape(2, 6)
+    block, handle = MASTERING_STEMS_MODULE._share_stem_signal(signal)
+    block.close()
+
+    restored = MASTERING_STEMS_MODULE._read_shared_stem_signal(
+        handle, unlink=True
+    )
+
+    assert np.array_equal(restored, signal)
+    assert MASTERING_STEMS_MODULE._resolve_process_stem_workers(1) == 1
+    with pytest.raises(FileNotFoundError):
+        MASTERING_STEMS_MODULE._read_shared_stem_signal(handle)
+
+
+def test_worker_process_failure_releases_completed_stem_outputs(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+    from multiprocessing import shared_memory
+
+    vocals_done = threading.Event()
+    output_handles = []
+
+    def master(plan, stem_sample_rate, stem_signal, stem_kwargs):
+        if plan.stem_name == "drums":
+            vocals_done.wait(5.0)
+            raise RuntimeError("drums failed")
+        block, handle = MASTERING_STEMS_MODULE._share_stem_signal(
+            MASTERING_STEMS_MODULE._read_shared_stem_signal(stem_signal)
+        )
+        block.close()
+        output_handles.append(handle)
+        vocals_done.set()
+        return stem_sample_rate, handle
+
+    monkeypatch.setattr(
+        MASTERING_STEMS_MODULE, "ProcessPoolExecutor", ThreadPoolExecutor
+    )
+    monkeypatch.setattr(MASTERING_STEMS_MODULE, "_STEM_PROCESS_CONTEXT", {})
+    monkeypatch.setattr(
+        MASTERING_STEMS_MODULE, "_master_stem_in_process", master
+    )
+    monkeypatch.setattr(
+        MASTERING_STEMS_MODULE,
+        "_resolve_process_stem_workers",
+        lambda stem_count: 2,
+    )
+    signal = np.ones((2, 64), dtype=np.float32)
+
+    with pytest.raises(RuntimeError, match="drums failed"):
+        MASTERING_STEMS_MODULE._process_stems_in_worker_processes(
+            [
+                (types.SimpleNamespace(stem_name="drums"), 44100, signal, {}),
+                (types.SimpleNamespace(stem_name="vocals"), 44100, signal, {}),
+            ],
+            context={"pitch_shift_fn": None},
+        )
+
+    assert len(output_handles) == 1
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=output_handles[0].name)
@@ -42,6 +42,36 @@ class TestAutoTrainer(unittest.TestCase):
         mock_fit.assert_called_once()
         self.assertIs(mock_fit.call_args.args[0], trained_model)
 
+    def test_text_rows_are_fed_and_predicted_in_dense_batches(self):
+        from definers.data.vectorizers import dense_row_batches
+
+        ml_module = _ml_module()
+        trainer = ml_module.AutoTrainer(text_hash_features=64)
+        texts = [f"document {index}" for index in range(5)]
+        predictor = MagicMock()
+        predictor.predict.side_effect = lambda rows: rows.sum(axis=1)
+
+        with patch.object(
+            ml_module,
+            "dense_row_batches",
+            side_effect=lambda matrix: dense_row_batches(matrix, 2),
+        ):
+            fed_model = trainer.feed(texts, [0, 1, 0, 1, 0])
+            trainer.model = predictor
+            predictions = trainer.predict(texts)
+
+        self.assertEqual(trainer.vectorizer.n_features, 64)
+        self.assertEqual(fed_model.X_all.shape, (5, 64))
+        self.assertEqual(fed_model.X_all.dtype, np.float32)
+        np.testing.assert_array_equal(
+            np.asarray(fed_model.y_all).reshape(-1), [0, 1, 0, 1, 0]
+        )
+        self.assertEqual(
+            [call.args[0].shape for call in predictor.predict.call_args_list],
+            [(2, 64), (2, 64), (1, 64)],
+        )
+        self.assertEqual(predictions.shape, (5,))
+
     def test_train_uses_in_memory_data_and_saves_model(self):
         ml_module = _ml_module()
         trainer = ml_module.AutoTrainer(batch_size=4)
@@ -0,0 +1,174 @@
+import importlib
+import threading
+import time
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from definers.ml.cross_validation import fold_assignments, run_cross_validation
+
+
+def test_fold_assignments_match_contiguous_blocks_without_classes():
+    assignment = fold_assignments(11, 3, np.linspace(0.0, 1.0, 11))
+
+    assert assignment.tolist() == [0, 0, 0, 1, 1, 1, 2, 2, 2, 2, 2]
+
+
+def test_fold_assignments_stratify_discrete_labels():
+    labels = np.array([0] * 12 + [1] * 6)
+    rng = np.random.default_rng(0)
+    labels = labels[rng.permutation(labels.size)]
+
+    assignment = fold_assignments(labels.size, 3, labels)
+
+    for fold in range(3):
+        fold_labels = labels[assignment == fold]
+        assert (fold_labels == 0).sum() == 4
+        assert (fold_labels == 1).sum() == 2
+    assert fold_assignments(
+        labels.size, 3, labels, stratify=False
+    ).tolist() == (np.repeat(np.arange(3), 6).tolist())
+
+
+class _RecordingModel:
+    fits = []
+
+    def fit(self, X, y):
+        type(self).fits.append((X, y))
+        self.mean = float(np.mean(y))
+
+    def score(self, X, y):
+        return float(len(y))
+
+
+def test_boundary_folds_train_on_views_of_the_features():
+    features = np.arange(40, dtype=np.float32).reshape(20, 2)
+    labels = np.linspace(0.0, 1.0, 20)
+    _RecordingModel.fits = []
+
+    scores = run_cross_validation(
+        features,
+        labels,
+        4,
+        model_factory=_RecordingModel,
+        max_workers=1,
+    )
+
+    assert scores == [5.0, 5.0, 5.0, 5.0]
+    train_sets = _RecordingModel.fits
+    views = [np.shares_memory(train_X, features) for train_X, _y in train_sets]
+    assert sorted(views) == [False, False, True, True]
+    assert all(train_X.shape == (15, 2) for train_X, _y in train_sets)
+
+
+class _SlowModel:
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def fit(self, X, y):
+        with type(self).lock:
+            type(self).active += 1
+            type(self).peak = max(type(self).peak, type(self).active)
+        time.sleep(0.05)
+        with type(self).lock:
+            type(self).active -= 1
+
+    def predict(self, X):
+        if X[0, 0] >= 90:
+            raise RuntimeError("fold failed")
+        return np.zeros(len(X))
+
+
+def test_folds_run_concurrently_and_report_incrementally():
+    features = np.arange(100, dtype=np.float32).reshape(100, 1)
+    labels = np.zeros(100)
+    reported = []
+    errors = []
+
+    scores = run_cross_validation(
+        features,
+        labels,
+        10,
+        model_factory=_SlowModel,
+        max_workers=5,
+        on_score=lambda fold, score: reported.append((fold, score)),
+        on_error=errors.append,
+    )
+
+    assert _SlowModel.peak > 1
+    assert scores == [1.0] * 9
+    assert sorted(fold for fold, _score in reported) == list(range(9))
+    assert [str(error) for error in errors] == ["fold failed"]
+
+
+def test_unknown_executor_is_rejected():
+    with pytest.raises(ValueError, match="executor"):
+        run_cross_validation(
+            np.zeros((4, 1)),
+            np.zeros(4),
+            2,
+            model_factory=_RecordingModel,
+            executor="cluster",
+        )
+
+
+def test_auto_trainer_records_fold_scores():
+    ml_module = importlib.import_module("definers.ml")
+    trainer = ml_module.AutoTrainer()
+    features = np.arange(30, dtype=np.float32).reshape(15, 2)
+    labels = np.linspace(0.0, 1.0, 15)
+
+    with patch.object(ml_module, "HybridModel", _RecordingModel):
+        trainer._run_cross_validation(features, labels, 3)
+
+    assert trainer.cv_scores == [5.0, 5.0, 5.0]
+
+
+def test_gpu_backed_factories_default_to_one_worker(monkeypatch):
+    cross_validation = importlib.import_module("definers.ml.cross_validation")
+    from definers.ml.training import HybridModel
+
+    class _GpuModel(_SlowModel):
+        gpu_backed = True
+
+    monkeypatch.setattr(cross_validation.os, "cpu_count", lambda: 8)
+    _GpuModel.peak = 0
+
+    scores = run_cross_validation(
+        np.arange(40, dtype=np.float32).reshape(40, 1),
+        np.zeros(40),
+        4,
+        model_factory=_GpuModel,
+    )
+
+    assert scores == [1.0] * 4
+    assert _GpuModel.peak == 1
+    assert cross_validation._resolve_cv_workers(4, None, HybridModel) == 1
+    assert cross_validation._resolve_cv_workers(4, None, _SlowModel) == 4
+    assert cross_validation._resolve_cv_workers(4, 3, HybridModel) == 3
+
+
+def test_auto_trainer_forwards_cv_workers_and_executor():
+    ml_module = importlib.import_module("definers.ml")
+    trainer = ml_module.AutoTrainer(cv_workers=3, cv_executor="thread")
+    features = np.arange(60, dtype=np.float32).reshape(60, 1)
+    labels = np.zeros(60)
+
+    class _GpuModel(_SlowModel):
+        gpu_backed = True
+
+    _GpuModel.peak = 0
+    with (
+        patch.object(ml_module, "HybridModel", _GpuModel),
+        patch.object(
+            ml_module, "run_cross_validation", wraps=run_cross_validation
+        ) as forwarded,
+    ):
+        trainer._run_cross_validation(features, labels, 6)
+
+    assert forwarded.call_args.kwargs["max_workers"] == 3
+    assert forwarded.call_args.kwargs["executor"] == "thread"
+    assert trainer.cv_scores == [1.0] * 6
+    assert _GpuModel.peak > 1
@@ -22,6 +22,32 @@ AUDIO_FEATURES_MODULE = _load_module(
     ROOT / "src" / "definers" / "audio" / "features.py",
 )
 extract_audio_features = AUDIO_FEATURES_MODULE.extract_audio_features
+extract_audio_features_batch = (
+    AUDIO_FEATURES_MODULE.extract_audio_features_batch
+)
+
+
+def _spectral_librosa(load_map):
+    mock_librosa = MagicMock()
+    mock_librosa.load.side_effect = lambda path, sr=None: load_map[path]
+    mock_librosa.stft.side_effect = lambda y, n_fft, hop_length: np.ones(
+        np.shape(y)[:-1] + (n_fft // 2 + 1, np.shape(y)[-1] // hop_length + 1),
+        dtype=np.complex64,
+    )
+    mock_librosa.power_to_db.side_effect = lambda values: values
+    mock_librosa.feature.melspectrogram.side_effect = lambda S, sr, n_mels: S[
+        :n_mels
+    ]
+    mock_librosa.feature.mfcc.side_effect = lambda S, n_mfcc: S[:n_mfcc]
+    for name in ("spectral_centroid", "spectral_bandwidth", "spectral_rolloff"):
+        getattr(mock_librosa.feature, name).side_effect = lambda S, sr: (
+            S[:1] * sr
+        )
+    mock_librosa.feature.zero_crossing_rate.side_effect = lambda y: np.zeros(
+        (1, 3)
+    )
+    mock_librosa.feature.chroma_stft.side_effect = lambda S, sr: S[:12]
+    return mock_librosa
 
 
 class TestExtractAudioFeatures(unittest.TestCase):
@@ -31,10 +57,8 @@ class TestExtractAudioFeatures(unittest.TestCase):
         self.dummy_audio_data = np.random.randn(self.sample_rate * 2)
 
     def test_successful_extraction(self):
-        mock_librosa = MagicMock()
-        mock_librosa.load.return_value = (
-            self.dummy_audio_data,
-            self.sample_rate,
+        mock_librosa = _spectral_librosa(
+            {self.audio_path: (self.dummy_audio_data, self.sample_rate)}
         )
         with patch.dict("sys.modules", {"librosa": mock_librosa}):
             features = extract_audio_features(self.audio_path)
@@ -43,21 +67,23 @@ class TestExtractAudioFeatures(unittest.TestCase):
 
     def test_custom_n_mfcc(self):
         n_mfcc = 40
-        mock_librosa = MagicMock()
-        mock_librosa.load.return_value = (
-            self.dummy_audio_data,
-            self.sample_rate,
+        mock_librosa = _spectral_librosa(
+            {self.audio_path: (self.dummy_audio_data, self.sample_rate)}
         )
-        mock_librosa.feature.mfcc.return_value = np.random.rand(n_mfcc, 10)
         with patch.dict("sys.modules", {"librosa": mock_librosa}):
             features = extract_audio_features(self.audio_path, n_mfcc=n_mfcc)
         self.assertIsNotNone(features)
-        mock_librosa.feature.mfcc.assert_called_with(
-            y=self.dummy_audio_data,
-            sr=self.sample_rate,
-            n_mfcc=n_mfcc,
-            n_fft=2048,
-            n_mels=80,
+        mock_librosa.stft.assert_called_once()
+        self.assertEqual(
+            mock_librosa.stft.call_args.kwargs,
+            {"n_fft": 2048, "hop_length": 512},
+        )
+        mock_librosa.feature.melspectrogram.assert_called_once()
+        self.assertEqual(
+            mock_librosa.feature.melspectrogram.call_args.kwargs["n_mels"], 80
+        )
+        self.assertEqual(
+            mock_librosa.feature.mfcc.call_args.kwargs["n_mfcc"], n_mfcc
         )
 
     def test_audio_loading_error(self):
@@ -68,10 +94,8 @@ class TestExtractAudioFeatures(unittest.TestCase):
         self.assertIsNone(features)
 
     def test_output_dtype_is_float32(self):
-        mock_librosa = MagicMock()
-        mock_librosa.load.return_value = (
-            self.dummy_audio_data,
-            self.sample_rate,
+        mock_librosa = _spectral_librosa(
+            {self.audio_path: (self.dummy_audio_data, self.sample_rate)}
         )
         with patch.dict("sys.modules", {"librosa": mock_librosa}):
             features = extract_audio_features(self.audio_path)
@@ -89,6 +113,50 @@ class TestExtractAudioFeatures(unittest.TestCase):
             features = extract_audio_features(self.audio_path)
         self.assertIsNone(features)
 
+    def test_descriptors_share_one_spectrogram(self):
+        mock_librosa = _spectral_librosa(
+            {self.audio_path: (self.dummy_audio_data, self.sample_rate)}
+        )
+        with patch.dict("sys.modules", {"librosa": mock_librosa}):
+            features = extract_audio_features(self.audio_path)
+        frames = self.dummy_audio_data.size // 512 + 1
+        mock_librosa.stft.assert_called_once()
+        self.assertEqual(features.shape, ((20 + 3 + 12) * frames + 3,))
+        magnitude = mock_librosa.feature.spectral_centroid.call_args.kwargs["S"]
+        power = mock_librosa.feature.chroma_stft.call_args.kwargs["S"]
+        self.assertEqual(magnitude.shape, (1025, frames))
+        self.assertIs(
+            mock_librosa.feature.melspectrogram.call_args.kwargs["S"], power
+        )
+
+    def test_batch_groups_equal_signals_into_one_stft(self):
+        short = np.random.randn(4096).astype(np.float32)
+        long = np.random.randn(8192).astype(np.float32)
+        mock_librosa = _spectral_librosa(
+            {
+                "a.wav": (short, 16000),
+                "b.wav": (long, 16000),
+                "c.wav": (short * 0.5, 16000),
+                "d.wav": (short, 8000),
+            }
+        )
+        with patch.dict("sys.modules", {"librosa": mock_librosa}):
+            features = extract_audio_features_batch(
+                ["a.wav", "b.wav", "missing.wav", "c.wav", "d.wav"]
+            )
+        self.assertEqual(mock_librosa.stft.call_count, 3)
+        batched_shapes = sorted(
+            np.shape(call.args[0]) for call in mock_librosa.stft.call_args_list
+        )
+        self.assertEqual(batched_shapes, [(1, 4096), (1, 8192), (2, 4096)])
+        self.assertIsNone(features[2])
+        self.assertEqual(features[0].shape, features[3].shape)
+        self.assertGreater(features[1].size, features[0].size)
+        self.assertFalse(np.array_equal(features[0], features[4]))
+        with patch.dict("sys.modules", {"librosa": mock_librosa}):
+            single = extract_audio_features("a.wav")
+        np.testing.assert_array_equal(single, features[0])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,138 @@
+import os
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from definers.data.feature_store import FeatureStore
+from definers.data.lightweight_datasets import (
+    LightweightDataLoader,
+    LightweightTensorDataset,
+)
+from definers.data.loaders import files_to_dataset
+from definers.image.helpers import visual_feature_layout
+from definers.video.helpers import iter_video_features
+from tests.optional_dependency_stubs import build_fake_cv2_module
+
+
+def _visual_row(rng, spatial_size):
+    histogram = rng.integers(0, 100000, 768).astype(np.float32)
+    spatial = rng.integers(0, 256, spatial_size).astype(np.float32)
+    return np.concatenate((histogram, spatial))
+
+
+def test_feature_store_round_trips_compact_shards(tmp_path):
+    rng = np.random.default_rng(0)
+    image = _visual_row(rng, 64)
+    frames = [_visual_row(rng, 64) for _ in range(5)]
+    store = FeatureStore(
+        str(tmp_path), layout=visual_feature_layout(), shard_rows=2
+    )
+
+    assert store.append(image) == 0
+    assert store.append(iter(frames)) == 1
+    store.flush()
+
+    reopened = FeatureStore(str(tmp_path))
+    assert len(reopened) == 2
+    assert reopened.layout == ((768, "float32"), (64, "uint8"))
+    np.testing.assert_array_equal(reopened.sample(0), image)
+    np.testing.assert_array_equal(reopened.sample(1), np.stack(frames))
+    spatial_shard = np.load(
+        os.path.join(str(tmp_path), "shard-00000.block1.npy"), mmap_mode="r"
+    )
+    assert spatial_shard.dtype == np.uint8
+    assert len([name for name in os.listdir(tmp_path) if "block" in name]) == 6
+
+
+def test_feature_store_rolls_back_unrepresentable_sample(tmp_path):
+    store = FeatureStore(
+        str(tmp_path), layout=visual_feature_layout(), shard_rows=2
+    )
+    store.append(np.zeros(768 + 4, dtype=np.float32))
+    bad_frame = np.zeros(768 + 4, dtype=np.float32)
+    bad_frame[-1] = 300.0
+
+    with pytest.raises(ValueError, match="uint8"):
+        store.append(iter([np.ones(768 + 4), np.ones(768 + 4), bad_frame]))
+
+    assert len(store) == 1
+    assert store.row_count == 1
+    assert not os.path.exists(
+        os.path.join(str(tmp_path), "shard-00001.block1.npy")
+    )
+    store.append(np.full(768 + 4, 2.0, dtype=np.float32))
+    np.testing.assert_array_equal(store.sample(1), np.full(768 + 4, 2.0))
+
+
+def test_feature_store_view_pads_frames_for_lightweight_loader(tmp_path):
+    store = FeatureStore(str(tmp_path), shard_rows=3)
+    store.append(np.ones((2, 4), dtype=np.float32))
+    store.append(np.full((4, 4), 2.0, dtype=np.float32))
+    view = store.view()
+    dataset = LightweightTensorDataset(view, np.array([0, 1]))
+
+    assert view.shape == (2, 4, 4)
+    assert len(dataset) == 2
+    (first_features, first_label) = dataset[0]
+    np.testing.assert_array_equal(first_features[:2], np.ones((2, 4)))
+    np.testing.assert_array_equal(first_features[2:], np.zeros((2, 4)))
+    assert first_label == 0
+    (features_batch, labels_batch) = next(
+        iter(LightweightDataLoader(dataset, batch_size=2, shuffle=False))
+    )
+    assert features_batch.shape == (2, 4, 4)
+    np.testing.assert_array_equal(view[1:], features_batch[1:])
+    np.testing.assert_array_equal(labels_batch, [0, 1])
+
+
+def test_iter_video_features_streams_sampled_frames(tmp_path):
+    cv2_module = build_fake_cv2_module()
+    video_path = str(tmp_path / "clip.mp4")
+    with patch.dict("sys.modules", {"cv2": cv2_module}):
+        writer = cv2_module.VideoWriter(
+            video_path, cv2_module.VideoWriter_fourcc(*"mp4v"), 10, (8, 6)
+        )
+        for _ in range(7):
+            writer.write(np.random.randint(0, 256, (6, 8, 3), dtype=np.uint8))
+        writer.release()
+        store = FeatureStore(
+            str(tmp_path / "store"), layout=visual_feature_layout()
+        )
+        store.append(iter_video_features(video_path, frame_interval=3))
+
+    assert store.row_count == 3
+    assert store.layout == ((768, "float32"), (96, "uint8"))
+
+
+def test_files_to_dataset_reads_features_from_store(tmp_path):
+    feature_paths = []
+    for index in range(3):
+        path = tmp_path / f"features-{index}.csv"
+        path.write_text("0")
+        feature_paths.append(str(path))
+    label_path = tmp_path / "labels.csv"
+    label_path.write_text("0")
+    loaded = {
+        path: np.full(5, index, dtype=np.float32)
+        for index, path in enumerate(feature_paths)
+    }
+    loaded[str(label_path)] = [np.array([0]), np.array([1]), np.array([0])]
+
+    with patch(
+        "definers.data.loaders.load_as_numpy",
+        side_effect=lambda path, training=False: loaded[path],
+    ):
+        dataset = files_to_dataset(
+            feature_paths,
+            [str(label_path)],
+            use_cache=False,
+            feature_store_dir=str(tmp_path / "store"),
+        )
+
+    assert isinstance(dataset, LightweightTensorDataset)
+    assert len(dataset) == 3
+    (features, label) = dataset[2]
+    np.testing.assert_array_equal(features, np.full(5, 2.0))
+    np.testing.assert_array_equal(np.asarray(label).reshape(-1), [0])
+    assert len(FeatureStore(str(tmp_path / "store"))) == 3
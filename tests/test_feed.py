@@ -1,9 +1,11 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import MagicMock
 
 import numpy as np
 
-from definers.ml.training import HybridModel, feed
+from definers.ml.training import HybridModel, TrainingRowBuffer, feed
 
 
 class TestFeed(unittest.TestCase):
@@ -86,6 +88,95 @@ class TestFeed(unittest.TestCase):
         np.testing.assert_array_equal(model.X_all, expected_X)
         self.assertEqual(mock_concatenate.call_count, 0)
 
+    def test_feed_appends_batches_into_growing_buffer(self):
+        mock_concatenate = MagicMock(wraps=np.concatenate)
+        model = None
+        batches = [
+            np.full((3, 2), index, dtype=np.float32) for index in range(12)
+        ]
+        labels = [np.full(3, index) for index in range(12)]
+        for batch, label in zip(batches, labels):
+            model = feed(
+                model,
+                batch,
+                label,
+                logger=MagicMock(),
+                concatenate=mock_concatenate,
+            )
+
+        np.testing.assert_array_equal(model.X_all, np.concatenate(batches))
+        np.testing.assert_array_equal(model.y_all, np.concatenate(labels))
+        self.assertEqual(mock_concatenate.call_count, 0)
+        self.assertEqual(model.X_all.base.shape, (64, 2))
+
+        model.X_all = np.zeros((1, 2))
+        model = feed(
+            model,
+            batches[0],
+            labels[0],
+            logger=MagicMock(),
+            concatenate=mock_concatenate,
+        )
+        self.assertEqual(mock_concatenate.call_count, 1)
+        self.assertEqual(model.X_all.shape, (4, 2))
+        self.assertEqual(model.y_all.shape, (39,))
+
+    def test_zero_epoch_feed_keeps_the_owning_buffer(self):
+        mock_concatenate = MagicMock(wraps=np.concatenate)
+        model = feed(
+            None,
+            self.X_new_np,
+            self.y_new_np,
+            logger=MagicMock(),
+            concatenate=mock_concatenate,
+        )
+        storage = model.X_all.base
+
+        model = feed(
+            model,
+            self.X_new_np,
+            self.y_new_np,
+            epochs=0,
+            logger=MagicMock(),
+            concatenate=mock_concatenate,
+        )
+        model = feed(
+            model,
+            self.X_new_np,
+            self.y_new_np,
+            logger=MagicMock(),
+            concatenate=mock_concatenate,
+        )
+
+        self.assertEqual(mock_concatenate.call_count, 0)
+        self.assertIs(model.X_all.base, storage)
+        self.assertEqual(model.X_all.shape, (4, 2))
+
+    def test_training_row_buffer_grows_memory_mapped_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            buffer = TrainingRowBuffer(
+                np.arange(6, dtype=np.int16).reshape(3, 2),
+                directory=directory,
+            )
+            (path,) = os.listdir(directory)
+            first_view = buffer.view()
+            for _ in range(10):
+                buffer.extend(np.ones((4, 2), dtype=np.int16))
+
+            self.assertTrue(buffer.is_memory_mapped)
+            self.assertEqual(len(buffer), 43)
+            self.assertEqual(buffer.capacity, 64)
+            self.assertEqual(os.listdir(directory), [path])
+            np.testing.assert_array_equal(first_view, [[0, 1], [2, 3], [4, 5]])
+
+            buffer.extend(np.full((1, 2), 0.5))
+            self.assertEqual(buffer.dtype, np.float64)
+            self.assertEqual(buffer.view()[-1].tolist(), [0.5, 0.5])
+            self.assertEqual(len(os.listdir(directory)), 1)
+            self.assertNotEqual(os.listdir(directory), [path])
+            del first_view, buffer
+            self.assertEqual(os.listdir(directory), [])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -80,13 +80,13 @@ class TestFilesToDataset(unittest.TestCase):
         self.assertIsInstance(dataset, self.fake_torch_data.TensorDataset)
         self.assertEqual(len(dataset), 2)
 
-    @patch("torch.stack", side_effect=Exception("Tensor creation failed"))
+    @patch("torch.as_tensor", side_effect=Exception("Tensor creation failed"))
     @patch("definers.data.loaders._catch")
     @patch(
         "definers.data.loaders.load_as_numpy",
         return_value=np.array([1]),
     )
-    def test_tensor_creation_fails(self, mock_load, mock_catch, mock_stack):
+    def test_tensor_creation_fails(self, mock_load, mock_catch, mock_as_tensor):
         features_paths = ["feature.npy"]
         result = files_to_dataset(features_paths)
         self.assertIsNone(result)
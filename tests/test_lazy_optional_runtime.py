@@ -99,8 +99,15 @@ def test_ai_translate_bootstraps_translate_runtime(monkeypatch):
     )
     monkeypatch.setattr(
         translation,
-        "translate_text_segment",
-        lambda *args, **kwargs: "translated-text",
+        "segment_token_lengths",
+        lambda _tokenizer, texts: [len(text) for text in texts],
+    )
+    monkeypatch.setattr(
+        translation,
+        "translate_text_segments",
+        lambda _model, _tokenizer, texts, *args, **kwargs: [
+            "translated-text" for _text in texts
+        ],
     )
 
     def fake_init_pretrained_model(task):
@@ -0,0 +1,108 @@
+import threading
+import time
+
+import numpy as np
+
+from definers.data.lightweight_datasets import (
+    LightweightDataLoader,
+    LightweightSubset,
+    LightweightTensorDataset,
+)
+
+
+class _CountingArray(np.ndarray):
+    def __getitem__(self, index):
+        type(self).calls.append(index)
+        return np.asarray(super().__getitem__(index))
+
+
+def test_tensor_dataset_batches_gather_with_one_index_per_tensor():
+    features = np.arange(20, dtype=np.float32).reshape(10, 2)
+    labels = np.arange(10)
+    counting_features = features.view(_CountingArray)
+    _CountingArray.calls = []
+    loader = LightweightDataLoader(
+        LightweightTensorDataset(counting_features, labels),
+        batch_size=4,
+        shuffle=False,
+    )
+
+    batches = list(loader)
+
+    assert len(_CountingArray.calls) == len(batches) == len(loader) == 3
+    np.testing.assert_array_equal(batches[0][0], features[:4])
+    np.testing.assert_array_equal(batches[2][1], labels[8:])
+
+
+def test_shuffle_uses_a_permutation_of_every_row():
+    dataset = LightweightTensorDataset(np.arange(50), np.arange(50) * 2)
+    loader = LightweightDataLoader(
+        dataset,
+        batch_size=8,
+        generator=np.random.default_rng(3),
+    )
+
+    batches = list(loader)
+    seen = np.concatenate([batch[0] for batch in batches])
+
+    assert sorted(seen.tolist()) == list(range(50))
+    assert seen.tolist() != list(range(50))
+    for values, doubled in batches:
+        np.testing.assert_array_equal(doubled, values * 2)
+
+
+def test_subset_of_tensor_dataset_maps_indices():
+    dataset = LightweightTensorDataset(np.arange(10) * 10)
+    subset = LightweightSubset(dataset, [9, 3, 5, 1])
+
+    batches = list(LightweightDataLoader(subset, batch_size=3, shuffle=False))
+
+    np.testing.assert_array_equal(batches[0][0], [90, 30, 50])
+    np.testing.assert_array_equal(batches[1][0], [10])
+
+
+class _SlowRows:
+    def __init__(self, length):
+        self.length = length
+        self.threads = set()
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        self.threads.add(threading.get_ident())
+        time.sleep(0.01)
+        return (np.full(3, index), index)
+
+
+def test_worker_threads_prefetch_batches_in_order():
+    dataset = _SlowRows(24)
+    loader = LightweightDataLoader(
+        dataset,
+        batch_size=2,
+        shuffle=False,
+        num_workers=4,
+        drop_last=True,
+    )
+
+    batches = list(loader)
+
+    assert [batch[1].tolist() for batch in batches] == [
+        [index, index + 1] for index in range(0, 24, 2)
+    ]
+    assert batches[0][0].shape == (2, 3)
+    assert threading.get_ident() not in dataset.threads
+    assert len(dataset.threads) > 1
+
+
+def test_abandoned_prefetching_iterator_stops_workers():
+    loader = LightweightDataLoader(
+        _SlowRows(40), batch_size=1, shuffle=False, num_workers=2
+    )
+    threads_before = set(threading.enumerate())
+    iterator = iter(loader)
+
+    next(iterator)
+    iterator.close()
+
+    assert set(threading.enumerate()) <= threads_before
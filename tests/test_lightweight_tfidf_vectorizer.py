@@ -0,0 +1,72 @@
+import unittest
+
+import numpy as np
+
+from definers.data.text.vectorizer import (
+    DenseFeatureMatrix,
+    LightweightTfidfVectorizer,
+    create_text_vectorizer,
+)
+from definers.data.vectorizers import vectorize
+
+
+class TestLightweightTfidfVectorizer(unittest.TestCase):
+    def setUp(self):
+        self.texts = ["alpha beta beta", "beta gamma", ""]
+
+    def test_transform_returns_normalized_csr_rows(self):
+        from scipy import sparse
+
+        vectorizer = LightweightTfidfVectorizer().fit(self.texts)
+
+        matrix = vectorizer.transform(self.texts + ["alpha unseen"])
+        csr = matrix.tocsr()
+        dense = matrix.toarray()
+
+        self.assertTrue(matrix.is_sparse)
+        self.assertIsInstance(csr, sparse.csr_matrix)
+        self.assertEqual(
+            vectorizer.vocabulary_, {"alpha": 0, "beta": 1, "gamma": 2}
+        )
+        self.assertEqual(csr.nnz, 5)
+        self.assertEqual(dense.dtype, np.float32)
+        np.testing.assert_allclose(
+            np.linalg.norm(dense, axis=1), [1.0, 1.0, 0.0, 1.0], rtol=1e-6
+        )
+        idf = np.log(4.0 / np.array([2.0, 3.0, 2.0])) + 1.0
+        expected = np.array([1.0, 2.0, 0.0]) * idf
+        np.testing.assert_allclose(
+            dense[0], expected / np.linalg.norm(expected), rtol=1e-6
+        )
+        np.testing.assert_array_equal(dense[3], [1.0, 0.0, 0.0])
+
+    def test_hashing_mode_has_fixed_width_without_vocabulary(self):
+        vectorizer = create_text_vectorizer(n_features=16).fit(self.texts)
+
+        matrix = vectorizer.transform(["beta delta", "beta"])
+
+        self.assertEqual(vectorizer.vocabulary_, {})
+        self.assertEqual(matrix.shape, (2, 16))
+        self.assertEqual(vectorize(vectorizer, []).shape, (0, 16))
+        np.testing.assert_allclose(
+            np.linalg.norm(matrix.toarray(), axis=1), [1.0, 1.0], rtol=1e-6
+        )
+        with self.assertRaises(ValueError):
+            vectorizer.get_feature_names_out()
+        with self.assertRaises(ValueError):
+            LightweightTfidfVectorizer(n_features=0)
+
+    def test_dense_feature_matrix_keeps_dense_values(self):
+        matrix = DenseFeatureMatrix([[0.0, 1.5]])
+
+        self.assertFalse(matrix.is_sparse)
+        self.assertEqual(matrix.tocsr().nnz, 1)
+        np.testing.assert_array_equal(matrix.toarray(), [[0.0, 1.5]])
+
+    def test_transform_requires_fit(self):
+        with self.assertRaises(ValueError):
+            LightweightTfidfVectorizer().transform(["alpha"])
+
+
+if __name__ == "__main__":
+    unittest.main()
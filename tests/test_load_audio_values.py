@@ -28,7 +28,7 @@ def test_load_audio_values_cleans_temp_files_after_failure():
         ),
         patch.object(
             definers,
-            "extract_audio_features",
+            "extract_audio_features_batch",
             side_effect=RuntimeError("boom"),
             create=True,
         ),
@@ -0,0 +1,146 @@
+import os
+
+import numpy as np
+
+from definers.data import loaders
+
+
+def _load_text_length(path, training=False):
+    with open(path, encoding="utf-8") as handle:
+        text = handle.read()
+    if text == "bad":
+        return None
+    return [np.full(len(text), os.getpid()), np.array([training])]
+
+
+def test_load_many_as_numpy_preserves_order_and_reuses_cache(
+    tmp_path, monkeypatch
+):
+    calls = []
+
+    def load_as_numpy(path, training=False):
+        calls.append(os.path.basename(path))
+        return _load_text_length(path, training)
+
+    monkeypatch.setattr(loaders, "load_as_numpy", load_as_numpy)
+    paths = []
+    for index, text in enumerate(["a", "bbb", "bad", "cc"]):
+        path = tmp_path / f"sample_{index}.txt"
+        path.write_text(text, encoding="utf-8")
+        paths.append(str(path))
+    cache_dir = str(tmp_path / "cache")
+
+    first = loaders.load_many_as_numpy(
+        paths, training=True, cache_dir=cache_dir
+    )
+    second = loaders.load_many_as_numpy(
+        paths, training=True, cache_dir=cache_dir
+    )
+    (tmp_path / "sample_3.txt").write_text("ccccc", encoding="utf-8")
+    third = loaders.load_many_as_numpy(
+        paths, training=True, cache_dir=cache_dir
+    )
+
+    assert [None if value is None else value[0].size for value in first] == [
+        1,
+        3,
+        None,
+        2,
+    ]
+    assert [None if value is None else value[0].size for value in second] == [
+        1,
+        3,
+        None,
+        2,
+    ]
+    assert third[3][0].size == 5
+    assert calls == [
+        "sample_0.txt",
+        "sample_1.txt",
+        "sample_2.txt",
+        "sample_3.txt",
+        "sample_2.txt",
+        "sample_2.txt",
+        "sample_3.txt",
+    ]
+
+
+def test_load_many_as_numpy_fans_out_to_worker_processes(tmp_path, monkeypatch):
+    monkeypatch.setattr(loaders, "load_as_numpy", _load_text_length)
+    paths = []
+    for index in range(6):
+        path = tmp_path / f"row_{index}.txt"
+        path.write_text("x" * (index + 1), encoding="utf-8")
+        paths.append(str(path))
+
+    loaded = loaders.load_many_as_numpy(
+        paths, training=True, max_workers=2, use_cache=False
+    )
+
+    assert [value[0].size for value in loaded] == [1, 2, 3, 4, 5, 6]
+    assert all(int(value[0][0]) != os.getpid() for value in loaded)
+
+
+def test_feature_cache_evicts_least_recently_used_entries_by_size(
+    tmp_path, monkeypatch
+):
+    from definers.data.feature_cache import (
+        DEFAULT_FEATURE_CACHE_MAX_BYTES,
+        FeatureCache,
+        feature_cache_max_bytes,
+    )
+
+    cache = FeatureCache(str(tmp_path), max_bytes=0)
+    keys = [f"{index:02d}" * 32 for index in range(3)]
+    for key in keys:
+        cache.store(key, np.zeros(256, dtype=np.float32))
+    assert list(tmp_path.glob("*/*.npz")) == []
+
+    cache.max_bytes = 1 << 20
+    for age, key in enumerate(keys):
+        cache.store(key, np.zeros(256, dtype=np.float32))
+        os.utime(cache._entry_path(key), (age + 1, age + 1))
+    entry_size = os.path.getsize(cache._entry_path(keys[0]))
+    assert cache.load(keys[0]) is not None
+
+    removed = cache.evict(entry_size * 2)
+
+    assert removed == entry_size
+    assert cache.load(keys[1]) is None
+    assert cache.load(keys[0]) is not None
+    assert cache.load(keys[2]) is not None
+
+    monkeypatch.setenv("DEFINERS_FEATURE_CACHE_MAX_BYTES", "1e6")
+    assert feature_cache_max_bytes() == 1000000
+    monkeypatch.setenv("DEFINERS_FEATURE_CACHE_MAX_BYTES", "lots")
+    assert feature_cache_max_bytes() == DEFAULT_FEATURE_CACHE_MAX_BYTES
+
+
+def test_feature_cache_only_rescans_when_the_running_total_overflows(
+    tmp_path,
+):
+    from unittest.mock import patch
+
+    from definers.data.feature_cache import FeatureCache
+
+    cache = FeatureCache(str(tmp_path), max_bytes=1 << 20)
+    keys = [f"{index:02d}" * 32 for index in range(20)]
+
+    with patch.object(
+        FeatureCache, "evict", autospec=True, side_effect=FeatureCache.evict
+    ) as evict:
+        for key in keys[:10]:
+            cache.store(key, np.zeros(256, dtype=np.float32))
+        assert evict.call_count == 1
+        entry_size = os.path.getsize(cache._entry_path(keys[0]))
+        cache.store(keys[0], np.ones(256, dtype=np.float32))
+        assert evict.call_count == 1
+        assert cache._cached_bytes == entry_size * 10
+
+        cache.max_bytes = entry_size * 12
+        for key in keys[10:]:
+            cache.store(key, np.zeros(256, dtype=np.float32))
+
+    assert evict.call_count == 4
+    assert len(list(tmp_path.glob("*/*.npz"))) == 11
+    assert cache._cached_bytes == entry_size * 11
@@ -0,0 +1,94 @@
+import os
+import time
+import unittest
+
+import numpy as np
+import pytest
+
+from definers.data.arrays import pack_ragged, pad_nested, reshape_numpy
+
+
+def _mixed_length_rows():
+    rng = np.random.default_rng(0)
+    return [
+        rng.standard_normal(size).astype(np.float32)
+        for size in rng.integers(1, 65, 100_000)
+    ]
+
+
+class TestPackRagged(unittest.TestCase):
+    def test_pads_flat_rows_with_fill_value_and_dtype(self):
+        packed = pack_ragged(
+            [np.arange(2), np.arange(3)],
+            [3, 4],
+            fill_value=-1,
+            dtype=np.float32,
+        )
+
+        self.assertEqual(packed.dtype, np.float32)
+        np.testing.assert_array_equal(
+            packed,
+            [[0, 1, -1, -1], [0, 1, 2, -1], [-1, -1, -1, -1]],
+        )
+
+    def test_pads_nested_lists_like_pad_nested(self):
+        nested = [[[1], [2, 3]], [[4, 5, 6]]]
+
+        packed = pack_ragged(nested)
+
+        np.testing.assert_array_equal(
+            packed, np.array(pad_nested(nested, [2, 2, 3]))
+        )
+
+    def test_pads_rows_sharing_trailing_shape(self):
+        rows = [np.ones((1, 2)), np.full((3, 2), 2.0)]
+
+        packed = pack_ragged(rows, [2, 3, 3])
+
+        self.assertEqual(packed.shape, (2, 3, 3))
+        np.testing.assert_array_equal(packed[0, 0], [1.0, 1.0, 0.0])
+        np.testing.assert_array_equal(packed[1, :, :2], rows[1])
+        self.assertEqual(float(packed[:, :, 2].sum()), 0.0)
+
+    def test_reshape_numpy_pads_dense_array_and_ignores_extra_lengths(self):
+        np.testing.assert_array_equal(
+            reshape_numpy(np.array([1, 2, 3]), lengths=[5, 2]),
+            [1, 2, 3, 0, 0],
+        )
+        self.assertEqual(reshape_numpy([]).size, 0)
+
+    def test_packs_100k_mixed_length_rows(self):
+        rows = _mixed_length_rows()
+
+        packed = pack_ragged(rows)
+
+        self.assertEqual(packed.shape, (100_000, 64))
+        self.assertEqual(packed.dtype, np.float32)
+        for index in (0, 7, 99_999):
+            np.testing.assert_array_equal(
+                packed[index, : rows[index].size], rows[index]
+            )
+            self.assertEqual(
+                float(np.abs(packed[index, rows[index].size :]).sum()), 0.0
+            )
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(
+    os.environ.get("DEFINERS_RUN_BENCHMARKS") != "1",
+    reason="set DEFINERS_RUN_BENCHMARKS=1 to run benchmarks",
+)
+def test_benchmark_packs_100k_mixed_length_rows(record_property):
+    rows = _mixed_length_rows()
+
+    started = time.perf_counter()
+    packed = pack_ragged(rows)
+    elapsed = time.perf_counter() - started
+
+    assert packed.shape == (100_000, 64)
+    record_property("pack_seconds", elapsed)
+    print(f"pack_ragged 100k rows: {elapsed:.3f} s")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -78,6 +78,13 @@ class TestPredictAudio(unittest.TestCase):
             "features_to_audio",
             return_value=np.random.randn(self.sr),
         )
+        self.patcher_signal_features = patch.object(
+            audio_features_module,
+            "extract_signal_features",
+            side_effect=lambda signals, sr: [
+                np.full(8, signal.size, dtype=np.float32) for signal in signals
+            ],
+        )
         self.patcher_tmp = patch.object(
             audio_features_module,
             "tmp",
@@ -92,6 +99,7 @@ class TestPredictAudio(unittest.TestCase):
             self.patcher_model_introspection_backend.start()
         )
         self.mock_features_to_audio = self.patcher_features_to_audio.start()
+        self.mock_signal_features = self.patcher_signal_features.start()
         self.mock_tmp = self.patcher_tmp.start()
 
     def tearDown(self):
@@ -101,6 +109,7 @@ class TestPredictAudio(unittest.TestCase):
         self.patcher_array_backend.stop()
         self.patcher_model_introspection_backend.stop()
         self.patcher_features_to_audio.stop()
+        self.patcher_signal_features.stop()
         self.patcher_tmp.stop()
         if os.path.exists(self.test_dir):
             import shutil
@@ -117,7 +126,14 @@ class TestPredictAudio(unittest.TestCase):
         self.mock_audio_analysis_backend.get_active_audio_timeline.assert_called_once_with(
             self.audio_path
         )
-        self.mock_model.predict.assert_called()
+        self.mock_signal_features.assert_called_once()
+        (segments, sample_rate) = self.mock_signal_features.call_args.args
+        self.assertEqual(sample_rate, self.sr)
+        self.assertEqual([segment.size for segment in segments], [self.sr])
+        model_input = self.mock_model.predict.call_args.args[0]
+        np.testing.assert_array_equal(
+            model_input, np.full(8, self.sr, dtype=np.float32)
+        )
         self.mock_array_backend.numpy_to_cupy.assert_called()
         self.mock_features_to_audio.assert_called()
 
@@ -152,6 +168,12 @@ class TestPredictAudio(unittest.TestCase):
         self.assertTrue(os.path.exists(result_path))
         self.mock_model.predict.assert_not_called()
 
+    def test_segment_without_features_is_skipped(self):
+        self.mock_signal_features.side_effect = lambda signals, sr: [None]
+        result_path = predict_audio(self.mock_model, self.audio_path)
+        self.assertIsNotNone(result_path)
+        self.mock_model.predict.assert_not_called()
+
     def test_features_to_audio_fails(self):
         self.mock_features_to_audio.return_value = None
         result_path = predict_audio(self.mock_model, self.audio_path)
@@ -0,0 +1,116 @@
+from pathlib import Path
+
+import pytest
+
+import definers.audio.stems as STEMS_MODULE
+from definers.audio.separator_pool import (
+    DEFAULT_SEPARATOR_POOL,
+    SeparatorPool,
+    separator_pool_key,
+)
+
+
+class _ModelInstance:
+    def __init__(self, output_dir):
+        self.output_dir = output_dir
+
+
+def _fake_separator_class(loaded_models):
+    class FakeSeparator:
+        def __init__(self, **kwargs):
+            self.output_dir = kwargs["output_dir"]
+            self.model_instance = None
+
+        def load_model(self, model_filename):
+            loaded_models.append(model_filename)
+            self.model_instance = _ModelInstance(self.output_dir)
+
+        def separate(self, input_path):
+            output_path = (
+                Path(self.model_instance.output_dir)
+                / f"{Path(input_path).stem}_(Vocals)_model.wav"
+            )
+            output_path.write_text("stem")
+            return [output_path.name]
+
+    return FakeSeparator
+
+
+def test_consecutive_stages_reuse_the_loaded_separator(tmp_path, monkeypatch):
+    loaded_models = []
+    fake_class = _fake_separator_class(loaded_models)
+    monkeypatch.setattr(
+        STEMS_MODULE, "_load_audio_separator_class", lambda: fake_class
+    )
+    monkeypatch.setattr(
+        STEMS_MODULE,
+        "_download_runtime_stage_models",
+        lambda model_candidates: tuple(model_candidates),
+    )
+    monkeypatch.setattr(
+        STEMS_MODULE, "_has_local_stem_model", lambda model_name: True
+    )
+    stage = STEMS_MODULE.SeparatorModelStage(
+        model_candidates=("vocals.ckpt",),
+        preferred_stems=("vocals",),
+        required=True,
+    )
+    DEFAULT_SEPARATOR_POOL.clear()
+
+    outputs = [
+        STEMS_MODULE._run_separator_stage(
+            f"song-{index}.wav", stage, str(tmp_path / f"stage-{index}"), 44100
+        )
+        for index in range(3)
+    ]
+    STEMS_MODULE._run_separator_stage(
+        "song-3.wav", stage, str(tmp_path / "stage-3"), 44100, shifts=5
+    )
+
+    assert loaded_models == ["vocals.ckpt", "vocals.ckpt"]
+    for index, (model_name, output_files) in enumerate(outputs):
+        assert model_name == "vocals.ckpt"
+        assert output_files == (
+            str(
+                tmp_path / f"stage-{index}" / f"song-{index}_(Vocals)_model.wav"
+            ),
+        )
+    assert len(DEFAULT_SEPARATOR_POOL) == 2
+    DEFAULT_SEPARATOR_POOL.clear()
+
+
+def test_separator_pool_evicts_least_recently_used_models(tmp_path):
+    loaded_models = []
+    separator_class = _fake_separator_class(loaded_models)
+    pool = SeparatorPool(max_resident=2)
+
+    def use(model_name):
+        with pool.lease(
+            separator_class, model_name, {"output_dir": str(tmp_path)}
+        ) as separator:
+            return separator
+
+    first = use("a.ckpt")
+    use("b.ckpt")
+    assert use("a.ckpt") is first
+    use("c.ckpt")
+    use("b.ckpt")
+
+    assert loaded_models == ["a.ckpt", "b.ckpt", "c.ckpt", "b.ckpt"]
+    assert len(pool) == 2
+
+
+def test_separator_pool_discards_separators_that_fail(tmp_path):
+    loaded_models = []
+    separator_class = _fake_separator_class(loaded_models)
+    pool = SeparatorPool()
+    options = {"output_dir": str(tmp_path), "demucs_params": {"shifts": 2}}
+
+    with pytest.raises(RuntimeError):
+        with pool.lease(separator_class, "a.ckpt", options):
+            raise RuntimeError("separation failed")
+
+    assert len(pool) == 0
+    assert separator_pool_key(
+        separator_class, "a.ckpt", {**options, "output_dir": "elsewhere"}
+    ) == separator_pool_key(separator_class, "a.ckpt", options)
@@ -0,0 +1,162 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import definers.audio.stems as STEMS_MODULE
+from definers.audio.stem_cache import (
+    evict_stem_cache,
+    stem_cache_key,
+    stem_cache_root,
+)
+
+
+@pytest.fixture
+def isolated_output_root(tmp_path, monkeypatch):
+    monkeypatch.setenv("DEFINERS_GUI_OUTPUT_ROOT", str(tmp_path / "gui"))
+    return tmp_path
+
+
+def _fake_plan():
+    stage = STEMS_MODULE.SeparatorModelStage(
+        model_candidates=("four.ckpt",),
+        preferred_stems=("drums",),
+    )
+    return STEMS_MODULE.MasteringSeparatorPlan(
+        target_sample_rate=44100,
+        quality_flags=("noisy",),
+        preprocess_stages=(),
+        vocal_pair_stage=None,
+        reference_split_stage=stage,
+        four_stem_stage=stage,
+        vocal_stage=stage,
+        vocal_restoration_stage=None,
+        instrumental_cleanup_stage=None,
+    )
+
+
+def _patch_pipeline(monkeypatch):
+    pipeline_runs = []
+
+    def run_pipeline(audio_path, output_root, plan, shifts=2):
+        pipeline_runs.append(shifts)
+        final_dir = Path(output_root) / "final"
+        final_dir.mkdir(parents=True, exist_ok=True)
+        written_paths = {}
+        for stem_name in ("vocals", "drums"):
+            stem_path = final_dir / f"{stem_name}.wav"
+            stem_path.write_bytes(f"{stem_name}-{shifts}".encode() * 64)
+            written_paths[stem_name] = str(stem_path)
+        STEMS_MODULE._register_stem_separation_provenance(
+            output_root,
+            written_paths,
+            quality_flags=plan.quality_flags,
+            source_dereverb_applied=True,
+            source_denoise_applied=False,
+            vocal_restoration_applied=True,
+            instrumental_cleanup_applied={"drums": False},
+        )
+        return written_paths
+
+    monkeypatch.setattr(
+        STEMS_MODULE,
+        "read_audio",
+        lambda audio_path: (44100, np.zeros((2, 32), dtype=np.float32)),
+    )
+    monkeypatch.setattr(
+        STEMS_MODULE,
+        "build_mastering_separator_plan",
+        lambda *args, **kwargs: _fake_plan(),
+    )
+    monkeypatch.setattr(
+        STEMS_MODULE, "_prefetch_mastering_plan_models", lambda plan: ()
+    )
+    monkeypatch.setattr(
+        STEMS_MODULE, "_run_mastering_separator_pipeline", run_pipeline
+    )
+    return pipeline_runs
+
+
+def test_repeated_separation_of_same_upload_is_served_from_cache(
+    isolated_output_root, monkeypatch
+):
+    pipeline_runs = _patch_pipeline(monkeypatch)
+    song_path = isolated_output_root / "song.wav"
+    song_path.write_bytes(b"RIFF-song")
+
+    first_paths, _first_dir = STEMS_MODULE.separate_stem_layers(
+        str(song_path), output_dir=str(isolated_output_root / "job-1")
+    )
+    second_paths, second_dir = STEMS_MODULE.separate_stem_layers(
+        str(song_path), output_dir=str(isolated_output_root / "job-2")
+    )
+
+    assert pipeline_runs == [2]
+    assert second_paths == {
+        "vocals": str(isolated_output_root / "job-2" / "final" / "vocals.wav"),
+        "drums": str(isolated_output_root / "job-2" / "final" / "drums.wav"),
+    }
+    for stem_name, stem_path in second_paths.items():
+        assert (
+            Path(stem_path).read_bytes()
+            == Path(first_paths[stem_name]).read_bytes()
+        )
+        assert STEMS_MODULE.get_stem_separation_provenance(
+            stem_path
+        ) == STEMS_MODULE.get_stem_separation_provenance(first_paths[stem_name])
+    vocals_provenance = STEMS_MODULE.get_stem_separation_provenance(
+        output_dir=second_dir, stem_name="vocals"
+    )
+    assert vocals_provenance["quality_flags"] == ("noisy",)
+    assert vocals_provenance["vocal_restoration_applied"] is True
+
+    STEMS_MODULE.separate_stem_layers(
+        str(song_path),
+        shifts=4,
+        output_dir=str(isolated_output_root / "job-3"),
+    )
+    song_path.write_bytes(b"RIFF-edited")
+    STEMS_MODULE.separate_stem_layers(
+        str(song_path), output_dir=str(isolated_output_root / "job-4")
+    )
+    STEMS_MODULE.separate_stem_layers(
+        str(song_path),
+        output_dir=str(isolated_output_root / "job-5"),
+        use_cache=False,
+    )
+
+    assert pipeline_runs == [2, 4, 2, 2]
+
+
+def test_stem_cache_evicts_least_recently_used_entries_by_size(
+    isolated_output_root, monkeypatch
+):
+    _patch_pipeline(monkeypatch)
+    songs = []
+    for index in range(3):
+        song_path = isolated_output_root / f"song-{index}.wav"
+        song_path.write_bytes(f"RIFF-{index}".encode())
+        songs.append(str(song_path))
+        STEMS_MODULE.separate_stem_layers(
+            str(song_path),
+            output_dir=str(isolated_output_root / f"job-{index}"),
+        )
+    cache_root = Path(stem_cache_root())
+    entry_sizes = [
+        sum(path.stat().st_size for path in entry.iterdir())
+        for entry in cache_root.iterdir()
+    ]
+    first_key = stem_cache_key(
+        songs[0], pipeline="mastering", plan=_fake_plan(), shifts=2
+    )
+    manifest_path = cache_root / first_key / "manifest.json"
+    os.utime(manifest_path, (1, 1))
+
+    removed = evict_stem_cache(max(entry_sizes) * 2)
+
+    assert removed > 0
+    assert sorted(entry.name for entry in cache_root.iterdir()) == sorted(
+        stem_cache_key(song, pipeline="mastering", plan=_fake_plan(), shifts=2)
+        for song in songs[1:]
+    )
@@ -0,0 +1,176 @@
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import definers.audio.stems as STEMS_MODULE
+
+
+def _plan():
+    def stage(*stems, required=True):
+        return STEMS_MODULE.SeparatorModelStage(
+            model_candidates=("model.ckpt",),
+            preferred_stems=stems,
+            required=required,
+        )
+
+    return STEMS_MODULE.MasteringSeparatorPlan(
+        target_sample_rate=44100,
+        quality_flags=(),
+        preprocess_stages=(stage("dry", required=False),),
+        vocal_pair_stage=None,
+        reference_split_stage=stage("other", required=False),
+        four_stem_stage=stage("drums", "bass", "other"),
+        vocal_stage=stage("vocals"),
+        vocal_restoration_stage=stage("vocals", required=False),
+        instrumental_cleanup_stage=stage("no bleed", required=False),
+    )
+
+
+@pytest.fixture
+def fake_audio_io(tmp_path, monkeypatch):
+    signals = {}
+    reads = Counter()
+    stage_dirs = []
+
+    def save_audio(destination_path, audio_signal, sample_rate, **kwargs):
+        Path(destination_path).parent.mkdir(parents=True, exist_ok=True)
+        Path(destination_path).write_bytes(b"wav")
+        signals[str(destination_path)] = np.asarray(audio_signal)
+        return str(destination_path)
+
+    def read_audio(audio_path):
+        reads[Path(audio_path).name] += 1
+        return 44100, signals[str(audio_path)]
+
+    def write_stage_output(output_dir, name, source_path):
+        output_path = Path(output_dir) / name
+        save_audio(output_path, signals[str(source_path)] * 0.9, 44100)
+        return str(output_path)
+
+    def apply_stage(
+        source_path,
+        stage,
+        stage_name,
+        output_root,
+        target_sample_rate,
+        shifts=2,
+    ):
+        stage_dirs.append(Path(output_root) / stage_name)
+        return write_stage_output(
+            Path(output_root) / stage_name, f"{stage_name}.wav", source_path
+        )
+
+    def run_stage(input_path, stage, output_dir, target_sample_rate, shifts=2):
+        stage_dirs.append(Path(output_dir))
+        return "model.ckpt", tuple(
+            write_stage_output(output_dir, f"mix_({stem}).wav", input_path)
+            for stem in ("Drums", "Bass", "Other")
+        )
+
+    def run_stage_batch(
+        input_paths, stage, output_dir, target_sample_rate, shifts=2
+    ):
+        stage_dirs.append(Path(output_dir))
+        return {
+            stem_name: write_stage_output(
+                output_dir, f"{stem_name}_clean.wav", source_path
+            )
+            for stem_name, source_path in input_paths.items()
+        }
+
+    song_path = tmp_path / "song.wav"
+    song_path.write_bytes(b"wav")
+    signals[str(song_path)] = (
+        np.random.default_rng(0).normal(0.0, 0.1, (2, 4096)).astype(np.float32)
+    )
+    monkeypatch.setattr(STEMS_MODULE, "read_audio", read_audio)
+    monkeypatch.setattr(STEMS_MODULE, "save_audio", save_audio)
+    monkeypatch.setattr(
+        STEMS_MODULE, "_apply_stage_to_single_output", apply_stage
+    )
+    monkeypatch.setattr(STEMS_MODULE, "_run_separator_stage", run_stage)
+    monkeypatch.setattr(
+        STEMS_MODULE, "_run_separator_stage_batch", run_stage_batch
+    )
+    return str(song_path), reads, stage_dirs
+
+
+@pytest.mark.parametrize("stage_handoff", ["memory", "disk"])
+def test_stage_handoff_modes_write_identical_stems(
+    fake_audio_io, tmp_path, monkeypatch, stage_handoff
+):
+    (song_path, reads, stage_dirs) = fake_audio_io
+    output_root = tmp_path / stage_handoff
+    scratch_dir = tmp_path / "scratch"
+    monkeypatch.setattr(
+        STEMS_MODULE,
+        "_create_stage_scratch_dir",
+        lambda output_root: str(scratch_dir),
+    )
+
+    written_paths = STEMS_MODULE._run_mastering_separator_pipeline(
+        song_path,
+        str(output_root),
+        _plan(),
+        stage_handoff=stage_handoff,
+    )
+
+    assert sorted(written_paths) == ["bass", "drums", "other", "vocals"]
+    assert all(
+        Path(path).parent == output_root / "final"
+        for path in written_paths.values()
+    )
+    stage_files = Counter(
+        {name: count for name, count in reads.items() if name != "song.wav"}
+    )
+    if stage_handoff == "memory":
+        assert set(stage_files.values()) == {1}
+        assert "prepared_input.wav" not in stage_files
+        assert all(scratch_dir in stage_dir.parents for stage_dir in stage_dirs)
+        assert not scratch_dir.exists()
+    else:
+        assert max(stage_files.values()) > 1
+        assert all(output_root in stage_dir.parents for stage_dir in stage_dirs)
+
+
+def test_memory_handoff_without_scratch_space_stages_under_output_root(
+    fake_audio_io, tmp_path, monkeypatch
+):
+    (song_path, reads, stage_dirs) = fake_audio_io
+    output_root = tmp_path / "memory"
+    monkeypatch.setenv(
+        "DEFINERS_STAGE_SCRATCH_DIR", str(tmp_path / "missing-scratch")
+    )
+
+    written_paths = STEMS_MODULE._run_mastering_separator_pipeline(
+        song_path, str(output_root), _plan(), stage_handoff="memory"
+    )
+
+    assert sorted(written_paths) == ["bass", "drums", "other", "vocals"]
+    assert all(Path(path).exists() for path in written_paths.values())
+    stage_files = Counter(
+        {name: count for name, count in reads.items() if name != "song.wav"}
+    )
+    assert set(stage_files.values()) == {1}
+    assert all(output_root in stage_dir.parents for stage_dir in stage_dirs)
+    assert not any(stage_dir.exists() for stage_dir in stage_dirs)
+    assert sorted(path.name for path in output_root.iterdir()) == ["final"]
+
+
+def test_stage_scratch_root_is_configurable(monkeypatch, tmp_path):
+    monkeypatch.setenv("DEFINERS_STAGE_SCRATCH_DIR", str(tmp_path))
+    monkeypatch.setattr(STEMS_MODULE, "_STAGE_SCRATCH_MIN_FREE_BYTES", 0)
+
+    scratch_dir = STEMS_MODULE._create_stage_scratch_dir(str(tmp_path / "out"))
+
+    assert STEMS_MODULE.stage_scratch_root() == str(tmp_path)
+    assert Path(scratch_dir).parent == tmp_path
+
+
+def test_unknown_stage_handoff_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="stage handoff"):
+        STEMS_MODULE._run_mastering_separator_pipeline(
+            "song.wav", str(tmp_path), _plan(), stage_handoff="network"
+        )
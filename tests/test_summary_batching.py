@@ -0,0 +1,136 @@
+import os
+import time
+
+import pytest
+
+from definers.constants import MODELS, TOKENIZERS
+from definers.ml.text import generation
+
+
+class _Tensor(list):
+    def to(self, _device):
+        return self
+
+
+class _SummaryTokenizer:
+    def __call__(self, texts, return_tensors=None, padding=False, **_kwargs):
+        if isinstance(texts, str):
+            texts = [texts]
+        rows = [text.split()[1:] for text in texts]
+        width = max(len(row) for row in rows)
+        return {
+            "input_ids": _Tensor(
+                row + ["<pad>"] * (width - len(row)) for row in rows
+            ),
+            "attention_mask": _Tensor(
+                [1] * len(row) + [0] * (width - len(row)) for row in rows
+            ),
+        }
+
+    def decode(self, row, skip_special_tokens=True):
+        return " ".join(token for token in row if token != "<pad>")
+
+    def batch_decode(self, rows, skip_special_tokens=True):
+        return [self.decode(row, skip_special_tokens) for row in rows]
+
+
+class _HalvingModel:
+    def __init__(self, latency=0.0):
+        self.calls = []
+        self.latency = latency
+
+    def generate(self, input_ids, attention_mask, **kwargs):
+        assert kwargs["num_beams"] > 1
+        self.calls.append(len(input_ids))
+        time.sleep(self.latency)
+        return [
+            [token for token in row if token != "<pad>"][::5]
+            for row in input_ids
+        ]
+
+
+@pytest.fixture
+def summary_runtime(monkeypatch):
+    model = _HalvingModel()
+    monkeypatch.setitem(MODELS, "summary", model)
+    monkeypatch.setitem(TOKENIZERS, "summary", _SummaryTokenizer())
+    monkeypatch.setattr("definers.cuda.device", lambda: "cpu")
+    monkeypatch.setattr(
+        "definers.system.download_activity.report_download_activity",
+        lambda *args, **kwargs: None,
+    )
+    generation.clear_summary_cache()
+    yield model
+    generation.clear_summary_cache()
+
+
+def _document(word_count):
+    return " ".join(f"w{index}" for index in range(word_count))
+
+
+def test_map_phase_runs_chunks_in_padded_batches(summary_runtime):
+    texts = [_document(60), _document(12), _document(60), _document(30)]
+
+    summaries = generation.summarize_batch(texts, batch_size=2)
+
+    assert summary_runtime.calls == [2, 1]
+    assert (
+        summaries[0]
+        == summaries[2]
+        == " ".join(f"w{index}" for index in range(0, 60, 5))
+    )
+    assert summaries[1] == "w0 w5 w10"
+
+
+def test_repeated_documents_reuse_memoized_chunks(summary_runtime):
+    document = _document(600)
+
+    first = generation.map_reduce_summary(document, 20)
+    calls_after_first = len(summary_runtime.calls)
+    second = generation.map_reduce_summary(document, 20)
+
+    assert first == second
+    assert calls_after_first > 0
+    assert len(summary_runtime.calls) == calls_after_first
+    assert max(summary_runtime.calls) == generation.SUMMARY_BATCH_SIZE
+
+
+def test_memoized_summaries_are_dropped_when_the_model_changes(
+    summary_runtime, monkeypatch
+):
+    generation.summarize_batch([_document(20)])
+    replacement = _HalvingModel()
+    monkeypatch.setitem(MODELS, "summary", replacement)
+
+    generation.summarize_batch([_document(20)])
+
+    assert replacement.calls == [1]
+
+
+def test_map_reduce_batches_far_fewer_calls_than_chunks(summary_runtime):
+    document = _document(6000)
+
+    generation.map_reduce_summary(document, 40)
+
+    chunk_count = len(list(generation.summary_chunks(document, 60, 10)))
+    assert len(summary_runtime.calls) < chunk_count / 2
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(
+    os.environ.get("DEFINERS_RUN_BENCHMARKS") != "1",
+    reason="set DEFINERS_RUN_BENCHMARKS=1 to run benchmarks",
+)
+def test_benchmark_map_reduce_words_per_second(
+    summary_runtime, record_property
+):
+    summary_runtime.latency = 0.02
+    document = _document(6000)
+
+    started = time.perf_counter()
+    generation.map_reduce_summary(document, 40)
+    elapsed = time.perf_counter() - started
+    words_per_second = 6000 / elapsed
+
+    record_property("words_per_second", words_per_second)
+    print(f"map_reduce_summary: {words_per_second:.0f} words/s")
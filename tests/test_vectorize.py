@@ -4,6 +4,8 @@ import numpy as np
 
 from definers.data.vectorizers import (
     create_vectorizer,
+    dense_row_batches,
+    is_sparse_rows,
     vectorize,
 )
 
@@ -13,7 +15,7 @@ class TestVectorize(unittest.TestCase):
         texts = ["hello world", "hello definers"]
         vectorizer = create_vectorizer(texts)
         vectorized_data = vectorize(vectorizer, texts)
-        self.assertIsInstance(vectorized_data, np.ndarray)
+        self.assertTrue(is_sparse_rows(vectorized_data))
         self.assertEqual(vectorized_data.shape, (2, 3))
 
     def test_vectorize_single_text(self):
@@ -40,6 +42,29 @@ class TestVectorize(unittest.TestCase):
         vectorized_data = vectorize(vectorizer, texts)
         self.assertEqual(vectorized_data.shape, (2, 3))
 
+    def test_vectorize_hashed_rows_stay_sparse(self):
+        texts = ["hello world", "hello definers"]
+        vectorizer = create_vectorizer(texts, n_features=1 << 20)
+        vectorized_data = vectorize(vectorizer, texts)
+        self.assertTrue(is_sparse_rows(vectorized_data))
+        self.assertEqual(vectorized_data.shape, (2, 1 << 20))
+        self.assertEqual(vectorized_data.nnz, 4)
+
+    def test_dense_row_batches_densify_one_batch_at_a_time(self):
+        texts = ["alpha", "bravo", "charlie", "delta", "echo"]
+        vectorizer = create_vectorizer(texts)
+        vectorized_data = vectorize(vectorizer, texts)
+        batches = list(dense_row_batches(vectorized_data, 2))
+        self.assertEqual([start for start, _rows in batches], [0, 2, 4])
+        self.assertEqual(
+            [rows.shape for _start, rows in batches],
+            [(2, 5), (2, 5), (1, 5)],
+        )
+        np.testing.assert_allclose(
+            np.concatenate([rows for _start, rows in batches]),
+            vectorized_data.toarray(),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()